@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Callable, Dict, Optional
+from app.core.collections import CollectionName
+from app.core.streaming import ndjson_response
+from app.repositories.base import BaseRepository, DEFAULT_BATCH_SIZE
+from app.repositories.conversation import ConversationRepository
+from app.schemas.user_schema import UserData
+from app.api.auth.jwt import get_admin_user
+from app.api.deps import (
+    get_user_profile_repository,
+    get_video_repository,
+    get_comment_repository,
+    get_like_repository,
+    get_follow_repository,
+    get_tag_repository,
+    get_conversation_repository,
+)
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+# Collections that may be bulk exported. Credentials and private messages are deliberately absent.
+EXPORTABLE_REPOSITORIES: Dict[CollectionName, Callable[[], BaseRepository]] = {
+    CollectionName.USER_PROFILES: get_user_profile_repository,
+    CollectionName.VIDEOS: get_video_repository,
+    CollectionName.COMMENTS: get_comment_repository,
+    CollectionName.LIKES: get_like_repository,
+    CollectionName.FOLLOWS: get_follow_repository,
+    CollectionName.TAGS: get_tag_repository,
+}
+
+
+@router.get("/export/{collection}")
+async def export_collection(
+    collection: CollectionName,
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to include"),
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=5000),
+    current_user: UserData = Depends(get_admin_user),
+):
+    get_repository = EXPORTABLE_REPOSITORIES.get(collection)
+    if get_repository is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Collection '{collection.value}' cannot be exported")
+
+    projection = {"_id": 0}
+    if fields:
+        projection.update({field.strip(): 1 for field in fields.split(",") if field.strip()})
+
+    repository = get_repository()
+    logger.info(f"[Export] Streaming {collection.value} for user_id={current_user.user_id}")
+    return ndjson_response(
+        repository.iter_batches(batch_size=batch_size, projection=projection, raw=True),
+        filename=f"{collection.value}.ndjson",
+    )
+
+
+# One-off migration: conversations created before the inbox have no last_message_at and stay out of
+# it until this runs. It scans the conversations collection, so it is not run at startup.
+@router.post("/migrations/inbox-last-message-at")
+async def backfill_inbox_last_message_at(
+    current_user: UserData = Depends(get_admin_user),
+    conversation_repo: ConversationRepository = Depends(get_conversation_repository),
+):
+    try:
+        updated = await conversation_repo.backfill_last_message_at()
+        logger.info(f"[Migration] Inbox last_message_at backfilled on {updated} conversations by user_id={current_user.user_id}")
+        return {"success": True, "updated": updated}
+    except Exception as e:
+        logger.error(f"[Migration] Inbox last_message_at backfill failed: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Migration failed")
@@ -1,15 +1,20 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, WebSocketException, status
+from typing import Optional
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from app.core.config import settings
 from app.services.user.user_auth import UserAuthService
+from app.services.follow import FollowService
 from app.schemas import UserData
-from app.api.deps import get_user_auth_service 
+from app.core.visibility import Viewer
+from app.api.deps import get_user_auth_service, get_follow_service
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 
-# It fetches the authenticated user's credentials from the UserAuth model
+# Resolves the caller from the token. Tokens carrying sub/email/username are trusted as signed
+# and only checked against the local revocation list; older tokens fall back to a cached user lookup.
 async def get_logged_in_user(
     token: str = Depends(oauth2_scheme),
     auth_service: UserAuthService = Depends(get_user_auth_service),
@@ -18,18 +23,68 @@ async def get_logged_in_user(
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         email: str = payload.get("email")
+        username: str = payload.get("username")
 
         if not user_id or not email:
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
-        user = await auth_service.get_by_email(email)
+        if payload.get("type", "access") != "access":
+            raise HTTPException(status_code=401, detail="Invalid token type")
+
+        if auth_service.is_revoked(user_id):
+            raise HTTPException(status_code=401, detail="Token has been revoked")
+
+        if settings.AUTH_TRUST_TOKEN_CLAIMS and username:
+            return UserData(user_id=user_id, email=email, username=username)
+
+        user = await auth_service.get_auth_user(user_id, email)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        return UserData(user_id=user.user_id, email=user.email, username=user.username)
+        return user
 
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Token verification failed"
         )
+
+
+# Admin endpoints: the caller must be listed in ADMIN_USER_IDS
+async def get_admin_user(current_user: UserData = Depends(get_logged_in_user)) -> UserData:
+    if current_user.user_id not in settings.ADMIN_USER_IDS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return current_user
+
+
+# Browsers cannot set an Authorization header on a WebSocket handshake, so sockets pass the
+# access token as ?token=. Failures close the handshake with 1008 (policy violation).
+async def get_websocket_user(
+    token: Optional[str] = Query(None),
+    auth_service: UserAuthService = Depends(get_user_auth_service),
+) -> UserData:
+    if not token:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Missing token")
+    try:
+        return await get_logged_in_user(token=token, auth_service=auth_service)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+
+
+# For endpoints that work signed out but show more when signed in (feeds, search).
+# A missing token yields None; a bad token is still rejected.
+async def get_optional_user(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    auth_service: UserAuthService = Depends(get_user_auth_service),
+) -> Optional[UserData]:
+    if not token:
+        return None
+    return await get_logged_in_user(token=token, auth_service=auth_service)
+
+
+# What the caller may see, ready to compile into a query filter (see app.core.visibility)
+async def get_viewer(
+    current_user: Optional[UserData] = Depends(get_optional_user),
+    follow_service: FollowService = Depends(get_follow_service),
+) -> Viewer:
+    return await follow_service.viewer_for(current_user.user_id if current_user else None)
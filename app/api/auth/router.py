@@ -3,6 +3,7 @@ from uuid import UUID
 from app.services.user.user_auth import UserAuthService
 from app.api.deps import get_user_auth_service
 from app.schemas.user_schema import UserRegisterRequest, LoginRequest, UserResponse, UserData, TokenResponse, TokenData
+from app.core.exceptions import PasswordHashingBusyException
 from app.core.logging import get_logger
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -21,6 +22,9 @@ async def signup(user_data: UserRegisterRequest, auth_service: UserAuthService =
         logger.info(f"[Register] User registered with ID: {user.user_id}")
         return UserResponse(data=UserData(user_id=user.user_id, email=user.email, username=user.username))
 
+    except PasswordHashingBusyException as e:
+        logger.warning(f"[Register] Password hashing pool saturated for {user_data.email}")
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=e.message, headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"[Register] Registration failed for {user_data.email}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Registration failed")
@@ -34,7 +38,7 @@ async def login(request: LoginRequest, auth_service: UserAuthService = Depends(g
             logger.warning(f"[Login] Failed login attempt for email: {request.email}")
             raise HTTPException(status_code=401, detail="Incorrect email or password")
 
-        access_token, refresh_token = await auth_service.generate_token(user.user_id, request.email)
+        access_token, refresh_token = await auth_service.generate_token(user.user_id, request.email, user.username)
         logger.info(f"[Login] Login successful for user_id={user.user_id}")
         return TokenResponse(
             data=TokenData(
@@ -44,6 +48,9 @@ async def login(request: LoginRequest, auth_service: UserAuthService = Depends(g
             )
         )
 
+    except PasswordHashingBusyException as e:
+        logger.warning(f"[Login] Password hashing pool saturated for {request.email}")
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=e.message, headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"[Login] Login failed for {request.email}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Login failed")
@@ -52,7 +59,7 @@ async def login(request: LoginRequest, auth_service: UserAuthService = Depends(g
 @router.delete("/{user_id}")
 async def delete_user(user_id: UUID, auth_service: UserAuthService = Depends(get_user_auth_service)):
     try:
-        success = await auth_service.delete_by_user_id(user_id)
+        success = await auth_service.delete_user(user_id)
         if not success:
             logger.warning(f"[Delete] User not found for user_id={user_id}")
             raise HTTPException(status_code=404, detail="User not found")
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from uuid import UUID
+from app.schemas.schema import CommentCreateSchema, CommentPageResponse, CommentItemResponse
+from app.schemas.user_schema import UserData
+from app.services.comment import CommentService
+from app.api.deps import get_comment_service
+from app.api.auth.jwt import get_logged_in_user, get_viewer
+from app.core.visibility import Viewer
+from app.core.exceptions import InvalidFieldFormatException
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+# Newest first; the client passes back `next_cursor` to load older comments.
+# Comments follow the video's visibility; a video the caller may not see answers 404.
+@router.get("/video/{video_id}", response_model=CommentPageResponse)
+async def list_comments(
+    video_id: UUID,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    viewer: Viewer = Depends(get_viewer),
+    service: CommentService = Depends(get_comment_service),
+):
+    try:
+        return CommentPageResponse(data=await service.get_thread(video_id, viewer, cursor=cursor, limit=limit))
+    except HTTPException:
+        raise
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Comments] Failed to load comments for video_id={video_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load comments")
+
+
+@router.post("/video/{video_id}", response_model=CommentItemResponse)
+async def add_comment(
+    video_id: UUID,
+    comment: CommentCreateSchema,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: CommentService = Depends(get_comment_service),
+):
+    try:
+        return CommentItemResponse(data=await service.add_comment(video_id, current_user.user_id, comment.text))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Add Comment] Failed for user_id={current_user.user_id}, video_id={video_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to add comment")
+
+
+@router.delete("/{comment_id}")
+async def delete_comment(
+    comment_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: CommentService = Depends(get_comment_service),
+):
+    try:
+        await service.delete_comment(comment_id, current_user.user_id)
+        return {"success": True}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Delete Comment] Failed for comment_id={comment_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete comment")
@@ -9,8 +9,15 @@ from app.repositories.message import MessageRepository
 from app.repositories.conversation import ConversationRepository
 from app.repositories.follow import FollowRepository
 from app.repositories.tag import TagRepository
+from app.repositories.timeline import TimelineRepository
+from app.repositories.trending import TrendingRepository
+from app.repositories.video.video_repository_wrapper import VideoRepositoryWrapper
+from app.repositories.video.video_create_repository import VideoCreateRepository
+from app.repositories.video.video_manage_repository import VideoManageRepository
+from app.repositories.video.video_explore_repository import VideoExploreRepository
+from app.repositories.video.video_interact_repository import VideoInteractRepository
 
-from app.services.vedio.video import VideoService
+from app.services.video.video_service import VideoService
 from app.services.user.user_profile import UserProfileService
 from app.services.user.user_auth import UserAuthService
 from app.services.comment import CommentService
@@ -20,8 +27,15 @@ from app.services.conversation import ConversationService
 from app.services.follow import FollowService
 from app.services.tag import TagService
 from app.services.s3 import S3Service
+from app.services.timeline import TimelineService
+from app.services.search import SearchService
+from app.services.video.video_explore_service import VideoExploreService
+from app.services.video.video_room_hub import video_room_hub
+from app.services.chat import chat_relay
+from app.services.presence import presence_tracker
 
 from app.core.collections import CollectionName
+from app.core.config import settings
 # Initialize DB (shared across app)
 db: AsyncIOMotorDatabase | None = None
 async def initialize_db():
@@ -38,24 +52,66 @@ class DependencyStorage:
         self._user_auth_repo = UserAuthRepository(db[CollectionName.USER_AUTH.value])
         self._user_profile_repo = UserProfileRepository(db[CollectionName.USER_PROFILES.value])
         self._video_repo = VideoRepository(db[CollectionName.VIDEOS.value])
-        self._comment_repo = CommentRepository(db[CollectionName.COMMENTS.value])
-        self._like_repo = LikeRepository(db[CollectionName.LIKES.value])
-        self._message_repo = MessageRepository(db[CollectionName.MESSAGES.value])
+        self._comment_repo = CommentRepository(db[CollectionName.COMMENTS.value], db[CollectionName.VIDEOS.value])
+        self._like_repo = LikeRepository(db[CollectionName.LIKES.value], db[CollectionName.VIDEOS.value])
+        self._message_repo = MessageRepository(db[CollectionName.MESSAGES.value], db[CollectionName.CONVERSATIONS.value])
         self._conversation_repo = ConversationRepository(db[CollectionName.CONVERSATIONS.value])
-        self._follow_repo = FollowRepository(db[CollectionName.FOLLOWS.value])
+        self._follow_repo = FollowRepository(db[CollectionName.FOLLOWS.value], db[CollectionName.USER_PROFILES.value])
         self._tag_repo = TagRepository(db[CollectionName.TAGS.value])
+        self._timeline_repo = TimelineRepository(db[CollectionName.TIMELINES.value], max_entries=settings.TIMELINE_MAX_ENTRIES)
+        self._trending_repo = TrendingRepository(db[CollectionName.TRENDING.value])
+        self._video_repo_wrapper = VideoRepositoryWrapper(
+            create_repo=VideoCreateRepository(self._video_repo, db[CollectionName.VIDEO_DRAFTS.value]),
+            manage_repo=VideoManageRepository(self._video_repo),
+            explore_repo=VideoExploreRepository(self._video_repo, self._trending_repo),
+            interact_repo=VideoInteractRepository(self._video_repo),
+        )
+        self._s3_service = S3Service()
 
         # Services
-        self._video_service = VideoService(video_repository=self._video_repo)
-        self._user_auth_service = UserAuthService(user_repository=self._user_repo)
-        self._user_profile_service = UserProfileService(user_repository=self._user_repo)
-        self._comment_service = CommentService(comment_repository=self._comment_repo)
-        self._like_service = LikeService(like_repository=self._like_repo)
-        self._message_service = MessageService(message_repository=self._message_repo)
-        self._conversation_service = ConversationService(conversation_repository=self._conversation_repo)
-        self._follow_service = FollowService(follow_repository=self._follow_repo)
-        self._tag_service = TagService(tag_repository=self._tag_repo)
-        self._s3_service = S3Service()
+        self._follow_service = FollowService(follow_repository=self._follow_repo, profile_repository=self._user_profile_repo)
+        self._timeline_service = TimelineService(
+            timeline_repository=self._timeline_repo,
+            follow_repository=self._follow_repo,
+            follow_service=self._follow_service,
+            profile_repository=self._user_profile_repo,
+            video_repository=self._video_repo,
+        )
+        self._search_service = SearchService(video_repository=self._video_repo, profile_repository=self._user_profile_repo)
+        self._tag_service = TagService(tag_repository=self._tag_repo, video_repository=self._video_repo)
+        self._video_service = VideoService(
+            video_repo=self._video_repo_wrapper,
+            s3_service=self._s3_service,
+            timeline_service=self._timeline_service,
+            profile_repository=self._user_profile_repo,
+            tag_service=self._tag_service,
+        )
+        self._user_auth_service = UserAuthService(auth_repo=self._user_auth_repo)
+        self._user_profile_service = UserProfileService(profile_repo=self._user_profile_repo, video_repo=self._video_repo)
+        self._comment_service = CommentService(
+            comment_repository=self._comment_repo,
+            profile_repository=self._user_profile_repo,
+            video_repository=self._video_repo,
+            follow_service=self._follow_service,
+            room_hub=video_room_hub,
+        )
+        self._like_service = LikeService(
+            like_repository=self._like_repo,
+            video_repository=self._video_repo,
+            follow_service=self._follow_service,
+            room_hub=video_room_hub,
+        )
+        self._message_service = MessageService(
+            message_repository=self._message_repo,
+            conversation_repository=self._conversation_repo,
+            profile_repository=self._user_profile_repo,
+            relay=chat_relay,
+        )
+        self._conversation_service = ConversationService(
+            conversation_repository=self._conversation_repo,
+            profile_repository=self._user_profile_repo,
+            presence=presence_tracker,
+        )
 
 
     # Repository Getters
@@ -77,6 +133,8 @@ class DependencyStorage:
         return self._follow_repo
     def get_tag_repository(self) -> TagRepository:
         return self._tag_repo
+    def get_trending_repository(self) -> TrendingRepository:
+        return self._trending_repo
     
     # Service Getters
     def get_user_profile_service(self) -> UserProfileService:
@@ -85,6 +143,8 @@ class DependencyStorage:
         return self._user_auth_service
     def get_video_service(self) -> VideoService:
         return self._video_service
+    def get_video_explore_service(self) -> VideoExploreService:
+        return self._video_service.explore_service
     def get_comment_service(self) -> CommentService:
         return self._comment_service
     def get_like_service(self) -> LikeService:
@@ -97,6 +157,10 @@ class DependencyStorage:
         return self._follow_service
     def get_tag_service(self) -> TagService:
         return self._tag_service
+    def get_timeline_service(self) -> TimelineService:
+        return self._timeline_service
+    def get_search_service(self) -> SearchService:
+        return self._search_service
     def get_s3_service(self) -> S3Service:
         return self._s3_service
 
@@ -105,6 +169,12 @@ async def initialize_dependencies():
     global dependency_storage
     await initialize_db()
     dependency_storage = DependencyStorage()
+
+async def shutdown_dependencies():
+    """Release worker pools held by singleton services."""
+    if dependency_storage is not None:
+        await dependency_storage.get_timeline_service().drain()
+        dependency_storage.get_s3_service().close()
 # Dependency getters
 def get_video_repository() -> VideoRepository:
     if dependency_storage is None:
@@ -148,6 +218,10 @@ def get_video_service() -> VideoService:
     if dependency_storage is None:
         raise RuntimeError("Dependencies not initialized")
     return dependency_storage.get_video_service()
+def get_video_explore_service() -> VideoExploreService:
+    if dependency_storage is None:
+        raise RuntimeError("Dependencies not initialized")
+    return dependency_storage.get_video_explore_service()
 def get_user_auth_service() -> UserAuthService:
     if dependency_storage is None:
         raise RuntimeError("Dependencies not initialized")
@@ -180,6 +254,14 @@ def get_tag_service() -> TagService:
     if dependency_storage is None:
         raise RuntimeError("Dependencies not initialized")
     return dependency_storage.get_tag_service()
+def get_timeline_service() -> TimelineService:
+    if dependency_storage is None:
+        raise RuntimeError("Dependencies not initialized")
+    return dependency_storage.get_timeline_service()
+def get_search_service() -> SearchService:
+    if dependency_storage is None:
+        raise RuntimeError("Dependencies not initialized")
+    return dependency_storage.get_search_service()
 def get_s3_service() -> S3Service:
     if dependency_storage is None:
         raise RuntimeError("Dependencies not initialized")
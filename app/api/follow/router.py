@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from uuid import UUID
+from app.schemas.schema import FollowStatusResponse, FollowPageResponse
+from app.schemas.user_schema import UserData
+from app.services.follow import FollowService
+from app.api.deps import get_follow_service
+from app.api.auth.jwt import get_logged_in_user
+from app.core.exceptions import InvalidFieldFormatException
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+@router.post("/{user_id}", response_model=FollowStatusResponse)
+async def follow_user(
+    user_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: FollowService = Depends(get_follow_service),
+):
+    try:
+        return FollowStatusResponse(data=await service.follow(current_user.user_id, user_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Follow] Failed for user_id={current_user.user_id}, target={user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to follow user")
+
+
+@router.delete("/{user_id}", response_model=FollowStatusResponse)
+async def unfollow_user(
+    user_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: FollowService = Depends(get_follow_service),
+):
+    try:
+        return FollowStatusResponse(data=await service.unfollow(current_user.user_id, user_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Unfollow] Failed for user_id={current_user.user_id}, target={user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to unfollow user")
+
+
+# Newest first; the client passes back `next_cursor` to load more.
+@router.get("/{user_id}/followers", response_model=FollowPageResponse)
+async def list_followers(
+    user_id: UUID,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: FollowService = Depends(get_follow_service),
+):
+    try:
+        return FollowPageResponse(data=await service.get_followers(user_id, cursor=cursor, limit=limit))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Followers] Failed to load followers for user_id={user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load followers")
+
+
+@router.get("/{user_id}/following", response_model=FollowPageResponse)
+async def list_following(
+    user_id: UUID,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: FollowService = Depends(get_follow_service),
+):
+    try:
+        return FollowPageResponse(data=await service.get_following(user_id, cursor=cursor, limit=limit))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Following] Failed to load following for user_id={user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load following")
@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List
+from uuid import UUID
+from app.schemas.schema import LikeStatusResponse, LikedByMeResponse
+from app.schemas.user_schema import UserData
+from app.services.like import LikeService
+from app.api.deps import get_like_service
+from app.api.auth.jwt import get_logged_in_user
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+# Answers "did I like this" for a whole feed page in a single query.
+@router.get("/me", response_model=LikedByMeResponse)
+async def liked_by_me(
+    video_ids: List[UUID] = Query(...),
+    current_user: UserData = Depends(get_logged_in_user),
+    service: LikeService = Depends(get_like_service),
+):
+    try:
+        return LikedByMeResponse(data=await service.liked_by_me(current_user.user_id, video_ids))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Liked By Me] Failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load likes")
+
+
+@router.post("/{video_id}", response_model=LikeStatusResponse)
+async def like_video(
+    video_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: LikeService = Depends(get_like_service),
+):
+    try:
+        return LikeStatusResponse(data=await service.like(current_user.user_id, video_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Like] Failed for user_id={current_user.user_id}, video_id={video_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to like video")
+
+
+@router.delete("/{video_id}", response_model=LikeStatusResponse)
+async def unlike_video(
+    video_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: LikeService = Depends(get_like_service),
+):
+    try:
+        return LikeStatusResponse(data=await service.unlike(current_user.user_id, video_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Unlike] Failed for user_id={current_user.user_id}, video_id={video_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to unlike video")
+
+
+@router.post("/{video_id}/toggle", response_model=LikeStatusResponse)
+async def toggle_like(
+    video_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: LikeService = Depends(get_like_service),
+):
+    try:
+        return LikeStatusResponse(data=await service.toggle(current_user.user_id, video_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Toggle Like] Failed for user_id={current_user.user_id}, video_id={video_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to toggle like")
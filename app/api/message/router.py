@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from uuid import UUID
+from app.schemas.schema import (
+    SendMessageRequestSchema,
+    MessageResponse,
+    MessagePageResponse,
+    InboxPageResponse,
+    MarkReadResponse,
+)
+from app.schemas.user_schema import UserData
+from app.services.message import MessageService
+from app.services.conversation import ConversationService
+from app.api.deps import get_message_service, get_conversation_service
+from app.api.auth.jwt import get_logged_in_user
+from app.core.exceptions import InvalidFieldFormatException
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+@router.post("", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
+async def send_message(
+    request: SendMessageRequestSchema,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: MessageService = Depends(get_message_service),
+):
+    try:
+        return MessageResponse(data=await service.send(current_user.user_id, request))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Send Message] Failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to send message")
+
+
+# Polling fallback when no socket is open: pass the `cursor` of the last message seen (from a socket
+# event or a previous sync) to get what arrived since, oldest first. Call without a cursor to get a starting point.
+@router.get("/sync", response_model=MessagePageResponse)
+async def sync_messages(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserData = Depends(get_logged_in_user),
+    service: MessageService = Depends(get_message_service),
+):
+    try:
+        return MessagePageResponse(data=await service.sync(current_user.user_id, cursor=cursor, limit=limit))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Message Sync] Failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to sync messages")
+
+
+# Inbox: most recently active conversations first; pass back `next_cursor` to load more.
+@router.get("/conversations", response_model=InboxPageResponse)
+async def get_inbox(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserData = Depends(get_logged_in_user),
+    service: ConversationService = Depends(get_conversation_service),
+):
+    try:
+        return InboxPageResponse(data=await service.get_inbox(current_user.user_id, cursor=cursor, limit=limit))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Inbox] Failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load conversations")
+
+
+# History: newest messages first; `next_cursor` pages back in time.
+@router.get("/conversations/{conversation_id}", response_model=MessagePageResponse)
+async def get_messages(
+    conversation_id: UUID,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserData = Depends(get_logged_in_user),
+    service: MessageService = Depends(get_message_service),
+):
+    try:
+        return MessagePageResponse(data=await service.get_history(conversation_id, current_user.user_id, cursor=cursor, limit=limit))
+    except HTTPException:
+        raise
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Message History] Failed for conversation_id={conversation_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load messages")
+
+
+@router.post("/conversations/{conversation_id}/read", response_model=MarkReadResponse)
+async def mark_conversation_read(
+    conversation_id: UUID,
+    current_user: UserData = Depends(get_logged_in_user),
+    service: MessageService = Depends(get_message_service),
+):
+    try:
+        return MarkReadResponse(data=await service.mark_read(conversation_id, current_user.user_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Mark Read] Failed for conversation_id={conversation_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to mark messages read")
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List
+from uuid import UUID
+from app.schemas.schema import PresenceSchema, PresenceResponse
+from app.schemas.user_schema import UserData
+from app.services.presence import presence_tracker, MAX_LOOKUP_SIZE
+from app.services.follow import FollowService
+from app.repositories.user.user_profile import UserProfileRepository
+from app.api.auth.jwt import get_logged_in_user
+from app.api.deps import get_follow_service, get_user_profile_repository
+from app.core.visibility import can_view
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+# Batched "who is online": GET /presence?user_ids=a&user_ids=b. Answered from per-worker memory and
+# the shared presence store in one round trip, so clients should ask for a whole screen at once.
+# Presence follows account privacy: users the caller may not see are reported as offline.
+@router.get("", response_model=PresenceResponse)
+async def get_presence(
+    user_ids: List[UUID] = Query(...),
+    current_user: UserData = Depends(get_logged_in_user),
+    follow_service: FollowService = Depends(get_follow_service),
+    profile_repo: UserProfileRepository = Depends(get_user_profile_repository),
+):
+    if len(user_ids) > MAX_LOOKUP_SIZE:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_LOOKUP_SIZE} user_ids per request")
+    try:
+        user_ids = list(dict.fromkeys(user_ids))
+        viewer = await follow_service.viewer_for(current_user.user_id)
+        privacy = await profile_repo.get_privacy_settings(user_ids)
+        visible = [user_id for user_id, setting in privacy.items() if can_view(viewer, user_id, setting)]
+        online = await presence_tracker.online(visible)
+        return PresenceResponse(data=PresenceSchema(online_user_ids=[user_id for user_id in user_ids if user_id in online]))
+    except Exception as e:
+        logger.error(f"[Presence] Lookup failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to fetch presence")
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from app.schemas.schema import UserSearchPageResponse, UserAutocompleteResponse
+from app.schemas.video_schema import VideoFeedResponse
+from app.services.search import SearchService, AUTOCOMPLETE_LIMIT
+from app.api.deps import get_search_service
+from app.api.auth.jwt import get_viewer
+from app.core.visibility import Viewer
+from app.core.exceptions import InvalidFieldFormatException
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+# Best match first; the client passes back `next_cursor` to load more.
+@router.get("/videos", response_model=VideoFeedResponse)
+async def search_videos(
+    q: str = Query(..., min_length=1, max_length=100),
+    tag: Optional[str] = Query(None, max_length=50),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    viewer: Viewer = Depends(get_viewer),
+    service: SearchService = Depends(get_search_service),
+):
+    try:
+        return VideoFeedResponse(data=await service.search_videos(q, viewer=viewer, tag=tag, cursor=cursor, limit=limit))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Search Videos] Failed for q='{q}', tag={tag}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Search failed")
+
+
+@router.get("/users", response_model=UserSearchPageResponse)
+async def search_users(
+    q: str = Query(..., min_length=1, max_length=100),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: SearchService = Depends(get_search_service),
+):
+    try:
+        return UserSearchPageResponse(data=await service.search_users(q, cursor=cursor, limit=limit))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Search Users] Failed for q='{q}': {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Search failed")
+
+
+# Type-ahead: users whose display name starts with `prefix`, alphabetically.
+@router.get("/users/autocomplete", response_model=UserAutocompleteResponse)
+async def autocomplete_users(
+    prefix: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(AUTOCOMPLETE_LIMIT, ge=1, le=AUTOCOMPLETE_LIMIT),
+    service: SearchService = Depends(get_search_service),
+):
+    try:
+        return UserAutocompleteResponse(data=await service.autocomplete_users(prefix, limit=limit))
+    except Exception as e:
+        logger.error(f"[Autocomplete Users] Failed for prefix='{prefix}': {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Autocomplete failed")
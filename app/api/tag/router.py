@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from app.schemas.schema import TagResponse, TagListResponse
+from app.schemas.video_schema import VideoFeedResponse
+from app.services.tag import TagService, AUTOCOMPLETE_LIMIT, POPULAR_LIMIT
+from app.api.deps import get_tag_service
+from app.api.auth.jwt import get_viewer
+from app.core.visibility import Viewer
+from app.core.exceptions import InvalidFieldFormatException
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+# Most used tags starting with `prefix`; matching ignores case, "#" and punctuation like stored tags do.
+@router.get("/autocomplete", response_model=TagListResponse)
+async def autocomplete_tags(
+    prefix: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(AUTOCOMPLETE_LIMIT, ge=1, le=AUTOCOMPLETE_LIMIT),
+    service: TagService = Depends(get_tag_service),
+):
+    try:
+        return TagListResponse(data=await service.autocomplete(prefix, limit=limit))
+    except Exception as e:
+        logger.error(f"[Tag Autocomplete] Failed for prefix='{prefix}': {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Autocomplete failed")
+
+
+@router.get("/popular", response_model=TagListResponse)
+async def popular_tags(
+    limit: int = Query(20, ge=1, le=POPULAR_LIMIT),
+    service: TagService = Depends(get_tag_service),
+):
+    try:
+        return TagListResponse(data=await service.get_popular(limit=limit))
+    except Exception as e:
+        logger.error(f"[Popular Tags] Failed: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load tags")
+
+
+@router.get("/{name}", response_model=TagResponse)
+async def get_tag(name: str, service: TagService = Depends(get_tag_service)):
+    try:
+        return TagResponse(data=await service.get_tag(name))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Get Tag] Failed for name='{name}': {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load tag")
+
+
+# Tag page: videos carrying the tag, newest first, same cursor contract as /videos/feed.
+@router.get("/{name}/videos", response_model=VideoFeedResponse)
+async def get_tag_videos(
+    name: str,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    viewer: Viewer = Depends(get_viewer),
+    service: TagService = Depends(get_tag_service),
+):
+    try:
+        return VideoFeedResponse(data=await service.get_tag_videos(name, cursor=cursor, limit=limit, viewer=viewer))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Tag Videos] Failed for name='{name}': {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load tag videos")
@@ -81,7 +81,7 @@ async def upload_profile_picture(
         raise HTTPException(status_code=400, detail="Invalid file type. Only images are allowed.")
     
     try:
-        url = await s3.upload_file(file, folder="profile_pictures")
+        url = await s3.upload_stream(file, folder="profile_pictures")
         await service.update_profile(user_id, {"profile_picture_url": url})
         return {"profile_picture_url": url}
     
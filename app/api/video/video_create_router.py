@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, status, Body, Path
+from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, status, Body, Path, Header
+from typing import Optional
 from uuid import UUID
 import logging
 from app.schemas.video_schema import (
@@ -79,11 +80,13 @@ async def finalize_draft_to_video(
     s3_service: S3Service = Depends(get_s3_service),
     background_tasks: BackgroundTasks = Depends(),
     current_user: UserData = Depends(get_logged_in_user),
+    # Clients send the same key when retrying a "Post" so the retry returns the already published video
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=128),
 ):
     try:
         video, original_file_url = await service.finalize_draft(draft_id=finalize_request.draft_id,
-            user_id=current_user.user_id )
-        logger.info(f"[Finalize Draft] Video finalized for user_id={finalize_request.user_id}")
+            user_id=current_user.user_id, idempotency_key=idempotency_key)
+        logger.info(f"[Finalize Draft] Video finalized for user_id={current_user.user_id}")
 
         # Clean up original file in the background (optional safety check)
         if original_file_url:
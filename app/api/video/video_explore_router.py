@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from app.schemas.video_schema import VideoFeedResponse, PresignBatchRequestSchema, PresignBatchResponse
+from app.schemas.user_schema import UserData
+from app.services.video.video_explore_service import VideoExploreService
+from app.services.s3 import S3Service
+from app.services.timeline import TimelineService
+from app.api.deps import get_video_explore_service, get_s3_service, get_timeline_service
+from app.api.auth.jwt import get_logged_in_user, get_viewer
+from app.core.visibility import Viewer
+from app.core.exceptions import InvalidFieldFormatException
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.logging import get_logger
+
+logger = get_logger()
+router = APIRouter()
+
+
+# Infinite-scroll feed: the client passes back `next_cursor` from the previous page.
+# Signed-out callers see public videos; signed-in callers also see followers-only videos of people they follow.
+@router.get("/feed", response_model=VideoFeedResponse)
+async def get_video_feed(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: VideoExploreService = Depends(get_video_explore_service),
+    viewer: Viewer = Depends(get_viewer),
+):
+    try:
+        page = await service.get_feed(cursor=cursor, limit=limit, viewer=viewer)
+        return VideoFeedResponse(data=page)
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Feed] Failed to load feed page: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load feed")
+
+
+# Most engaging recent videos, from scores precomputed by the trending job.
+@router.get("/trending", response_model=VideoFeedResponse)
+async def get_trending_feed(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: VideoExploreService = Depends(get_video_explore_service),
+    viewer: Viewer = Depends(get_viewer),
+):
+    try:
+        return VideoFeedResponse(data=await service.get_trending(cursor=cursor, limit=limit, viewer=viewer))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Trending] Failed to load trending page: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load trending videos")
+
+
+# Editor-featured videos, newest first.
+@router.get("/featured", response_model=VideoFeedResponse)
+async def get_featured_feed(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: VideoExploreService = Depends(get_video_explore_service),
+    viewer: Viewer = Depends(get_viewer),
+):
+    try:
+        return VideoFeedResponse(data=await service.get_featured(cursor=cursor, limit=limit, viewer=viewer))
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Featured] Failed to load featured page: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load featured videos")
+
+
+# Home feed: videos from the people the current user follows, newest first, same cursor contract as /feed.
+@router.get("/home", response_model=VideoFeedResponse)
+async def get_home_feed(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: TimelineService = Depends(get_timeline_service),
+    current_user: UserData = Depends(get_logged_in_user),
+):
+    try:
+        page = await service.get_home_feed(current_user.user_id, cursor=cursor, limit=limit)
+        return VideoFeedResponse(data=page)
+    except InvalidFieldFormatException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except Exception as e:
+        logger.error(f"[Home Feed] Failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load home feed")
+
+
+# Signs playback URLs for a whole feed page (videos + thumbnails) in one call.
+# Accepts bare keys or the s3_url/thumbnail_url values returned by the feed; the response is keyed by what was sent.
+# Video and thumbnail keys are only signed when the caller may watch the video that owns them.
+@router.post("/presign", response_model=PresignBatchResponse)
+async def presign_download_urls(
+    request: PresignBatchRequestSchema,
+    s3_service: S3Service = Depends(get_s3_service),
+    service: VideoExploreService = Depends(get_video_explore_service),
+    current_user: UserData = Depends(get_logged_in_user),
+    viewer: Viewer = Depends(get_viewer),
+):
+    keys = {value: s3_service.key_from_url(value) for value in request.keys}
+    forbidden = [value for value, key in keys.items() if not s3_service.is_presignable_key(key)]
+    if forbidden:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot presign keys: {forbidden[:5]}")
+    try:
+        # One query for every video key on the page, matched by bare key or by object URL
+        protected = {key: [key, s3_service.url_for_key(key)] for key in keys.values() if s3_service.is_video_media_key(key)}
+        allowed = await service.viewable_media_keys(protected, viewer) if protected else set()
+        denied = [value for value, key in keys.items() if key in protected and key not in allowed]
+        if denied:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Cannot presign keys: {denied[:5]}")
+        urls = s3_service.generate_presigned_download_urls(keys.values(), expires_in=request.expires_in)
+        return PresignBatchResponse(data={value: urls[key] for value, key in keys.items()})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Presign] Failed for user_id={current_user.user_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to presign URLs")
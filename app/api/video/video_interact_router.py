@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends, status
+from uuid import UUID
+from app.services.video.view_counter import ViewCounter, get_view_counter
+
+router = APIRouter()
+
+
+# Called by the player once playback starts. The count is buffered and written back in batches,
+# so Video.views lags by up to VIEW_FLUSH_INTERVAL_SECONDS.
+@router.post("/{video_id}/view", status_code=status.HTTP_202_ACCEPTED)
+async def record_view(video_id: UUID, view_counter: ViewCounter = Depends(get_view_counter)):
+    view_counter.record(video_id)
+    return {"accepted": True}
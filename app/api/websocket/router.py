@@ -0,0 +1,207 @@
+import asyncio
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+from uuid import UUID
+from app.api.auth.jwt import get_websocket_user
+from app.api.deps import get_message_service, get_follow_service, get_video_repository
+from app.schemas import UserData
+from app.schemas.schema import SendMessageRequestSchema
+from app.services.chat import chat_relay, sync_cursor
+from app.services.message import MessageService
+from app.services.follow import FollowService
+from app.repositories.video.video_repository import VideoRepository
+from app.services.matchmaking import get_matchmaking_service
+from app.services.presence import presence_tracker
+from app.services.signaling import SignalingError, get_signaling_relay
+from app.services.video.video_room_hub import video_room_hub
+from app.core.enums import VideoStatus
+from app.core.visibility import can_view
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter()
+
+
+async def _can_watch(video_repo: VideoRepository, follow_service: FollowService, user_id: UUID, video_id: UUID) -> bool:
+    video = await video_repo.get_by_id(video_id)
+    if video is None:
+        return False
+    if video.status != VideoStatus.PUBLISHED and video.user_id != user_id:
+        return False
+    return can_view(await follow_service.viewer_for(user_id), video.user_id, video.visibility or video.privacy)
+
+
+# Clients send {"action": "subscribe" | "unsubscribe", "video_id": "..."} for the videos on screen
+# and receive coalesced {"type": "video_delta", ...} messages at most once per flush interval per video.
+# Subscribing is checked against the video's visibility, so live comments follow the same rules as feeds.
+@router.websocket("/videos")
+async def video_rooms(
+    websocket: WebSocket,
+    current_user: UserData = Depends(get_websocket_user),
+    follow_service: FollowService = Depends(get_follow_service),
+    video_repo: VideoRepository = Depends(get_video_repository),
+):
+    await websocket.accept()
+    user_id = current_user.user_id
+    try:
+        while True:
+            message = await websocket.receive_json()
+            action = message.get("action")
+            try:
+                video_id = UUID(str(message.get("video_id")))
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Invalid video_id"})
+                continue
+
+            if action == "subscribe":
+                # Same answer for missing and hidden videos, so ids cannot be probed
+                if not await _can_watch(video_repo, follow_service, user_id, video_id):
+                    await websocket.send_json({"type": "error", "detail": "Video not found", "video_id": str(video_id)})
+                elif not await video_room_hub.join(websocket, video_id):
+                    await websocket.send_json({"type": "error", "detail": "Too many subscriptions"})
+            elif action == "unsubscribe":
+                await video_room_hub.leave(websocket, video_id)
+            else:
+                await websocket.send_json({"type": "error", "detail": f"Unknown action: {action}"})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"[Video Rooms] Socket error for user_id={user_id}: {e}")
+    finally:
+        await video_room_hub.leave_all(websocket)
+
+
+# Random calls: the client sends {"action": "join", "tags": [...]} and waits for
+# {"type": "matched", "session_id", "peer_id", "initiator", "shared_tags"} or {"type": "timeout"}.
+# Sending {"action": "leave"} or disconnecting removes the user from the queue immediately.
+@router.websocket("/matchmaking")
+async def matchmaking(websocket: WebSocket, current_user: UserData = Depends(get_websocket_user)):
+    await websocket.accept()
+    service = get_matchmaking_service()
+    user_id = current_user.user_id
+    await presence_tracker.connect(user_id)
+    try:
+        while True:
+            message = await websocket.receive_json()
+            if message.get("action") != "join":
+                await websocket.send_json({"type": "error", "detail": f"Unknown action: {message.get('action')}"})
+                continue
+            tags = message.get("tags") or []
+            if not isinstance(tags, list):
+                await websocket.send_json({"type": "error", "detail": "tags must be a list"})
+                continue
+
+            waiter = service.join(user_id, [str(tag) for tag in tags])
+            await websocket.send_json({"type": "waiting"})
+
+            # Wait for a peer while still listening for leave/disconnect
+            receive = asyncio.ensure_future(websocket.receive_json())
+            done, _ = await asyncio.wait({waiter.match, receive}, return_when=asyncio.FIRST_COMPLETED)
+            if waiter.match in done:
+                receive.cancel()
+                try:
+                    match = waiter.match.result()
+                except asyncio.TimeoutError:
+                    await websocket.send_json({"type": "timeout"})
+                    continue
+                except asyncio.CancelledError:
+                    continue
+                await websocket.send_json({
+                    "type": "matched",
+                    "session_id": str(match.session_id),
+                    "peer_id": str(match.peer_id),
+                    "initiator": match.initiator,
+                    "shared_tags": sorted(match.shared_tags),
+                })
+                continue
+
+            service.leave(user_id)
+            next_message = receive.result()  # Re-raises WebSocketDisconnect
+            if next_message.get("action") == "leave":
+                await websocket.send_json({"type": "left"})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"[Matchmaking] Socket error for user_id={user_id}: {e}")
+    finally:
+        service.leave(user_id)
+        await presence_tracker.disconnect(user_id)
+
+
+# WebRTC signaling: clients send {"type": "offer" | "answer" | "candidate" | "bye", "call_id", "to_user_id", "data"}.
+# `to_user_id` is only needed on the first offer of a call. Each message gets an ack (or "unavailable"
+# when the callee is offline); the peer receives the message, with candidates arriving in batches.
+@router.websocket("/signaling")
+async def signaling(websocket: WebSocket, current_user: UserData = Depends(get_websocket_user)):
+    await websocket.accept()
+    relay = get_signaling_relay()
+    user_id = current_user.user_id
+    await relay.connect(user_id, websocket)
+    await presence_tracker.connect(user_id)
+    try:
+        while True:
+            message = await websocket.receive_json()
+            try:
+                await websocket.send_json(await relay.handle(user_id, message))
+            except SignalingError as e:
+                await websocket.send_json({"type": "error", "detail": str(e), "call_id": message.get("call_id")})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"[Signaling] Socket error for user_id={user_id}: {e}")
+    finally:
+        await relay.disconnect(user_id, websocket)
+        await presence_tracker.disconnect(user_id)
+
+
+# Direct messages. On connect the client gets {"type": "ready", "sync_cursor"}; it then receives
+# {"type": "message", "message", "cursor"}, {"type": "read", ...} and {"type": "typing", ...} events.
+# Client actions: {"action": "send", "to_user_id", "text", "client_id"} (acked with "sent"),
+# {"action": "read", "conversation_id"} and {"action": "typing", "conversation_id"}.
+# Keep the `cursor` of the last message seen; after a disconnect, GET /messages/sync catches up from it.
+@router.websocket("/messages")
+async def direct_messages(
+    websocket: WebSocket,
+    current_user: UserData = Depends(get_websocket_user),
+    service: MessageService = Depends(get_message_service),
+):
+    await websocket.accept()
+    user_id = current_user.user_id
+    await chat_relay.connect(user_id, websocket)
+    await presence_tracker.connect(user_id)
+    await websocket.send_json({"type": "ready", "sync_cursor": sync_cursor(datetime.utcnow())})
+    try:
+        while True:
+            message = await websocket.receive_json()
+            action = message.get("action")
+            if action == "send":
+                try:
+                    request = SendMessageRequestSchema(receiver_user_id=message.get("to_user_id"), text=message.get("text"))
+                    sent = await service.send(user_id, request)
+                    await websocket.send_json({"type": "sent", "client_id": message.get("client_id"), "message": sent.model_dump(mode="json")})
+                except ValidationError:
+                    await websocket.send_json({"type": "error", "client_id": message.get("client_id"), "detail": "Invalid message"})
+                except HTTPException as e:
+                    await websocket.send_json({"type": "error", "client_id": message.get("client_id"), "detail": e.detail})
+                continue
+
+            if action not in ("read", "typing"):
+                await websocket.send_json({"type": "error", "detail": f"Unknown action: {action}"})
+                continue
+            try:
+                conversation_id = UUID(str(message.get("conversation_id")))
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Invalid conversation_id"})
+                continue
+            handled = await (chat_relay.record_read if action == "read" else chat_relay.typing)(conversation_id, user_id)
+            if not handled:
+                await websocket.send_json({"type": "error", "detail": "Conversation not found", "conversation_id": str(conversation_id)})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"[Direct Messages] Socket error for user_id={user_id}: {e}")
+    finally:
+        await chat_relay.disconnect(user_id, websocket)
+        await presence_tracker.disconnect(user_id)
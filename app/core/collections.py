@@ -4,12 +4,18 @@ class CollectionName(str, Enum):
     USER_AUTH = "user_auth"
     USER_PROFILES = "user_profiles"
     VIDEOS = "videos"
+    VIDEO_DRAFTS = "video_drafts"
     COMMENTS = "comments"
     LIKES = "likes"
     FOLLOWS = "follows"
     TAGS = "tags"
     MESSAGES = "messages"
     CONVERSATIONS = "conversations"
+    CALL_SESSIONS = "call_sessions"
+    ANONYMOUS_CALL_SESSIONS = "anonymous_call_sessions"
+    TIMELINES = "timelines"
+    TRENDING = "trending"
+    LEASES = "leases"
 
     @classmethod
     def get_all(cls):
@@ -25,6 +31,8 @@ class CollectionName(str, Enum):
                 return cls.USER_PROFILES.value
             case "video":
                 return cls.VIDEOS.value
+            case "videodraft":
+                return cls.VIDEO_DRAFTS.value
             case "comment":
                 return cls.COMMENTS.value
             case "like":
@@ -37,5 +45,13 @@ class CollectionName(str, Enum):
                 return cls.MESSAGES.value
             case "conversation":
                 return cls.CONVERSATIONS.value
+            case "callsession":
+                return cls.CALL_SESSIONS.value
+            case "anonymouscallsession":
+                return cls.ANONYMOUS_CALL_SESSIONS.value
+            case "timeline":
+                return cls.TIMELINES.value
+            case "trendingvideo":
+                return cls.TRENDING.value
             case _:
                 raise ValueError(f"Unknown model name: {model_name}")
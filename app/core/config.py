@@ -2,6 +2,7 @@ import os
 import json
 from dotenv import load_dotenv
 from typing import List, Optional, ClassVar, Type
+from uuid import UUID
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -24,6 +25,81 @@ class Settings(BaseSettings):
     DB_NAME: str = Field(default="name_db")
     DB_USER: str = Field(default="user")
     DB_PASSWORD: str = Field(default="password")
+    MONGO_URI: Optional[str] = Field(default=None)  # Overrides the DB_* fields when set
+
+    # MongoDB connection pool
+    MONGO_MAX_POOL_SIZE: int = Field(default=100)
+    MONGO_MIN_POOL_SIZE: int = Field(default=10)
+    MONGO_MAX_IDLE_TIME_MS: int = Field(default=60_000)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = Field(default=5_000)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(default=5_000)
+    MONGO_CONNECT_TIMEOUT_MS: int = Field(default=5_000)
+    MONGO_SOCKET_TIMEOUT_MS: int = Field(default=20_000)
+    # zlib ships with Python; add "zstd" (zstandard) or "snappy" (python-snappy) only once installed
+    MONGO_COMPRESSORS: List[str] = Field(default_factory=lambda: ["zlib"])
+    MONGO_READ_PREFERENCE: str = Field(default="primary")
+    MONGO_FEED_READ_PREFERENCE: str = Field(default="secondaryPreferred")
+    # Multi-document transactions need a replica set; standalone dev servers should set this to False
+    MONGO_USE_TRANSACTIONS: bool = Field(default=True)
+
+    # "apply" creates registered indexes at startup, "check" only reports missing/unused ones, "off" skips both
+    MONGO_INDEX_MODE: str = Field(default="apply")
+
+    # View counts are buffered per worker and written back in batches
+    VIEW_FLUSH_INTERVAL_SECONDS: float = Field(default=5.0)
+    VIEW_FLUSH_MAX_PENDING: int = Field(default=10_000)  # Distinct videos buffered before an early flush
+
+    # Real-time fan-out. Unset PUBSUB_URL keeps pub/sub in-process (single worker);
+    # point it at a Redis-protocol server (e.g. redis://localhost:6379/0) when running several workers.
+    PUBSUB_URL: Optional[str] = Field(default=None)
+    REALTIME_FLUSH_INTERVAL_MS: int = Field(default=250)
+    REALTIME_MAX_COMMENTS_PER_BATCH: int = Field(default=20)
+    REALTIME_MAX_ROOMS_PER_SOCKET: int = Field(default=50)
+
+    # Random-call matchmaking (per node, in memory)
+    MATCHMAKING_TIMEOUT_SECONDS: int = Field(default=120)  # Waiters are evicted after this long unmatched
+    MATCHMAKING_MAX_TAGS: int = Field(default=5)
+    MATCHMAKING_PERSIST_BATCH_SIZE: int = Field(default=200)
+
+    # Follow graph: per-worker cache of each user's following set, for feed and privacy checks
+    FOLLOWING_CACHE_SIZE: int = Field(default=10_000)
+    FOLLOWING_CACHE_TTL_SECONDS: int = Field(default=60)
+
+    # Home timelines: videos are pushed into followers' timelines on publish, except for creators
+    # above FANOUT_MAX_FOLLOWERS, whose videos are merged in when the feed is read
+    TIMELINE_MAX_ENTRIES: int = Field(default=500)
+    TIMELINE_FANOUT_MAX_FOLLOWERS: int = Field(default=10_000)
+    TIMELINE_FANOUT_BATCH_SIZE: int = Field(default=1000)
+    TIMELINE_LARGE_CREATORS_TTL_SECONDS: int = Field(default=300)
+
+    # Tags: usage counters are buffered per worker like views; autocomplete and popular tags are
+    # served from a per-worker snapshot of the VOCABULARY_SIZE most used tags
+    TAG_FLUSH_INTERVAL_SECONDS: float = Field(default=5.0)
+    TAG_FLUSH_MAX_PENDING: int = Field(default=10_000)
+    TAG_VOCABULARY_SIZE: int = Field(default=50_000)
+    TAG_VOCABULARY_TTL_SECONDS: int = Field(default=300)
+
+    # Trending: a background job rescores videos uploaded within the window into the trending collection.
+    # Every DECAY_HOURS of age costs a video one order of magnitude of engagement.
+    TRENDING_JOB_ENABLED: bool = Field(default=True)  # Workers that may run the job; one at a time holds its lease
+    TRENDING_REFRESH_INTERVAL_SECONDS: int = Field(default=60)
+    TRENDING_LEASE_SECONDS: int = Field(default=180)  # Another worker takes over this long after the owner stops renewing
+    TRENDING_WINDOW_HOURS: int = Field(default=72)
+    TRENDING_DECAY_HOURS: float = Field(default=12.0)
+    TRENDING_BATCH_SIZE: int = Field(default=1000)
+
+    # Direct messages over WebSockets
+    CHAT_READ_RECEIPT_FLUSH_MS: int = Field(default=1000)  # Read receipts are written in one batch per interval
+    CHAT_TYPING_MIN_INTERVAL_MS: int = Field(default=2000)  # Typing indicators relayed at most this often per conversation
+
+    # Presence: who is online across workers. Shares PUBSUB_URL unless PRESENCE_URL is set;
+    # with neither, presence is tracked in-process (single worker)
+    PRESENCE_URL: Optional[str] = Field(default=None)
+    PRESENCE_TTL_SECONDS: int = Field(default=60)  # Entries of a worker that stops heartbeating expire after this
+    PRESENCE_HEARTBEAT_SECONDS: int = Field(default=20)  # Must be shorter than the TTL
+
+    # WebRTC signaling
+    SIGNALING_CANDIDATE_BATCH_MS: int = Field(default=20)  # Trickle-ICE candidates to one peer are coalesced over this window
 
     # Secret key for JWT or session management
     SECRET_KEY: str = Field(default="secret_key")
@@ -33,6 +109,40 @@ class Settings(BaseSettings):
 
     # Auth settings
     USE_COOKIE_AUTH: bool = Field(default=False)
+    # Trust signed sub/email/username claims instead of loading the user on every request
+    AUTH_TRUST_TOKEN_CLAIMS: bool = Field(default=True)
+    AUTH_USER_CACHE_SIZE: int = Field(default=10_000)
+    AUTH_USER_CACHE_TTL_SECONDS: int = Field(default=60)
+
+    # Password hashing pool; logins past MAX_PENDING concurrent hashes get a 429
+    PASSWORD_HASH_WORKERS: int = Field(default=4)
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=64)
+    BCRYPT_ROUNDS: int = Field(default=12)  # Existing hashes are upgraded on the next successful login
+
+    # AWS S3
+    AWS_ACCESS_KEY_ID: Optional[str] = Field(default=None)
+    AWS_SECRET_ACCESS_KEY: Optional[str] = Field(default=None)
+    AWS_REGION: Optional[str] = Field(default=None)
+    AWS_S3_BUCKET_NAME: Optional[str] = Field(default=None)
+    S3_ENDPOINT_URL: Optional[str] = Field(default=None)  # Point at a local S3 stand-in (moto, MinIO) in dev/tests
+    S3_MAX_POOL_CONNECTIONS: int = Field(default=50)
+    S3_WORKERS: int = Field(default=16)  # Threads running blocking boto3 calls; keep <= S3_MAX_POOL_CONNECTIONS
+    S3_MAX_ATTEMPTS: int = Field(default=5)  # Includes the first attempt; retries back off with jitter
+    S3_MULTIPART_THRESHOLD_MB: int = Field(default=16)
+    S3_MULTIPART_CHUNK_MB: int = Field(default=8)
+    # Streaming uploads buffer one part at a time; S3 rejects non-final parts under 5 MB
+    S3_STREAM_PART_SIZE_MB: int = Field(default=5)
+    S3_STREAM_READ_CHUNK_KB: int = Field(default=256)
+    # Presigned download URLs are reused until this fraction of their lifetime has elapsed
+    S3_PRESIGN_EXPIRES_SECONDS: int = Field(default=3600)
+    S3_PRESIGN_REUSE_FRACTION: float = Field(default=0.5)
+    S3_PRESIGN_CACHE_SIZE: int = Field(default=50_000)
+    S3_PRESIGN_ALLOWED_PREFIXES: List[str] = Field(default_factory=lambda: ["videos/", "thumbnails/", "profile_pictures/"])
+    # Keys under these prefixes are only signed for callers who may watch the owning video
+    S3_PRESIGN_VIDEO_PREFIXES: List[str] = Field(default_factory=lambda: ["videos/", "thumbnails/"])
+
+    # Users allowed to call /admin endpoints (JSON list of user ids in the environment)
+    ADMIN_USER_IDS: List[UUID] = Field(default_factory=list)
 
     # CORS - use validator-style fallback
     ALLOWED_ORIGINS: List[str] = Field(default_factory=lambda: ["http://localhost:3000"])
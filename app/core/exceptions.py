@@ -326,6 +326,14 @@ class TokenExpiredException(AppException):
             details="The provided authentication token is no longer valid. Please log in again."
         )
 
+class PasswordHashingBusyException(AppException):
+    def __init__(self):
+        super().__init__(
+            message="Too many concurrent sign-in requests",
+            error_code=429,
+            details="The password hashing pool is saturated. Please retry shortly."
+        )
+
 class AccessDeniedException(AppException):
     def __init__(self):
         super().__init__(
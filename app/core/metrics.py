@@ -0,0 +1,29 @@
+import bisect
+from typing import Dict, List, Sequence
+
+
+class Histogram:
+    """Fixed-bucket histogram; `observe` is O(log buckets) and memory stays constant."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets: List[float] = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # Last slot counts values above the largest bucket
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> Dict[str, object]:
+        # Cumulative counts per upper bound, Prometheus style
+        cumulative, running = {}, 0
+        for bound, count in zip(self.buckets + [float("inf")], self._counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 4) if self.count else 0.0,
+            "buckets": cumulative,
+        }
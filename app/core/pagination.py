@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+from app.core.exceptions import InvalidFieldFormatException
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+# Cursors are opaque to clients: the last row's sort key, JSON encoded and base64url wrapped.
+def encode_cursor(values: Dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidFieldFormatException("cursor", "an opaque cursor returned by a previous page") from e
+    if not isinstance(values, dict):
+        raise InvalidFieldFormatException("cursor", "an opaque cursor returned by a previous page")
+    return values
+
+
+def parse_cursor(
+    cursor: Optional[str],
+    key: str = "d",
+    convert: Callable[[Any], Any] = datetime.fromisoformat,
+) -> Optional[Tuple[Any, UUID]]:
+    """
+    Decode a keyset cursor into (sort value, id). Date-ordered pages store an ISO datetime under "d"
+    (the default); score-ordered pages pass key="s", convert=float.
+    """
+    values = decode_cursor(cursor)
+    if values is None:
+        return None
+    try:
+        return convert(values[key]), UUID(values["id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidFieldFormatException("cursor", "an opaque cursor returned by a previous page") from e
+
+
+def clamp_page_size(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
@@ -0,0 +1,117 @@
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set
+from uuid import UUID
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PresenceBackend(ABC):
+    """
+    Shared record of which node holds a connection for which user. Each node writes entries for
+    its own users with a TTL and refreshes them on every heartbeat; a user is online while any
+    node's entry is unexpired, so a node that dies takes its users offline within one TTL.
+    """
+
+    @abstractmethod
+    async def set_online(self, node_id: str, user_ids: List[UUID], ttl: float) -> None: ...
+
+    @abstractmethod
+    async def set_offline(self, node_id: str, user_ids: List[UUID]) -> None: ...
+
+    @abstractmethod
+    async def online(self, user_ids: List[UUID]) -> Set[UUID]:
+        """Which of `user_ids` are online anywhere, in one round trip."""
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryPresenceBackend(PresenceBackend):
+    """Single-process backend; also what tests use. `clock` is injectable to exercise expiry."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._entries: Dict[UUID, Dict[str, float]] = defaultdict(dict)
+
+    async def set_online(self, node_id: str, user_ids: List[UUID], ttl: float) -> None:
+        expires_at = self._clock() + ttl
+        for user_id in user_ids:
+            self._entries[user_id][node_id] = expires_at
+
+    async def set_offline(self, node_id: str, user_ids: List[UUID]) -> None:
+        for user_id in user_ids:
+            nodes = self._entries.get(user_id)
+            if nodes is not None:
+                nodes.pop(node_id, None)
+                if not nodes:
+                    del self._entries[user_id]
+
+    async def online(self, user_ids: List[UUID]) -> Set[UUID]:
+        now = self._clock()
+        result: Set[UUID] = set()
+        for user_id in user_ids:
+            nodes = self._entries.get(user_id)
+            if not nodes:
+                continue
+            for node_id in [node_id for node_id, expires_at in nodes.items() if expires_at <= now]:
+                del nodes[node_id]
+            if nodes:
+                result.add(user_id)
+            else:
+                del self._entries[user_id]
+        return result
+
+
+class RedisPresenceBackend(PresenceBackend):
+    """
+    Any Redis-protocol server. Each user is a hash `presence:{user_id}` of node_id -> last heartbeat,
+    expiring `ttl` after the latest one; writes and lookups are pipelined, one round trip per batch.
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("PRESENCE_URL is set but the 'redis' package is not installed") from e
+        self.redis = redis.from_url(url)
+
+    @staticmethod
+    def key(user_id: UUID) -> str:
+        return f"presence:{user_id}"
+
+    async def set_online(self, node_id: str, user_ids: List[UUID], ttl: float) -> None:
+        if not user_ids:
+            return
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.hset(self.key(user_id), node_id, now)
+                pipe.expire(self.key(user_id), max(1, int(ttl)))
+            await pipe.execute()
+
+    async def set_offline(self, node_id: str, user_ids: List[UUID]) -> None:
+        if not user_ids:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.hdel(self.key(user_id), node_id)
+            await pipe.execute()
+
+    async def online(self, user_ids: List[UUID]) -> Set[UUID]:
+        if not user_ids:
+            return set()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.exists(self.key(user_id))
+            results = await pipe.execute()
+        return {user_id for user_id, exists in zip(user_ids, results) if exists}
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_presence_backend(url: Optional[str] = None) -> PresenceBackend:
+    return RedisPresenceBackend(url) if url else InMemoryPresenceBackend()
@@ -0,0 +1,148 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+import orjson
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class PubSub(ABC):
+    """
+    Channel fan-out between workers. Every local subscriber of a channel gets each published message.
+    `publish` returns how many receivers (handlers, or worker connections for Redis) the message reached.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int: ...
+
+    @abstractmethod
+    async def subscribe(self, channel: str, handler: Handler) -> None: ...
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str, handler: Handler) -> None: ...
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryPubSub(PubSub):
+    """Single-process backend; also what tests use."""
+
+    def __init__(self):
+        self._handlers: Dict[str, Set[Handler]] = defaultdict(set)
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        handlers = list(self._handlers.get(channel, ()))
+        for handler in handlers:
+            try:
+                await handler(channel, message)
+            except Exception as e:
+                logger.error(f"[PubSub] Handler failed on {channel}: {e}")
+        return len(handlers)
+
+    async def subscribe(self, channel: str, handler: Handler) -> None:
+        self._handlers[channel].add(handler)
+
+    async def unsubscribe(self, channel: str, handler: Handler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers is not None:
+            handlers.discard(handler)
+            if not handlers:
+                del self._handlers[channel]
+
+
+class RedisPubSub(PubSub):
+    """
+    Cross-worker backend for any Redis-protocol server (Redis, Valkey, KeyDB, a local stand-in).
+    One connection carries every channel this worker listens to; a reader task dispatches messages.
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("PUBSUB_URL is set but the 'redis' package is not installed") from e
+        self.redis = redis.from_url(url)
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self._handlers: Dict[str, Set[Handler]] = defaultdict(set)
+        self._reader: Optional[asyncio.Task] = None
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        return await self.redis.publish(channel, orjson.dumps(message, default=str))
+
+    async def subscribe(self, channel: str, handler: Handler) -> None:
+        first = channel not in self._handlers
+        self._handlers[channel].add(handler)
+        if first:
+            await self._pubsub.subscribe(channel)
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+
+    async def unsubscribe(self, channel: str, handler: Handler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers is None:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self._handlers[channel]
+            await self._pubsub.unsubscribe(channel)
+
+    async def _read(self) -> None:
+        while True:
+            try:
+                async for raw in self._pubsub.listen():
+                    channel = raw["channel"].decode() if isinstance(raw["channel"], bytes) else raw["channel"]
+                    message = orjson.loads(raw["data"])
+                    for handler in list(self._handlers.get(channel, ())):
+                        try:
+                            await handler(channel, message)
+                        except Exception as e:
+                            logger.error(f"[PubSub] Handler failed on {channel}: {e}")
+                # listen() returns once nothing is subscribed; wait for the next subscribe
+                await asyncio.sleep(0.1)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[PubSub] Redis reader error, reconnecting: {e}")
+                await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        await self._pubsub.aclose()
+        await self.redis.aclose()
+
+
+# --- Lifecycle ---
+
+pubsub: Optional[PubSub] = None
+
+def create_pubsub(url: Optional[str] = None) -> PubSub:
+    return RedisPubSub(url) if url else InMemoryPubSub()
+
+# Called once from the application lifespan
+def connect_pubsub() -> PubSub:
+    global pubsub
+    if pubsub is None:
+        pubsub = create_pubsub(settings.PUBSUB_URL)
+    return pubsub
+
+def get_pubsub() -> PubSub:
+    if pubsub is None:
+        raise RuntimeError("PubSub not initialized. Call connect_pubsub() first.")
+    return pubsub
+
+async def close_pubsub():
+    global pubsub
+    if pubsub is not None:
+        await pubsub.close()
+        pubsub = None
@@ -0,0 +1,23 @@
+from typing import AsyncIterator, Dict, List
+from fastapi.responses import StreamingResponse
+import orjson
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _encode_line(doc: Dict) -> bytes:
+    # default=str covers ObjectId / Decimal128 and anything else orjson can't serialize natively
+    return orjson.dumps(doc, default=str, option=orjson.OPT_APPEND_NEWLINE)
+
+
+async def _ndjson_chunks(batches: AsyncIterator[List[Dict]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b"".join(_encode_line(doc) for doc in batch)
+
+
+def ndjson_response(batches: AsyncIterator[List[Dict]], filename: str | None = None) -> StreamingResponse:
+    """Stream batches of raw documents as newline-delimited JSON, one chunk per batch."""
+    headers = {}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(_ndjson_chunks(batches), media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,28 @@
+import re
+from typing import Iterable, List, Optional
+
+MAX_TAGS_PER_VIDEO = 20
+MAX_TAG_LENGTH = 50
+
+# Letters, digits and underscores in any script; everything else (spaces, punctuation, emoji) is dropped
+_NON_TAG_CHARS = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_tag(tag: Optional[str]) -> Optional[str]:
+    """Canonical form of one hashtag: "#Cats & Dogs" -> "catsdogs". None when nothing usable is left."""
+    if not tag:
+        return None
+    normalized = _NON_TAG_CHARS.sub("", tag.casefold())[:MAX_TAG_LENGTH]
+    return normalized or None
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Normalize, drop empties and duplicates (first occurrence wins) and cap the count."""
+    result: List[str] = []
+    for tag in tags or []:
+        normalized = normalize_tag(tag)
+        if normalized and normalized not in result:
+            result.append(normalized)
+            if len(result) >= MAX_TAGS_PER_VIDEO:
+                break
+    return result
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional
+from uuid import UUID
+from app.core.enums import PrivacySetting, VideoStatus
+
+# Higher is more restrictive
+PRIVACY_RANK = {
+    PrivacySetting.PUBLIC: 0,
+    PrivacySetting.FOLLOWERS_ONLY: 1,
+    PrivacySetting.PRIVATE: 2,
+}
+
+
+@dataclass(frozen=True)
+class Viewer:
+    """Who is looking: their user_id (None when signed out) and everyone they follow."""
+    user_id: Optional[UUID] = None
+    following: FrozenSet[UUID] = field(default_factory=frozenset)
+
+    @classmethod
+    def anonymous(cls) -> "Viewer":
+        return cls()
+
+
+def stricter(first: PrivacySetting, second: Optional[PrivacySetting]) -> PrivacySetting:
+    """The more restrictive of two settings, e.g. a public video on a private account is private."""
+    if second is None:
+        return PrivacySetting(first)
+    first, second = PrivacySetting(first), PrivacySetting(second)
+    return first if PRIVACY_RANK[first] >= PRIVACY_RANK[second] else second
+
+
+def video_visibility_filter(viewer: Viewer) -> Dict[str, Any]:
+    """
+    Compile what `viewer` may see into a filter on Video.visibility (the video's privacy capped
+    by its author's account setting). Each $or branch is an equality prefix of a videos index,
+    so the filter runs inside the page query instead of trimming pages afterwards.
+    """
+    if viewer.user_id is None:
+        return {"visibility": PrivacySetting.PUBLIC.value}
+    clauses = [{"visibility": PrivacySetting.PUBLIC.value}]
+    if viewer.following:
+        clauses.append({"visibility": PrivacySetting.FOLLOWERS_ONLY.value, "user_id": {"$in": list(viewer.following)}})
+    clauses.append({"user_id": viewer.user_id})
+    return {"$or": clauses}
+
+
+def can_view(viewer: Viewer, owner_id: UUID, visibility: PrivacySetting) -> bool:
+    """The same rule as video_visibility_filter, for a single already-loaded document."""
+    if viewer.user_id == owner_id:
+        return True
+    visibility = PrivacySetting(visibility)
+    if visibility == PrivacySetting.PUBLIC:
+        return True
+    return visibility == PrivacySetting.FOLLOWERS_ONLY and owner_id in viewer.following
+
+
+def can_watch(viewer: Viewer, video: Dict[str, Any]) -> bool:
+    """can_view for a video document; unpublished videos are visible to their author only."""
+    if video.get("status") != VideoStatus.PUBLISHED.value and video["user_id"] != viewer.user_id:
+        return False
+    return can_view(viewer, video["user_id"], video.get("visibility") or video.get("privacy") or PrivacySetting.FOLLOWERS_ONLY)
+
+
+def account_visibility_update(account_privacy: PrivacySetting) -> list:
+    """Pipeline update recomputing Video.visibility for every video of an account after its setting changed."""
+    account_privacy = PrivacySetting(account_privacy)
+    if account_privacy == PrivacySetting.PUBLIC:
+        visibility: Any = "$privacy"
+    elif account_privacy == PrivacySetting.PRIVATE:
+        visibility = PrivacySetting.PRIVATE.value
+    else:
+        visibility = {
+            "$cond": [
+                {"$eq": ["$privacy", PrivacySetting.PRIVATE.value]},
+                PrivacySetting.PRIVATE.value,
+                PrivacySetting.FOLLOWERS_ONLY.value,
+            ]
+        }
+    return [{"$set": {"visibility": visibility}}]
@@ -0,0 +1,105 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, Hashable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindCounter(ABC):
+    """
+    Write-back aggregator for counters. Increments are summed per key in memory and handed to
+    `_write` as one batch every `flush_interval` seconds (or sooner once `max_pending` distinct keys
+    are waiting), so a hot key costs one write per interval per worker instead of one per event.
+    Subclasses write with $inc, which makes the flushes of several workers commute.
+
+    A batch is swapped out of the buffer before it is written; a failed or cancelled write puts it
+    back, and stop() lets the loop finish its current flush before the final one, so a clean
+    shutdown loses nothing. At most one interval is lost if a worker dies without running stop().
+    """
+
+    name = "Counter"  # Log prefix
+
+    def __init__(self, flush_interval: float, max_pending: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._flushed = 0
+        self._flushes = 0
+        self._dropped = 0
+
+    @abstractmethod
+    async def _write(self, batch: Counter) -> None:
+        """Persist one batch of key -> increment; raise to have it retried on the next flush."""
+
+    def add(self, key: Hashable, count: int = 1) -> None:
+        self._pending[key] += count
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write everything buffered; returns the sum of the increments written."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, Counter()
+            try:
+                await self._write(batch)
+            except asyncio.CancelledError:
+                # The batch is already out of _pending; put it back so the final flush writes it
+                self._requeue(batch)
+                raise
+            except Exception as e:
+                logger.error(f"[{self.name}] Flush of {len(batch)} keys failed: {e}")
+                self._requeue(batch)
+                return 0
+            total = sum(batch.values())
+            self._flushed += total
+            self._flushes += 1
+            logger.debug(f"[{self.name}] Flushed {total} across {len(batch)} keys")
+            return total
+
+    def _requeue(self, batch: Counter) -> None:
+        # Retry on the next tick, but never let a persistent outage grow memory without bound
+        if len(self._pending) + len(batch) > self.max_pending * 10:
+            self._dropped += sum(batch.values())
+            logger.error(f"[{self.name}] Dropping {sum(batch.values())} after repeated flush failures")
+            return
+        self._pending.update(batch)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Let the loop finish its current flush and exit instead of cancelling it mid-write
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending_keys": len(self._pending),
+            "pending_total": sum(self._pending.values()),
+            "flushed": self._flushed,
+            "flushes": self._flushes,
+            "dropped": self._dropped,
+        }
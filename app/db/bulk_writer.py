@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BulkWriter:
+    """
+    Write-behind queue for one collection. Callers enqueue pymongo write models (InsertOne,
+    UpdateOne, ...) without awaiting the database; a background task sends them as ordered
+    bulk_write batches every `flush_interval` seconds or as soon as `batch_size` are queued.
+    Ordered batches keep per-document state transitions in the order they were enqueued.
+
+    An ordered batch stops at its first failing operation. That operation is dropped and everything
+    after it is put back at the head of the queue; a batch that failed as a whole (or was cancelled)
+    is put back entirely and retried on the next flush, so a clean stop() writes everything queued.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, name: str, flush_interval: float = 0.5, batch_size: int = 200):
+        self.collection = collection
+        self.name = name
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: List[Any] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._written = 0
+        self._failed = 0
+        self._dropped = 0
+
+    def add(self, operation: Any) -> None:
+        self._queue.append(operation)
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            written = 0
+            try:
+                while self._queue:
+                    batch, self._queue = self._queue[:self.batch_size], self._queue[self.batch_size:]
+                    try:
+                        await self.collection.bulk_write(batch, ordered=True)
+                        written += len(batch)
+                    except asyncio.CancelledError:
+                        # The batch is already out of _queue; put it back so the final flush writes it
+                        self._requeue(batch)
+                        raise
+                    except BulkWriteError as e:
+                        errors = e.details.get("writeErrors") or []
+                        if not errors:
+                            # Only the write concern failed; every operation was applied
+                            logger.warning(f"[Bulk Writer] {self.name}: batch of {len(batch)} applied with write concern errors")
+                            written += len(batch)
+                            continue
+                        # Ordered: everything before the first error was applied, nothing after it was tried
+                        index = errors[0]["index"]
+                        written += index
+                        self._failed += 1
+                        logger.error(f"[Bulk Writer] {self.name}: operation {index} of {len(batch)} failed: {errors[0].get('errmsg')}")
+                        self._requeue(batch[index + 1:])
+                    except Exception as e:
+                        logger.error(f"[Bulk Writer] {self.name}: batch of {len(batch)} failed: {e}")
+                        self._requeue(batch)
+                        break
+            finally:
+                self._written += written
+            return written
+
+    def _requeue(self, operations: List[Any]) -> None:
+        # Retry ahead of newer writes to keep their order, but never let an outage grow memory without bound
+        if len(self._queue) + len(operations) > self.batch_size * 50:
+            self._dropped += len(operations)
+            logger.error(f"[Bulk Writer] {self.name}: dropping {len(operations)} operations after repeated failures")
+            return
+        self._queue[:0] = operations
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Let the loop finish its current flush and exit instead of cancelling it mid-write
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def metrics(self) -> Dict[str, int]:
+        return {"queued": len(self._queue), "written": self._written, "failed": self._failed, "dropped": self._dropped}
@@ -0,0 +1,174 @@
+from typing import Dict, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from app.core.collections import CollectionName
+from app.repositories.video.video_repository import (
+    FEED_INDEX,
+    VISIBILITY_FEED_INDEX,
+    AUTHOR_FEED_INDEX,
+    FEATURED_INDEX,
+    TAG_FEED_INDEX,
+    VIDEO_TEXT_INDEX,
+    VIDEO_TEXT_WEIGHTS,
+    VIDEO_MEDIA_INDEX,
+    VIDEO_THUMBNAIL_INDEX,
+)
+from app.repositories.user.user_profile import PROFILE_TEXT_INDEX, PROFILE_TEXT_WEIGHTS, PROFILE_SEARCH_NAME_INDEX
+from app.repositories.comment import COMMENT_THREAD_INDEX
+from app.repositories.message import MESSAGE_HISTORY_INDEX, MESSAGE_SYNC_INDEX
+from app.repositories.conversation import INBOX_INDEX
+from app.repositories.tag import TAG_NAME_INDEX, TAG_USAGE_INDEX
+from app.repositories.trending import TRENDING_VISIBILITY_INDEX, TRENDING_AUTHOR_INDEX
+from app.repositories.follow import FOLLOW_EDGE_INDEX, FOLLOWERS_INDEX, FOLLOWING_INDEX
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Every index the application relies on, keyed by collection. Index names are explicit so that
+# the check mode can match them against what the server reports.
+INDEX_REGISTRY: Dict[CollectionName, List[IndexModel]] = {
+    CollectionName.USER_AUTH: [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+    ],
+    CollectionName.USER_PROFILES: [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+        # Finds the large creators whose videos are merged into home feeds at read time
+        IndexModel([("follower_count", DESCENDING)], name="follower_count"),
+        IndexModel(PROFILE_TEXT_INDEX, name="profile_text", weights=PROFILE_TEXT_WEIGHTS),
+        IndexModel(PROFILE_SEARCH_NAME_INDEX, name="search_name"),
+    ],
+    CollectionName.VIDEOS: [
+        IndexModel([("video_id", ASCENDING)], name="video_id_unique", unique=True),
+        IndexModel(FEED_INDEX, name="feed_status_upload_date_video_id"),
+        IndexModel(VISIBILITY_FEED_INDEX, name="feed_status_visibility_upload_date_video_id"),
+        IndexModel(AUTHOR_FEED_INDEX, name="feed_status_user_id_upload_date_video_id"),
+        IndexModel(TAG_FEED_INDEX, name="tag_feed_status_tags_visibility_upload_date_video_id"),
+        IndexModel(FEATURED_INDEX, name="featured_status_is_featured_visibility_upload_date_video_id"),
+        IndexModel([("user_id", ASCENDING), ("upload_date", DESCENDING)], name="user_id_upload_date"),
+        # A collection holds at most one text index, so every searchable field goes into this one
+        IndexModel(VIDEO_TEXT_INDEX, name="video_text", weights=VIDEO_TEXT_WEIGHTS),
+        IndexModel(VIDEO_MEDIA_INDEX, name="s3_url"),
+        IndexModel(VIDEO_THUMBNAIL_INDEX, name="thumbnail_url", sparse=True),
+        # Backstop for finalize: a draft can never produce two videos, even without transactions
+        IndexModel(
+            [("draft_id", ASCENDING)],
+            name="draft_id_unique",
+            unique=True,
+            partialFilterExpression={"draft_id": {"$type": "binData"}},
+        ),
+    ],
+    CollectionName.COMMENTS: [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel(COMMENT_THREAD_INDEX, name="video_id_created_at_id"),
+    ],
+    CollectionName.LIKES: [
+        # Also serves the batch "liked by me" lookup: user_id equality + video_id $in
+        IndexModel([("user_id", ASCENDING), ("video_id", ASCENDING)], name="user_id_video_id_unique", unique=True),
+    ],
+    CollectionName.FOLLOWS: [
+        IndexModel(FOLLOW_EDGE_INDEX, name="follower_user_id_following_user_id_unique", unique=True),
+        IndexModel(FOLLOWERS_INDEX, name="following_user_id_created_at_follower_user_id"),
+        IndexModel(FOLLOWING_INDEX, name="follower_user_id_created_at_following_user_id"),
+    ],
+    CollectionName.VIDEO_DRAFTS: [
+        IndexModel([("draft_id", ASCENDING), ("user_id", ASCENDING)], name="draft_id_user_id_unique", unique=True),
+    ],
+    CollectionName.TIMELINES: [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+    ],
+    CollectionName.MESSAGES: [
+        IndexModel(MESSAGE_HISTORY_INDEX, name="conversation_id_timestamp_id"),
+        IndexModel(MESSAGE_SYNC_INDEX, name="receiver_user_id_timestamp_id"),
+    ],
+    CollectionName.CONVERSATIONS: [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel(INBOX_INDEX, name="user_ids_last_message_at_id"),
+        # One one-on-one conversation per pair of users; groups have no pair_key
+        IndexModel(
+            [("pair_key", ASCENDING)],
+            name="pair_key_unique",
+            unique=True,
+            partialFilterExpression={"pair_key": {"$type": "string"}},
+        ),
+    ],
+    CollectionName.TAGS: [
+        IndexModel(TAG_NAME_INDEX, name="name_unique", unique=True),
+        IndexModel(TAG_USAGE_INDEX, name="usage_count_name"),
+    ],
+    CollectionName.TRENDING: [
+        IndexModel([("video_id", ASCENDING)], name="video_id_unique", unique=True),
+        IndexModel(TRENDING_VISIBILITY_INDEX, name="visibility_score_video_id"),
+        IndexModel(TRENDING_AUTHOR_INDEX, name="user_id_score_video_id"),
+        # Pruning rows a full ranking rebuild did not touch
+        IndexModel([("computed_at", ASCENDING)], name="computed_at"),
+    ],
+    CollectionName.CALL_SESSIONS: [
+        # Call transitions are upserts by id from whichever worker saw them first
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    ],
+    CollectionName.ANONYMOUS_CALL_SESSIONS: [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    ],
+}
+
+INDEX_MODE_APPLY = "apply"
+INDEX_MODE_CHECK = "check"
+INDEX_MODE_OFF = "off"
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> Dict[str, List[str]]:
+    """
+    Create every registered index. create_indexes is a no-op for indexes that already exist
+    with the same spec, so this is safe to run on every startup.
+    """
+    created: Dict[str, List[str]] = {}
+    for collection_name, indexes in INDEX_REGISTRY.items():
+        try:
+            created[collection_name.value] = await db[collection_name.value].create_indexes(indexes)
+        except OperationFailure as e:
+            # Usually an existing index with the same name but different options; needs a manual migration.
+            logger.error(f"[Indexes] Failed to apply indexes on {collection_name.value}: {e}")
+    logger.info(f"[Indexes] Applied indexes: {created}")
+    return created
+
+
+async def check_indexes(db: AsyncIOMotorDatabase) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Report registered indexes missing from the server and server indexes that have never
+    served a query since the last restart (per $indexStats).
+    """
+    report: Dict[str, Dict[str, List[str]]] = {}
+    for collection_name, indexes in INDEX_REGISTRY.items():
+        collection = db[collection_name.value]
+        expected = {index.document["name"] for index in indexes}
+        existing = set((await collection.index_information()).keys())
+
+        unused: List[str] = []
+        try:
+            async for stats in collection.aggregate([{"$indexStats": {}}]):
+                if stats["name"] != "_id_" and stats.get("accesses", {}).get("ops", 0) == 0:
+                    unused.append(stats["name"])
+        except OperationFailure as e:
+            logger.warning(f"[Indexes] $indexStats unavailable for {collection_name.value}: {e}")
+
+        report[collection_name.value] = {
+            "missing": sorted(expected - existing),
+            "unused": sorted(unused),
+        }
+
+    for name, result in report.items():
+        if result["missing"]:
+            logger.warning(f"[Indexes] {name} is missing indexes: {result['missing']}")
+        if result["unused"]:
+            logger.info(f"[Indexes] {name} has unused indexes: {result['unused']}")
+    return report
+
+
+async def bootstrap_indexes(db: AsyncIOMotorDatabase, mode: str = INDEX_MODE_APPLY) -> Dict[str, Dict[str, List[str]]]:
+    if mode == INDEX_MODE_OFF:
+        return {}
+    if mode == INDEX_MODE_APPLY:
+        await ensure_indexes(db)
+    return await check_indexes(db)
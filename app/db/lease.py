@@ -0,0 +1,44 @@
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import DuplicateKeyError
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Lease:
+    """
+    Single-owner lock for background jobs that must run on one worker at a time. The holder renews
+    it before every run; a worker that crashes or stops renewing loses it once `ttl` seconds pass,
+    and the next worker to ask takes over. One document per lease, keyed by its name.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, name: str, ttl: float, owner: Optional[str] = None):
+        self.collection = collection
+        self.name = name
+        self.ttl = ttl
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+
+    async def acquire(self) -> bool:
+        """Take or renew the lease; False while another worker holds it."""
+        now = datetime.utcnow()
+        try:
+            await self.collection.update_one(
+                {"_id": self.name, "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": self.owner, "expires_at": now + timedelta(seconds=self.ttl)}},
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            # The filter missed because another owner's lease is live, and the upsert hit its _id
+            return False
+
+    async def release(self) -> None:
+        """Give the lease up early so another worker can take over without waiting out the TTL."""
+        try:
+            await self.collection.delete_one({"_id": self.name, "owner": self.owner})
+        except Exception as e:
+            logger.error(f"[Lease] Failed to release {self.name}: {e}")
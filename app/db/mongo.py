@@ -1,32 +1,151 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional
-from app.core.config import get_config
-
-# Load current config
-config = get_config()
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring, ReadPreference
+from typing import Optional, Dict, Any
+from collections import defaultdict
+from app.core.config import settings
 
 # Build MongoDB connection URI
 def get_mongo_uri() -> str:
-    user = config.DB_USER
-    password = config.DB_PASSWORD
-    host = config.DB_HOST
-    port = config.DB_PORT
-    db = config.DB_NAME
+    if settings.MONGO_URI:
+        return settings.MONGO_URI
+
+    user = settings.DB_USER
+    password = settings.DB_PASSWORD
+    host = settings.DB_HOST
+    port = settings.DB_PORT
+    db = settings.DB_NAME
 
     return f"mongodb://{user}:{password}@{host}:{port}/{db}?authSource=admin"
 
-# Initialize the MongoDB client
+
+_READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+def get_read_preference(name: str):
+    try:
+        return _READ_PREFERENCES[name]
+    except KeyError:
+        raise ValueError(f"Unknown read preference: {name}")
+
+# Read preference for feed/explore queries, which tolerate slightly stale data
+def get_feed_read_preference():
+    return get_read_preference(settings.MONGO_FEED_READ_PREFERENCE)
+
+
+# --- Pool metrics ---
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Tracks connection pool utilization per server from driver CMAP events."""
+
+    def __init__(self):
+        self._servers: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "open": 0,
+            "checked_out": 0,
+            "max_checked_out": 0,
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "pool_clears": 0,
+        })
+
+    def _stats(self, event) -> Dict[str, int]:
+        host, port = event.address
+        return self._servers[f"{host}:{port}"]
+
+    def pool_created(self, event):
+        self._stats(event)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._stats(event)["pool_clears"] += 1
+
+    def pool_closed(self, event):
+        host, port = event.address
+        self._servers.pop(f"{host}:{port}", None)
+
+    def connection_created(self, event):
+        self._stats(event)["open"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        stats = self._stats(event)
+        stats["open"] = max(0, stats["open"] - 1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._stats(event)["checkout_failures"] += 1
+
+    def connection_checked_out(self, event):
+        stats = self._stats(event)
+        stats["checkouts"] += 1
+        stats["checked_out"] += 1
+        stats["max_checked_out"] = max(stats["max_checked_out"], stats["checked_out"])
+
+    def connection_checked_in(self, event):
+        stats = self._stats(event)
+        stats["checked_out"] = max(0, stats["checked_out"] - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_pool_size": settings.MONGO_MAX_POOL_SIZE,
+            "servers": {address: dict(stats) for address, stats in self._servers.items()},
+        }
+
+
+pool_metrics = PoolMetricsListener()
+
+def get_pool_metrics() -> Dict[str, Any]:
+    return pool_metrics.snapshot()
+
+
+# --- Client lifecycle ---
+
 mongo_client: Optional[AsyncIOMotorClient] = None
 
-# Access MongoDB database instance
-def get_database():
+def create_mongo_client() -> AsyncIOMotorClient:
+    options: Dict[str, Any] = dict(
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+        socketTimeoutMS=settings.MONGO_SOCKET_TIMEOUT_MS,
+        read_preference=get_read_preference(settings.MONGO_READ_PREFERENCE),
+        uuidRepresentation="standard",
+        event_listeners=[pool_metrics],
+    )
+    # The driver negotiates the first compressor the server also supports
+    if settings.MONGO_COMPRESSORS:
+        options["compressors"] = ",".join(settings.MONGO_COMPRESSORS)
+    return AsyncIOMotorClient(get_mongo_uri(), **options)
+
+# Called once from the application lifespan; the client is shared by every request on this worker
+def connect_to_mongo() -> AsyncIOMotorDatabase:
     global mongo_client
     if mongo_client is None:
-        mongo_uri = get_mongo_uri()
-        mongo_client = AsyncIOMotorClient(mongo_uri)
-    return mongo_client[config.DB_NAME]
+        mongo_client = create_mongo_client()
+    return mongo_client[settings.DB_NAME]
 
-# Optional: function to close connection (e.g. for graceful shutdown)
+# Access MongoDB database instance
+def get_database() -> AsyncIOMotorDatabase:
+    if mongo_client is None:
+        raise RuntimeError("MongoDB client not initialized. Call connect_to_mongo() first.")
+    return mongo_client[settings.DB_NAME]
+
+# Close the client on graceful shutdown
 async def close_mongo_connection():
+    global mongo_client
     if mongo_client:
         mongo_client.close()
+        mongo_client = None
@@ -0,0 +1,21 @@
+from typing import Awaitable, Callable, Optional, TypeVar
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+async def run_in_transaction(
+    client: AsyncIOMotorClient,
+    callback: Callable[[Optional[AsyncIOMotorClientSession]], Awaitable[T]],
+) -> T:
+    """
+    Run `callback(session)` inside a transaction. with_transaction retries the whole callback on
+    transient errors and unknown commit results, so it must be safe to re-run.
+    With MONGO_USE_TRANSACTIONS off (standalone servers) the callback gets session=None and its
+    writes are applied individually; callers keep unique indexes as the backstop for that mode.
+    """
+    if not settings.MONGO_USE_TRANSACTIONS:
+        return await callback(None)
+    async with await client.start_session() as session:
+        return await session.with_transaction(callback)
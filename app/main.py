@@ -2,7 +2,18 @@ from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
 from contextlib import asynccontextmanager
-from app.db.mongo import get_database, close_mongo_connection
+from app.db.mongo import connect_to_mongo, close_mongo_connection, get_pool_metrics
+from app.core.hashing import password_hasher, get_password_hash_metrics
+from app.services.video.view_counter import start_view_counter, stop_view_counter, get_view_counter
+from app.services.tag import start_tag_counter, stop_tag_counter, get_tag_counter
+from app.services.video.trending_ranker import start_trending_ranker, stop_trending_ranker, get_trending_ranker
+from app.services.video.video_room_hub import video_room_hub
+from app.core.pubsub import connect_pubsub, close_pubsub
+from app.services.matchmaking import start_matchmaking, stop_matchmaking, get_matchmaking_service
+from app.services.signaling import start_signaling, stop_signaling, get_signaling_relay
+from app.services.chat import chat_relay
+from app.services.presence import presence_tracker
+from app.core.presence import create_presence_backend
 import uuid
 import structlog
 
@@ -24,9 +35,21 @@ from app.api.auth.router import router as auth_router
 from app.api.video import router as video_router
 from app.api.comment.router import router as comment_router
 from app.api.like.router import router as like_router
+from app.api.follow.router import router as follow_router
 from app.api.user.router import router as user_router
 from app.api.websocket.router import router as websocket_router
-from app.api.deps import initialize_dependencies
+from app.api.admin.router import router as admin_router
+from app.api.search.router import router as search_router
+from app.api.tag.router import router as tag_router
+from app.api.message.router import router as message_router
+from app.api.presence.router import router as presence_router
+from app.api.deps import initialize_dependencies, shutdown_dependencies
+from app.db.indexes import bootstrap_indexes
+from app.repositories.video.video_repository import VideoRepository
+from app.repositories.user.user_profile import UserProfileRepository
+from app.repositories.message import MessageRepository
+from app.repositories.conversation import ConversationRepository
+from app.core.collections import CollectionName
 
 config = get_config()
 
@@ -37,10 +60,27 @@ async def lifespan(app: FastAPI):
 
     # Startup actions
     try:
-        db = get_database()
+        db = connect_to_mongo()
         await db.command("ping")  # Verifies connection is working
         logger.info("✅ MongoDB connected successfully.")
 
+        await bootstrap_indexes(db, mode=settings.MONGO_INDEX_MODE)
+        await VideoRepository(db[CollectionName.VIDEOS.value]).backfill_visibility(db[CollectionName.USER_PROFILES.value])
+        await UserProfileRepository(db[CollectionName.USER_PROFILES.value]).backfill_search_names()
+        start_view_counter(db)
+        start_tag_counter(db)
+        start_trending_ranker(db)
+        pubsub = connect_pubsub()
+        video_room_hub.start(pubsub)
+        start_matchmaking(db)
+        start_signaling(db, pubsub)
+        chat_relay.start(
+            pubsub,
+            MessageRepository(db[CollectionName.MESSAGES.value], db[CollectionName.CONVERSATIONS.value]),
+            ConversationRepository(db[CollectionName.CONVERSATIONS.value]),
+        )
+        presence_tracker.start(create_presence_backend(settings.PRESENCE_URL or settings.PUBSUB_URL))
+
         yield  # Application is running
     
     except Exception as e:
@@ -48,8 +88,20 @@ async def lifespan(app: FastAPI):
         raise
 
     finally:
+        await presence_tracker.stop()
+        await chat_relay.stop()
+        await stop_signaling()
+        await stop_matchmaking()
+        await video_room_hub.stop()
+        await close_pubsub()
+        await stop_view_counter()
+        await stop_tag_counter()
+        await stop_trending_ranker()
+        # Timeline fan-outs still in flight write to MongoDB, so they are drained before the client closes
+        await shutdown_dependencies()
         await close_mongo_connection()
         logger.info("MongoDB connection closed.")
+        password_hasher.shutdown()
 
 app = FastAPI(
     title="Reels API",
@@ -91,10 +143,53 @@ app.include_router(auth_router, prefix=f"{config.API_PREFIX}/auth", tags=["auth"
 app.include_router(video_router, prefix=f"{config.API_PREFIX}/videos", tags=["videos"])
 app.include_router(comment_router, prefix=f"{config.API_PREFIX}/comments", tags=["comments"])
 app.include_router(like_router, prefix=f"{config.API_PREFIX}/likes", tags=["likes"])
+app.include_router(follow_router, prefix=f"{config.API_PREFIX}/follows", tags=["follows"])
 app.include_router(user_router, prefix=f"{config.API_PREFIX}/users", tags=["users"])
 app.include_router(websocket_router, prefix=f"{config.API_PREFIX}/ws", tags=["websockets"])
+app.include_router(message_router, prefix=f"{config.API_PREFIX}/messages", tags=["messages"])
+app.include_router(presence_router, prefix=f"{config.API_PREFIX}/presence", tags=["presence"])
+app.include_router(tag_router, prefix=f"{config.API_PREFIX}/tags", tags=["tags"])
+app.include_router(search_router, prefix=f"{config.API_PREFIX}/search", tags=["search"])
+app.include_router(admin_router, prefix=f"{config.API_PREFIX}/admin", tags=["admin"])
 
 # --- Health Check Endpoint ---
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/health/db")
+async def db_pool_health():
+    return {"status": "healthy", "pool": get_pool_metrics()}
+
+@app.get("/health/auth")
+async def password_hash_pool_health():
+    return {"status": "healthy", "password_hashing": get_password_hash_metrics()}
+
+@app.get("/health/views")
+async def view_counter_health():
+    return {"status": "healthy", "views": get_view_counter().metrics()}
+
+@app.get("/health/tags")
+async def tag_counter_health():
+    return {"status": "healthy", "tags": get_tag_counter().metrics()}
+
+@app.get("/health/trending")
+async def trending_health():
+    ranker = get_trending_ranker()
+    return {"status": "healthy", "trending": ranker.metrics() if ranker else {"enabled": False}}
+
+@app.get("/health/matchmaking")
+async def matchmaking_health():
+    return {"status": "healthy", "matchmaking": get_matchmaking_service().metrics()}
+
+@app.get("/health/chat")
+async def chat_health():
+    return {"status": "healthy", "chat": chat_relay.metrics()}
+
+@app.get("/health/presence")
+async def presence_health():
+    return {"status": "healthy", "presence": presence_tracker.metrics()}
+
+@app.get("/health/signaling")
+async def signaling_health():
+    return {"status": "healthy", "signaling": get_signaling_relay().metrics()}
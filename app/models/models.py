@@ -1,5 +1,5 @@
 from pydantic import Field, EmailStr
-from typing import Optional, List, Any, Tuple
+from typing import Optional, List, Any, Tuple, Dict
 from base import DbBaseModel
 from datetime import datetime
 from uuid import UUID, uuid4
@@ -41,7 +41,9 @@ class Follow(DbBaseModel):
 
 class Tag(DbBaseModel):
     id: UUID = Field(default_factory=uuid4)
-    name: str
+    name: str  # Normalized, see app.core.tags; unique
+    usage_count: int = 0  # Published videos carrying the tag; maintained in batches by TagCounter
+    last_used_at: Optional[datetime] = None
 
 
 
@@ -85,6 +87,7 @@ class SignalingMessage(DbBaseModel):
 
 class Message(DbBaseModel):
     id: UUID = Field(default_factory=uuid4)
+    conversation_id: Optional[UUID] = None
     sender_user_id: UUID
     receiver_user_id: UUID
     text: str
@@ -100,6 +103,11 @@ class Conversation(DbBaseModel):
     user_ids: List[UUID]
     last_message_at: Optional[datetime]
     type: ConversationType = ConversationType.ONE_ON_ONE
+    pair_key: Optional[str] = None  # Both user_ids, sorted; unique, so two users share one one-on-one conversation
+    # Denormalized for the inbox, written in the same transaction as each message
+    last_message_preview: Optional[str] = None
+    last_sender_id: Optional[UUID] = None
+    unread_counts: Dict[str, int] = Field(default_factory=dict)  # str(user_id) -> unread messages
 
 
 # ---------------------- Matchmaking Queue ------------------- #
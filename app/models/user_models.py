@@ -33,6 +33,9 @@ class UserProfile(DbBaseModel):
     privacy_setting: PrivacySetting = PrivacySetting.FOLLOWERS_ONLY
     is_verified: bool = False
     uploaded_videos: List[UUID] = Field(default_factory=list)
+    follower_count: int = 0  # Denormalized; maintained by FollowRepository
+    following_count: int = 0
+    search_name: Optional[str] = None  # Lowercased display_name for prefix autocomplete; set by the repository
 
 class UserProfileUpdate(DbBaseModel):
     display_name: Optional[str] = None
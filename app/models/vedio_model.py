@@ -1,4 +1,4 @@
-from pydantic import Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, List, Any, Tuple
 from base import DbBaseModel
 from datetime import datetime
@@ -26,9 +26,13 @@ class Video(DbBaseModel):
     duration: Optional[float] = None
     upload_date: datetime = Field(default_factory=datetime.utcnow)
     views: int = 0
+    like_count: int = 0  # Denormalized; maintained by LikeRepository in the same transaction as the like
+    comment_count: int = 0  # Denormalized; maintained by CommentRepository
     privacy: PrivacySetting = PrivacySetting.FOLLOWERS_ONLY
+    visibility: Optional[PrivacySetting] = None  # `privacy` capped by the author's account setting; what feed queries filter on
     is_featured: bool = False
     status: VideoStatus = VideoStatus.PUBLISHED
+    draft_id: Optional[UUID] = None  # Draft this video was published from; unique, so a draft publishes once
 
 
 class VideoUploadRequest(DbBaseModel):      #or generating a presigned URL to upload to S3, unrelated to editing or publishing logic.
@@ -59,7 +63,29 @@ class VideoDraft(DbBaseModel):
     status: VideoStatus = VideoStatus.DRAFT
 
     finalized: bool = False
+    video_id: Optional[UUID] = None  # Set when the draft is claimed for publishing
+    finalize_idempotency_key: Optional[str] = None
 
 
+# ---------------------- Trending ---------------------------- #
 
-    
\ No newline at end of file
+class TrendingVideo(DbBaseModel):
+    """Materialized ranking row; visibility and user_id are copied so feed filters run on this collection."""
+    video_id: UUID
+    user_id: UUID
+    visibility: PrivacySetting
+    upload_date: datetime
+    score: float
+    computed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# ---------------------- Home Timeline ----------------------- #
+
+class TimelineEntry(BaseModel):
+    video_id: UUID
+    author_id: UUID
+    upload_date: datetime
+
+class Timeline(DbBaseModel):
+    user_id: UUID
+    entries: List[TimelineEntry] = Field(default_factory=list)  # Newest first, capped at TIMELINE_MAX_ENTRIES
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Type, Optional, List, Dict
+from typing import Generic, TypeVar, Type, Optional, List, Dict, AsyncIterator, Union
 from motor.motor_asyncio import AsyncIOMotorCollection
 from bson import ObjectId
 from app.models.base import DbBaseModel
@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 
 ModelType = TypeVar("ModelType", bound=DbBaseModel)
 
+DEFAULT_BATCH_SIZE = 500
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, collection: AsyncIOMotorCollection, model: Type[ModelType]):
         self.collection = collection
@@ -38,6 +40,42 @@ class BaseRepository(Generic[ModelType]):
             logger.error(f"[Find All] Failed for query={query}: {e}")
             raise
 
+    async def stream(
+        self,
+        query: Dict = None,
+        projection: Optional[Dict] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        raw: bool = False,
+    ) -> AsyncIterator[Union[ModelType, Dict]]:
+        """
+        Yield documents one at a time as the driver fetches them, `batch_size` per round-trip.
+        Use raw=True with a projection that drops required model fields.
+        """
+        query = query or {}
+        try:
+            cursor = self.collection.find(query, projection).batch_size(batch_size)
+            async for doc in cursor:
+                yield doc if raw else self.model(**doc)
+        except Exception as e:
+            logger.error(f"[Stream] Failed for query={query}: {e}")
+            raise
+
+    async def iter_batches(
+        self,
+        query: Dict = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        projection: Optional[Dict] = None,
+        raw: bool = False,
+    ) -> AsyncIterator[List[Union[ModelType, Dict]]]:
+        batch = []
+        async for item in self.stream(query, projection=projection, batch_size=batch_size, raw=raw):
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     async def create(self, data: Dict) -> ModelType:
         try:
             result = await self.collection.insert_one(data)
@@ -85,7 +123,8 @@ class BaseRepository(Generic[ModelType]):
 
     async def get_by_field(self, field: str, value) -> Optional[ModelType]:
         try:
-            result = await self.collection.find_one({field: str(value)})
+            # UUIDs are stored as native BSON UUIDs, so the value must not be stringified
+            result = await self.collection.find_one({field: value})
             return self.model(**result) if result else None
         except Exception as e:
             logger.error(f"[BaseRepository] Failed get_by_field {field}={value}: {e}")
@@ -93,7 +132,7 @@ class BaseRepository(Generic[ModelType]):
 
     async def delete_by_field(self, field: str, value) -> bool:
         try:
-            result = await self.collection.delete_one({field: str(value)})
+            result = await self.collection.delete_one({field: value})
             return result.deleted_count == 1
         except Exception as e:
             logger.error(f"[BaseRepository] Failed delete_by_field {field}={value}: {e}")
@@ -1,7 +1,87 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING
 from app.repositories.base import BaseRepository
 from app.models.models import Comment
-from app.core.collections import CollectionName
+from app.db.transactions import run_in_transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Newest comments first; id breaks ties between identical timestamps.
+COMMENT_SORT = [("created_at", DESCENDING), ("id", DESCENDING)]
+COMMENT_THREAD_INDEX = [("video_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]
+
 
 class CommentRepository(BaseRepository[Comment]):
-    def __init__(self):
-        super().__init__(CollectionName.COMMENTS.value)
+    def __init__(self, collection: AsyncIOMotorCollection, video_collection: AsyncIOMotorCollection):
+        super().__init__(collection, Comment)
+        self.video_collection = video_collection
+
+    async def add_comment(self, comment: Comment) -> Optional[Comment]:
+        """Insert the comment and bump the video's comment_count together; None if the video does not exist."""
+
+        async def apply(session=None):
+            result = await self.video_collection.update_one(
+                {"video_id": comment.video_id},
+                {"$inc": {"comment_count": 1}},
+                session=session,
+            )
+            if result.matched_count == 0:
+                return None
+            await self.collection.insert_one(comment.model_dump(), session=session)
+            return comment
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Add Comment] Failed for video_id={comment.video_id}: {e}")
+            raise
+
+    async def delete_comment(self, comment_id: UUID, user_id: UUID) -> Optional[Comment]:
+        """Delete a comment owned by `user_id` and decrement the count; None if nothing matched."""
+
+        async def apply(session=None):
+            doc = await self.collection.find_one_and_delete({"id": comment_id, "user_id": user_id}, session=session)
+            if not doc:
+                return None
+            await self.video_collection.update_one(
+                {"video_id": doc["video_id"]},
+                {"$inc": {"comment_count": -1}},
+                session=session,
+            )
+            return self.model(**doc)
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Delete Comment] Failed for comment_id={comment_id}: {e}")
+            raise
+
+    async def get_thread_page(
+        self,
+        video_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Comment], bool]:
+        """
+        Keyset pagination over one video's comments. `after` is the (created_at, id) of the last
+        comment on the previous page, so deep pages cost the same as the first one.
+        """
+        query = {"video_id": video_id}
+        if after:
+            created_at, comment_id = after
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "id": {"$lt": comment_id}},
+            ]
+        try:
+            cursor = self.collection.find(query).sort(COMMENT_SORT).limit(limit + 1)
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Comment Thread] Failed video_id={video_id} after={after} limit={limit}: {e}")
+            raise
@@ -1,7 +1,70 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING
 from app.repositories.base import BaseRepository
 from app.models.models import Conversation
-from app.core.collections import CollectionName
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Inbox: user_ids is an array, so this multikey index has one entry per participant,
+# each already in inbox order
+INBOX_INDEX = [("user_ids", ASCENDING), ("last_message_at", DESCENDING), ("id", DESCENDING)]
+
 
 class ConversationRepository(BaseRepository[Conversation]):
-    def __init__(self):
-        super().__init__(CollectionName.CONVERSATIONS.value)
+    def __init__(self, collection: AsyncIOMotorCollection):
+        super().__init__(collection, Conversation)
+
+    async def get_inbox_page(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Conversation], bool]:
+        """Most recently active first; each row carries its own preview and unread counts."""
+        # Rows without last_message_at cannot be ordered or resumed from, so they stay out of the inbox
+        query = {"user_ids": user_id, "last_message_at": {"$ne": None}}
+        if after:
+            last_message_at, conversation_id = after
+            query["$or"] = [
+                {"last_message_at": {"$lt": last_message_at}},
+                {"last_message_at": last_message_at, "id": {"$lt": conversation_id}},
+            ]
+        try:
+            cursor = (
+                self.collection.find(query)
+                .sort([("last_message_at", DESCENDING), ("id", DESCENDING)])
+                .limit(limit + 1)
+            )
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Inbox] Failed user_id={user_id} after={after}: {e}")
+            raise
+
+    async def backfill_last_message_at(self) -> int:
+        """
+        Conversations created before the inbox existed sort by when they were last updated. No index
+        leads with last_message_at, so this scans the collection: it is a one-off migration run from
+        the admin API, not a startup step.
+        """
+        try:
+            result = await self.collection.update_many(
+                {"last_message_at": None},
+                [{"$set": {"last_message_at": {"$ifNull": ["$updated_at", "$created_at"]}}}],
+            )
+            if result.modified_count:
+                logger.info(f"[Inbox Backfill] Set last_message_at on {result.modified_count} conversations")
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"[Inbox Backfill] Failed: {e}")
+            raise
+
+    async def get_for_participant(self, conversation_id: UUID, user_id: UUID) -> Optional[Conversation]:
+        """The conversation, only if `user_id` takes part in it."""
+        doc = await self.collection.find_one({"id": conversation_id, "user_ids": user_id})
+        return self.model(**doc) if doc else None
@@ -1,7 +1,165 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING
 from app.repositories.base import BaseRepository
 from app.models.models import Follow
-from app.core.collections import CollectionName
+from app.db.transactions import run_in_transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+# One edge per (follower, following). The unique index also serves "who does X follow" lookups.
+FOLLOW_EDGE_INDEX = [("follower_user_id", ASCENDING), ("following_user_id", ASCENDING)]
+# Newest first in both directions; the other endpoint breaks ties between identical timestamps.
+FOLLOWERS_INDEX = [("following_user_id", ASCENDING), ("created_at", DESCENDING), ("follower_user_id", DESCENDING)]
+FOLLOWING_INDEX = [("follower_user_id", ASCENDING), ("created_at", DESCENDING), ("following_user_id", DESCENDING)]
+
 
 class FollowRepository(BaseRepository[Follow]):
-    def __init__(self):
-        super().__init__(CollectionName.FOLLOWS.value)
+    """
+    Follow edges live in their own collection; each profile carries denormalized follower_count
+    and following_count, written in the same transaction as the edge so they never drift.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, profile_collection: AsyncIOMotorCollection):
+        super().__init__(collection, Follow)
+        self.profile_collection = profile_collection
+
+    async def _bump_counts(self, follower_id: UUID, following_id: UUID, delta: int, session=None) -> Optional[int]:
+        """Adjust both counters; returns the followed user's new follower_count, or None if they have no profile."""
+        result = await self.profile_collection.update_one(
+            {"user_id": following_id},
+            {"$inc": {"follower_count": delta}},
+            session=session,
+        )
+        if result.matched_count == 0:
+            return None
+        await self.profile_collection.update_one(
+            {"user_id": follower_id},
+            {"$inc": {"following_count": delta}},
+            session=session,
+        )
+        doc = await self.profile_collection.find_one({"user_id": following_id}, {"follower_count": 1, "_id": 0}, session=session)
+        return doc.get("follower_count", 0) if doc else 0
+
+    async def _follower_count(self, user_id: UUID, session=None) -> Optional[int]:
+        doc = await self.profile_collection.find_one({"user_id": user_id}, {"follower_count": 1, "_id": 0}, session=session)
+        return doc.get("follower_count", 0) if doc else None
+
+    async def follow(self, follower_id: UUID, following_id: UUID) -> Optional[Tuple[bool, int]]:
+        """Returns (changed, follower_count of the followed user), or None if they have no profile."""
+        edge = Follow(follower_user_id=follower_id, following_user_id=following_id)
+
+        async def apply(session=None):
+            result = await self.collection.update_one(
+                {"follower_user_id": follower_id, "following_user_id": following_id},
+                {"$setOnInsert": edge.model_dump()},
+                upsert=True,
+                session=session,
+            )
+            if result.upserted_id is None:
+                count = await self._follower_count(following_id, session=session)
+                return None if count is None else (False, count)
+            count = await self._bump_counts(follower_id, following_id, 1, session=session)
+            if count is None:
+                await self.collection.delete_one({"_id": result.upserted_id}, session=session)
+                return None
+            return True, count
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Follow] Failed follower={follower_id} following={following_id}: {e}")
+            raise
+
+    async def unfollow(self, follower_id: UUID, following_id: UUID) -> Optional[Tuple[bool, int]]:
+        """Returns (changed, follower_count of the unfollowed user), or None if they have no profile."""
+
+        async def apply(session=None):
+            result = await self.collection.delete_one(
+                {"follower_user_id": follower_id, "following_user_id": following_id},
+                session=session,
+            )
+            if result.deleted_count == 0:
+                count = await self._follower_count(following_id, session=session)
+                return None if count is None else (False, count)
+            count = await self._bump_counts(follower_id, following_id, -1, session=session)
+            return None if count is None else (True, count)
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Unfollow] Failed follower={follower_id} following={following_id}: {e}")
+            raise
+
+    async def following_ids(self, user_id: UUID) -> Set[UUID]:
+        """Everyone `user_id` follows, read from the edge index only (covered query)."""
+        try:
+            cursor = self.collection.find(
+                {"follower_user_id": user_id},
+                {"following_user_id": 1, "_id": 0},
+            )
+            return {doc["following_user_id"] async for doc in cursor}
+        except Exception as e:
+            logger.error(f"[Following IDs] Failed user_id={user_id}: {e}")
+            raise
+
+    async def follower_id_batches(self, user_id: UUID, batch_size: int) -> AsyncIterator[List[UUID]]:
+        """Stream everyone following `user_id` in batches, covered by the followers index."""
+        async for batch in self.iter_batches(
+            {"following_user_id": user_id},
+            batch_size=batch_size,
+            projection={"follower_user_id": 1, "_id": 0},
+            raw=True,
+        ):
+            yield [doc["follower_user_id"] for doc in batch]
+
+    async def get_followers_page(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Follow], bool]:
+        return await self._page("following_user_id", "follower_user_id", user_id, after, limit)
+
+    async def get_following_page(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Follow], bool]:
+        return await self._page("follower_user_id", "following_user_id", user_id, after, limit)
+
+    async def _page(
+        self,
+        owner_field: str,
+        other_field: str,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+    ) -> Tuple[List[Follow], bool]:
+        """
+        Keyset pagination over one side of the graph. `after` is the (created_at, other user_id)
+        of the last edge on the previous page, so deep pages cost the same as the first one.
+        """
+        query = {owner_field: user_id}
+        if after:
+            created_at, other_id = after
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, other_field: {"$lt": other_id}},
+            ]
+        try:
+            cursor = (
+                self.collection.find(query)
+                .sort([("created_at", DESCENDING), (other_field, DESCENDING)])
+                .limit(limit + 1)
+            )
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Follow Page] Failed {owner_field}={user_id} after={after} limit={limit}: {e}")
+            raise
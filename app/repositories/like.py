@@ -1,7 +1,93 @@
+from typing import List, Optional, Set, Tuple
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
 from app.repositories.base import BaseRepository
 from app.models.models import Like
-from app.core.collections import CollectionName
+from app.db.transactions import run_in_transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class LikeRepository(BaseRepository[Like]):
-    def __init__(self):
-        super().__init__(CollectionName.LIKES.value)
+    """
+    Likes live in their own collection (unique on user_id + video_id) and each video carries a
+    denormalized like_count. Both are written in one transaction so the count never drifts.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, video_collection: AsyncIOMotorCollection):
+        super().__init__(collection, Like)
+        self.video_collection = video_collection
+
+    async def _bump_like_count(self, video_id: UUID, delta: int, session=None) -> Optional[int]:
+        doc = await self.video_collection.find_one_and_update(
+            {"video_id": video_id},
+            {"$inc": {"like_count": delta}},
+            projection={"like_count": 1, "_id": 0},
+            return_document=ReturnDocument.AFTER,
+            session=session,
+        )
+        return doc.get("like_count", 0) if doc else None
+
+    async def _like_count(self, video_id: UUID, session=None) -> Optional[int]:
+        doc = await self.video_collection.find_one({"video_id": video_id}, {"like_count": 1, "_id": 0}, session=session)
+        return doc.get("like_count", 0) if doc else None
+
+    async def like(self, user_id: UUID, video_id: UUID) -> Optional[Tuple[bool, int]]:
+        """Returns (changed, like_count), or None if the video does not exist. Liking twice is a no-op."""
+        like = Like(user_id=user_id, video_id=video_id)
+
+        async def apply(session=None):
+            result = await self.collection.update_one(
+                {"user_id": user_id, "video_id": video_id},
+                {"$setOnInsert": like.model_dump()},
+                upsert=True,
+                session=session,
+            )
+            if result.upserted_id is None:
+                count = await self._like_count(video_id, session=session)
+                return None if count is None else (False, count)
+            count = await self._bump_like_count(video_id, 1, session=session)
+            if count is None:
+                # Unknown video: undo the insert (the transaction would roll it back anyway)
+                await self.collection.delete_one({"_id": result.upserted_id}, session=session)
+                return None
+            return True, count
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Like] Failed user_id={user_id} video_id={video_id}: {e}")
+            raise
+
+    async def unlike(self, user_id: UUID, video_id: UUID) -> Optional[Tuple[bool, int]]:
+        """Returns (changed, like_count), or None if the video does not exist."""
+
+        async def apply(session=None):
+            result = await self.collection.delete_one({"user_id": user_id, "video_id": video_id}, session=session)
+            if result.deleted_count == 0:
+                count = await self._like_count(video_id, session=session)
+                return None if count is None else (False, count)
+            count = await self._bump_like_count(video_id, -1, session=session)
+            return None if count is None else (True, count)
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Unlike] Failed user_id={user_id} video_id={video_id}: {e}")
+            raise
+
+    async def liked_video_ids(self, user_id: UUID, video_ids: List[UUID]) -> Set[UUID]:
+        """One indexed $in query answering "did I like this" for a whole page of videos."""
+        if not video_ids:
+            return set()
+        try:
+            cursor = self.collection.find(
+                {"user_id": user_id, "video_id": {"$in": video_ids}},
+                {"video_id": 1, "_id": 0},
+            )
+            return {doc["video_id"] async for doc in cursor}
+        except Exception as e:
+            logger.error(f"[Liked Video IDs] Failed user_id={user_id}: {e}")
+            raise
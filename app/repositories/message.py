@@ -1,7 +1,187 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID, uuid4
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateMany, UpdateOne
 from app.repositories.base import BaseRepository
-from app.models.models import Message
-from app.core.collections import CollectionName
+from app.models.models import Conversation, Message
+from app.core.enums import ConversationType
+from app.db.transactions import run_in_transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+# History pages, newest first; id breaks ties between identical timestamps
+MESSAGE_HISTORY_INDEX = [("conversation_id", ASCENDING), ("timestamp", DESCENDING), ("id", DESCENDING)]
+# Polling fallback: everything a user received after a cursor, oldest first
+MESSAGE_SYNC_INDEX = [("receiver_user_id", ASCENDING), ("timestamp", ASCENDING), ("id", ASCENDING)]
+PREVIEW_LENGTH = 100
+
+
+def pair_key(first: UUID, second: UUID) -> str:
+    return ":".join(sorted((str(first), str(second))))
+
 
 class MessageRepository(BaseRepository[Message]):
-    def __init__(self):
-        super().__init__(CollectionName.MESSAGES.value)
+    """
+    Messages live in their own collection, keyed by conversation. Sending writes the message and
+    the conversation's inbox fields (last_message_at, preview, the receiver's unread count) in one
+    transaction, so the inbox never shows a conversation out of step with its history.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, conversation_collection: AsyncIOMotorCollection):
+        super().__init__(collection, Message)
+        self.conversation_collection = conversation_collection
+
+    async def send_direct(self, message: Message) -> Tuple[Message, Conversation]:
+        """Append a one-on-one message, creating the pair's conversation on first contact."""
+        sender, receiver = message.sender_user_id, message.receiver_user_id
+
+        async def apply(session=None):
+            doc = await self.conversation_collection.find_one_and_update(
+                {"pair_key": pair_key(sender, receiver)},
+                {
+                    "$setOnInsert": {
+                        "id": uuid4(),
+                        "user_ids": [sender, receiver],
+                        "type": ConversationType.ONE_ON_ONE.value,
+                        "created_at": message.timestamp,
+                        f"unread_counts.{sender}": 0,
+                    },
+                    # $max keeps the newest time when concurrent sends commit out of order
+                    "$max": {"last_message_at": message.timestamp},
+                    "$set": {
+                        "last_message_preview": message.text[:PREVIEW_LENGTH],
+                        "last_sender_id": sender,
+                        "updated_at": message.timestamp,
+                    },
+                    "$inc": {f"unread_counts.{receiver}": 1},
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+                session=session,
+            )
+            message.conversation_id = doc["id"]
+            await self.collection.insert_one(message.model_dump(), session=session)
+            return message, Conversation(**doc)
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Send Message] Failed sender={sender} receiver={receiver}: {e}")
+            raise
+
+    async def get_history_page(
+        self,
+        conversation_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Message], bool]:
+        """Newest first; `after` is the (timestamp, id) of the oldest message on the previous page."""
+        query = {"conversation_id": conversation_id}
+        if after:
+            timestamp, message_id = after
+            query["$or"] = [
+                {"timestamp": {"$lt": timestamp}},
+                {"timestamp": timestamp, "id": {"$lt": message_id}},
+            ]
+        try:
+            cursor = (
+                self.collection.find(query)
+                .sort([("timestamp", DESCENDING), ("id", DESCENDING)])
+                .limit(limit + 1)
+            )
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Message History] Failed conversation_id={conversation_id} after={after}: {e}")
+            raise
+
+    async def get_received_since(
+        self,
+        user_id: UUID,
+        after: Tuple[datetime, UUID],
+        limit: int = 100,
+    ) -> Tuple[List[Message], bool]:
+        """Messages `user_id` received after the (timestamp, id) position, oldest first."""
+        timestamp, message_id = after
+        query = {
+            "receiver_user_id": user_id,
+            "$or": [
+                {"timestamp": {"$gt": timestamp}},
+                {"timestamp": timestamp, "id": {"$gt": message_id}},
+            ],
+        }
+        try:
+            cursor = (
+                self.collection.find(query)
+                .sort([("timestamp", ASCENDING), ("id", ASCENDING)])
+                .limit(limit + 1)
+            )
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Message Sync] Failed user_id={user_id} after={after}: {e}")
+            raise
+
+    async def mark_read_many(self, reads: List[Tuple[UUID, UUID, datetime]]) -> int:
+        """
+        Apply a batch of (conversation_id, reader_id, read_at) receipts: one bulk of update_many on
+        messages and one bulk of unread resets on conversations, in a single transaction.
+        """
+        if not reads:
+            return 0
+        message_updates = [
+            UpdateMany(
+                {"conversation_id": conversation_id, "receiver_user_id": reader_id, "read": False, "timestamp": {"$lte": read_at}},
+                {"$set": {"read": True, "read_at": read_at}},
+            )
+            for conversation_id, reader_id, read_at in reads
+        ]
+        conversation_updates = [
+            UpdateOne({"id": conversation_id, "user_ids": reader_id}, {"$set": {f"unread_counts.{reader_id}": 0}})
+            for conversation_id, reader_id, _ in reads
+        ]
+
+        async def apply(session=None):
+            result = await self.collection.bulk_write(message_updates, ordered=False, session=session)
+            await self.conversation_collection.bulk_write(conversation_updates, ordered=False, session=session)
+            return result.modified_count
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Mark Read] Batch of {len(reads)} receipts failed: {e}")
+            raise
+
+    async def mark_read(self, conversation_id: UUID, user_id: UUID, read_at: datetime) -> int:
+        """
+        Mark what `user_id` had received up to `read_at` as read with one update_many, and zero their
+        unread count in the same transaction. Returns the number of messages marked.
+        """
+
+        async def apply(session=None):
+            result = await self.collection.update_many(
+                {
+                    "conversation_id": conversation_id,
+                    "receiver_user_id": user_id,
+                    "read": False,
+                    "timestamp": {"$lte": read_at},
+                },
+                {"$set": {"read": True, "read_at": read_at}},
+                session=session,
+            )
+            await self.conversation_collection.update_one(
+                {"id": conversation_id, "user_ids": user_id},
+                {"$set": {f"unread_counts.{user_id}": 0}},
+                session=session,
+            )
+            return result.modified_count
+
+        try:
+            return await run_in_transaction(self.collection.database.client, apply)
+        except Exception as e:
+            logger.error(f"[Mark Read] Failed conversation_id={conversation_id} user_id={user_id}: {e}")
+            raise
@@ -1,7 +1,76 @@
+import re
+from datetime import datetime
+from typing import Dict, List
+from uuid import uuid4
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 from app.repositories.base import BaseRepository
 from app.models.models import Tag
-from app.core.collections import CollectionName
+import logging
+
+logger = logging.getLogger(__name__)
+
+TAG_NAME_INDEX = [("name", ASCENDING)]
+# Loads the vocabulary snapshot most used first; name breaks ties so the order is stable
+TAG_USAGE_INDEX = [("usage_count", DESCENDING), ("name", ASCENDING)]
+
 
 class TagRepository(BaseRepository[Tag]):
-    def __init__(self):
-        super().__init__(CollectionName.TAGS.value)
+    def __init__(self, collection: AsyncIOMotorCollection):
+        super().__init__(collection, Tag)
+
+    async def increment_usage(self, counts: Dict[str, int]) -> int:
+        """Apply buffered usage deltas in one unordered bulk write, creating tags seen for the first time."""
+        if not counts:
+            return 0
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"name": name},
+                {
+                    "$inc": {"usage_count": delta},
+                    "$set": {"last_used_at": now, "updated_at": now},
+                    "$setOnInsert": {"id": uuid4(), "created_at": now},
+                },
+                upsert=True,
+            )
+            for name, delta in counts.items()
+        ]
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            return result.modified_count + result.upserted_count
+        except Exception as e:
+            logger.error(f"[Tag Usage] Failed for {len(counts)} tags: {e}")
+            raise
+
+    async def get_by_name(self, name: str) -> Tag | None:
+        doc = await self.collection.find_one({"name": name})
+        return self.model(**doc) if doc else None
+
+    async def get_most_used(self, limit: int) -> List[Dict]:
+        """Name and usage_count of the `limit` most used tags, read in index order."""
+        try:
+            cursor = (
+                self.collection
+                .find({}, {"_id": 0, "name": 1, "usage_count": 1})
+                .sort(TAG_USAGE_INDEX)
+                .limit(limit)
+            )
+            return await cursor.to_list(length=limit)
+        except Exception as e:
+            logger.error(f"[Tag Vocabulary] Failed limit={limit}: {e}")
+            raise
+
+    async def find_by_prefix(self, prefix: str, limit: int) -> List[Dict]:
+        """Anchored prefix match on the unique name index; only used for tags outside the cached vocabulary."""
+        try:
+            cursor = (
+                self.collection
+                .find({"name": {"$regex": f"^{re.escape(prefix)}"}}, {"_id": 0, "name": 1, "usage_count": 1})
+                .sort(TAG_NAME_INDEX)
+                .limit(limit)
+            )
+            return await cursor.to_list(length=limit)
+        except Exception as e:
+            logger.error(f"[Tag Prefix] Failed prefix='{prefix}': {e}")
+            raise
@@ -0,0 +1,50 @@
+from typing import List
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from app.repositories.base import BaseRepository
+from app.models.vedio_model import Timeline, TimelineEntry
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TimelineRepository(BaseRepository[Timeline]):
+    """
+    One document per user holding their home timeline as a bounded array, newest first.
+    Reading the home feed is a single point lookup on the unique user_id index.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, max_entries: int):
+        super().__init__(collection, Timeline)
+        self.max_entries = max_entries
+
+    async def push_entry(self, user_ids: List[UUID], entry: TimelineEntry) -> int:
+        """Prepend `entry` to each user's timeline in one unordered bulk write; returns timelines touched."""
+        if not user_ids:
+            return 0
+        push = {
+            "$push": {
+                "entries": {
+                    "$each": [entry.model_dump()],
+                    # Keep the array sorted and capped even when fan-outs finish out of order
+                    "$sort": {"upload_date": -1},
+                    "$slice": self.max_entries,
+                }
+            }
+        }
+        operations = [UpdateOne({"user_id": user_id}, push, upsert=True) for user_id in user_ids]
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            return result.modified_count + result.upserted_count
+        except Exception as e:
+            logger.error(f"[Timeline Push] Failed for video_id={entry.video_id} to {len(user_ids)} timelines: {e}")
+            raise
+
+    async def get_entries(self, user_id: UUID) -> List[TimelineEntry]:
+        try:
+            doc = await self.collection.find_one({"user_id": user_id}, {"entries": 1, "_id": 0})
+            return [TimelineEntry(**entry) for entry in (doc or {}).get("entries", [])]
+        except Exception as e:
+            logger.error(f"[Timeline Entries] Failed user_id={user_id}: {e}")
+            raise
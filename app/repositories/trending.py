@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from app.repositories.base import BaseRepository
+from app.models.vedio_model import TrendingVideo
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRENDING_SORT = [("score", DESCENDING), ("video_id", DESCENDING)]
+# One index per branch of a visibility filter, each ending in the page order
+TRENDING_VISIBILITY_INDEX = [("visibility", ASCENDING), ("score", DESCENDING), ("video_id", DESCENDING)]
+TRENDING_AUTHOR_INDEX = [("user_id", ASCENDING), ("score", DESCENDING), ("video_id", DESCENDING)]
+
+
+class TrendingRepository(BaseRepository[TrendingVideo]):
+    """
+    Precomputed trending scores, one row per video in the ranking window. The ranking job
+    upserts the rows whose inputs changed and deletes those that left the window; feeds only
+    ever read an index range.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        super().__init__(collection, TrendingVideo)
+
+    async def upsert_scores(self, rows: List[TrendingVideo]) -> int:
+        if not rows:
+            return 0
+        # $max keeps computed_at from moving backwards when a slower, older run lands last
+        operations = [
+            UpdateOne(
+                {"video_id": row.video_id},
+                {"$set": row.model_dump(exclude={"created_at", "computed_at"}), "$max": {"computed_at": row.computed_at}},
+                upsert=True,
+            )
+            for row in rows
+        ]
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            return result.modified_count + result.upserted_count
+        except Exception as e:
+            logger.error(f"[Trending Upsert] Failed for {len(rows)} rows: {e}")
+            raise
+
+    async def delete_by_video_ids(self, video_ids: List[UUID]) -> int:
+        if not video_ids:
+            return 0
+        try:
+            result = await self.collection.delete_many({"video_id": {"$in": video_ids}})
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"[Trending Delete] Failed for {len(video_ids)} video_ids: {e}")
+            raise
+
+    async def prune(self, computed_before: datetime) -> int:
+        """Drop rows a full rebuild did not rescore: aged out of the window, unpublished or deleted."""
+        try:
+            result = await self.collection.delete_many({"computed_at": {"$lt": computed_before}})
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"[Trending Prune] Failed computed_before={computed_before}: {e}")
+            raise
+
+    async def get_page(
+        self,
+        after: Optional[Tuple[float, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[TrendingVideo], bool]:
+        """Highest score first; `after` is the (score, video_id) of the last row on the previous page."""
+        clauses: List[Dict[str, Any]] = []
+        if visibility:
+            clauses.append(visibility)
+        if after:
+            score, video_id = after
+            clauses.append({"$or": [
+                {"score": {"$lt": score}},
+                {"score": score, "video_id": {"$lt": video_id}},
+            ]})
+        query = clauses[0] if len(clauses) == 1 else ({"$and": clauses} if clauses else {})
+        try:
+            cursor = self.collection.find(query).sort(TRENDING_SORT).limit(limit + 1)
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Trending Page] Failed after={after} limit={limit}: {e}")
+            raise
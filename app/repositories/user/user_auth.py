@@ -3,6 +3,7 @@ from app.models.user_models import UserAuth
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorCollection
 from uuid import UUID
+from datetime import datetime
 import logging
 from fastapi import HTTPException, status
 
@@ -36,6 +37,18 @@ class UserAuthRepository(BaseRepository[UserAuth]):
             logger.error(f"[Get User by Email] Error while fetching user by email: {email} — Error: {e}")
             return None
 
+    async def update_password_hash(self, user_id: UUID, hashed_password: str) -> bool:
+        try:
+            result = await self.collection.update_one(
+                {"user_id": user_id},
+                {"$set": {"hashed_password": hashed_password, "updated_at": datetime.utcnow()}},
+            )
+            return result.modified_count == 1
+        except Exception as e:
+            # A failed rehash only means the old cost factor is kept until the next login
+            logger.error(f"[Update Password Hash] Failed for user_id={user_id} — Error: {e}")
+            return False
+
     async def delete_user(self, userId: UUID) -> bool:
         try:
             result = await self.collection.delete_one({"id": str(userId)})
@@ -1,19 +1,34 @@
-from typing import List, Optional, Dict
+import re
+from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, TEXT, UpdateOne
 from app.models.user_models import UserProfile
 from app.repositories.base import BaseRepository
 from app.core.collections import CollectionName
+from app.core.enums import PrivacySetting
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keyword search over names and bios; a name match ranks well above a bio mention
+PROFILE_TEXT_INDEX = [("display_name", TEXT), ("bio", TEXT)]
+PROFILE_TEXT_WEIGHTS = {"display_name": 10, "bio": 1}
+# Autocomplete is an anchored prefix range on this index rather than a regex scan
+PROFILE_SEARCH_NAME_INDEX = [("search_name", ASCENDING)]
+
+
+def search_name(display_name: str) -> str:
+    return display_name.strip().lower()
+
+
 class UserProfileRepository(BaseRepository[UserProfile]):
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, UserProfile)
 
     async def create(self, profile_data: UserProfile) -> UserProfile:
         try:
+            profile_data.search_name = search_name(profile_data.display_name)
             await self.collection.insert_one(profile_data.model_dump(by_alias=True))
             logger.info(f"[Create Profile] Successfully created profile for user_id={profile_data.user_id}")
             return profile_data
@@ -22,6 +37,8 @@ class UserProfileRepository(BaseRepository[UserProfile]):
             raise
 
     async def update_profile(self, user_id: UUID, updates: dict) -> Optional[UserProfile]:
+        if updates.get("display_name"):
+            updates = {**updates, "search_name": search_name(updates["display_name"])}
         try:
             result = await self.collection.update_one({"user_id": user_id}, {"$set": updates})
             if result.modified_count == 0:
@@ -33,14 +50,70 @@ class UserProfileRepository(BaseRepository[UserProfile]):
             logger.error(f"[Update Profile] Failed to update profile for user_id={user_id}: {e}")
             raise
 
+    async def get_summaries_by_user_ids(self, user_ids: List[UUID]) -> Dict[UUID, Dict]:
+        """
+        Fetch the display fields for many users in one $in query, keyed by user_id.
+        Used to hydrate authors on list pages instead of one lookup per row.
+        """
+        if not user_ids:
+            return {}
+        try:
+            cursor = self.collection.find(
+                {"user_id": {"$in": list(set(user_ids))}},
+                {"_id": 0, "user_id": 1, "display_name": 1, "profile_picture_url": 1, "is_verified": 1},
+            )
+            return {doc["user_id"]: doc async for doc in cursor}
+        except Exception as e:
+            logger.error(f"[Profile Summaries] Failed for {len(user_ids)} user_ids: {e}")
+            raise
+
+    async def get_privacy_setting(self, user_id: UUID) -> Optional[PrivacySetting]:
+        doc = await self.collection.find_one({"user_id": user_id}, {"privacy_setting": 1, "_id": 0})
+        return PrivacySetting(doc["privacy_setting"]) if doc and doc.get("privacy_setting") else None
+
+    async def get_privacy_settings(self, user_ids: List[UUID]) -> Dict[UUID, PrivacySetting]:
+        """Account privacy for many users in one $in query; users without a profile are left out."""
+        if not user_ids:
+            return {}
+        try:
+            cursor = self.collection.find(
+                {"user_id": {"$in": list(set(user_ids))}},
+                {"_id": 0, "user_id": 1, "privacy_setting": 1},
+            )
+            return {
+                doc["user_id"]: PrivacySetting(doc.get("privacy_setting") or UserProfile.model_fields["privacy_setting"].default)
+                async for doc in cursor
+            }
+        except Exception as e:
+            logger.error(f"[Privacy Settings] Failed for {len(user_ids)} user_ids: {e}")
+            raise
+
+    async def get_follower_count(self, user_id: UUID) -> int:
+        doc = await self.collection.find_one({"user_id": user_id}, {"follower_count": 1, "_id": 0})
+        return (doc or {}).get("follower_count", 0)
+
+    async def get_user_ids_with_min_followers(self, min_followers: int) -> List[UUID]:
+        """Users at or above `min_followers`, read from the follower_count index."""
+        try:
+            cursor = self.collection.find(
+                {"follower_count": {"$gte": min_followers}},
+                {"user_id": 1, "_id": 0},
+            )
+            return [doc["user_id"] async for doc in cursor]
+        except Exception as e:
+            logger.error(f"[Large Creators] Failed min_followers={min_followers}: {e}")
+            raise
+
     async def search(self, query: str, skip: int = 0, limit: int = 10) -> List[UserProfile]:
         """
-        Perform a case-insensitive regex search on display_name.
+        Relevance-ranked keyword search on display_name and bio, served by the text index.
+        Kept for the offset-based /users/search endpoint; new callers should use search_page.
         """
         try:
             cursor = (
                 self.collection
-                .find({"display_name": {"$regex": query, "$options": "i"}})
+                .find({"$text": {"$search": query}}, {"score": {"$meta": "textScore"}})
+                .sort([("score", {"$meta": "textScore"})])
                 .skip(skip)
                 .limit(limit)
             )
@@ -50,3 +123,76 @@ class UserProfileRepository(BaseRepository[UserProfile]):
         except Exception as e:
             logger.error(f"[Search Profiles] Search failed for query='{query}': {e}")
             raise
+
+    async def search_page(
+        self,
+        text: str,
+        after: Optional[Tuple[float, UUID]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Tuple[UserProfile, float]], bool]:
+        """Keyset-paginated text search; `after` is the (score, user_id) of the last hit on the previous page."""
+        pipeline: List[Dict] = [
+            {"$match": {"$text": {"$search": text}}},
+            {"$addFields": {"_score": {"$meta": "textScore"}}},
+        ]
+        if after:
+            score, user_id = after
+            pipeline.append({"$match": {"$or": [
+                {"_score": {"$lt": score}},
+                {"_score": score, "user_id": {"$lt": user_id}},
+            ]}})
+        pipeline += [{"$sort": {"_score": -1, "user_id": -1}}, {"$limit": limit + 1}]
+        try:
+            docs = await self.collection.aggregate(pipeline).to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [(UserProfile(**doc), doc["_score"]) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Search Profiles] Failed text='{text}' after={after}: {e}")
+            raise
+
+    async def autocomplete(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """
+        Display fields of users whose name starts with `prefix`. The anchored, case-sensitive regex
+        on the lowercased search_name compiles to an index range, so cost tracks `limit`, not collection size.
+        """
+        key = search_name(prefix)
+        if not key:
+            return []
+        try:
+            cursor = (
+                self.collection
+                .find(
+                    {"search_name": {"$regex": f"^{re.escape(key)}"}},
+                    {"_id": 0, "user_id": 1, "display_name": 1, "profile_picture_url": 1, "is_verified": 1, "follower_count": 1},
+                )
+                .sort(PROFILE_SEARCH_NAME_INDEX)
+                .limit(limit)
+            )
+            return [doc async for doc in cursor]
+        except Exception as e:
+            logger.error(f"[Autocomplete Profiles] Failed prefix='{prefix}': {e}")
+            raise
+
+    async def backfill_search_names(self, batch_size: int = 1000) -> int:
+        """
+        Fill search_name on profiles created before it existed. Runs at startup; once every profile
+        has one, the probe is a single miss on the search_name index.
+        """
+        if await self.collection.find_one({"search_name": None}, {"_id": 1}) is None:
+            return 0
+        updated = 0
+        try:
+            cursor = self.collection.find({"search_name": None}, {"_id": 1, "display_name": 1})
+            batch: List[UpdateOne] = []
+            async for doc in cursor:
+                batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"search_name": search_name(doc.get("display_name") or "")}}))
+                if len(batch) >= batch_size:
+                    updated += (await self.collection.bulk_write(batch, ordered=False)).modified_count
+                    batch = []
+            if batch:
+                updated += (await self.collection.bulk_write(batch, ordered=False)).modified_count
+            logger.info(f"[Search Name Backfill] Updated {updated} profiles")
+            return updated
+        except Exception as e:
+            logger.error(f"[Search Name Backfill] Failed after {updated} profiles: {e}")
+            raise
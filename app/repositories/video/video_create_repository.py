@@ -3,7 +3,12 @@
 from app.models.vedio_model import VideoDraft, Video
 from app.repositories.base import BaseRepository
 from app.repositories.video.video_repository import VideoRepository
+from app.db.transactions import run_in_transaction
+from app.core.enums import VideoStatus
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+from datetime import datetime
+from typing import Callable, Optional, Tuple
 from uuid import UUID
 
 class VideoCreateRepository:
@@ -43,6 +48,52 @@ class VideoCreateRepository:
     async def create_video(self, video: Video) -> Video:
         return await self.video_repo.create_video(video)
 
+    async def finalize_draft(
+        self,
+        draft_id: UUID,
+        user_id: UUID,
+        video_id: UUID,
+        build_video: Callable[[VideoDraft], Video],
+        idempotency_key: Optional[str] = None,
+    ) -> Optional[Tuple[Video, VideoDraft]]:
+        """
+        Atomically claim an unfinalized draft and insert the video built from it. The claim filters on
+        finalized=False, so only one concurrent finalize can win; the insert shares its transaction.
+        Returns None when the draft does not exist, belongs to someone else, or was already finalized.
+        """
+        claim_filter = {"draft_id": draft_id, "user_id": user_id, "finalized": False}
+        claim_update = {"$set": {
+            "finalized": True,
+            "status": VideoStatus.PUBLISHED.value,
+            "video_id": video_id,
+            "finalize_idempotency_key": idempotency_key,
+            "updated_at": datetime.utcnow(),
+        }}
+
+        async def claim_and_insert(session=None) -> Optional[Tuple[Video, VideoDraft]]:
+            doc = await self.draft_collection.find_one_and_update(
+                claim_filter, claim_update, return_document=ReturnDocument.AFTER, session=session
+            )
+            if not doc:
+                return None
+            draft = self.map_draft(doc)
+            video = await self.video_repo.create_video(build_video(draft), session=session)
+            return video, draft
+
+        # Without transactions the claim and the unique videos.draft_id index still prevent double
+        # publishing, but a failed insert leaves the draft marked finalized.
+        return await run_in_transaction(self.draft_collection.database.client, claim_and_insert)
+
+    async def get_finalized_video(self, draft_id: UUID, user_id: UUID, idempotency_key: str) -> Video | None:
+        """Look up the video a previous finalize with the same idempotency key produced."""
+        doc = await self.draft_collection.find_one(
+            {"draft_id": draft_id, "user_id": user_id, "finalized": True, "finalize_idempotency_key": idempotency_key},
+            {"video_id": 1},
+        )
+        if not doc or not doc.get("video_id"):
+            return None
+        return await self.video_repo.get_by_id(doc["video_id"])
+
     # --- Helper ---
 
     def map_draft(self, doc: dict | None) -> VideoDraft | None:
@@ -1,9 +1,48 @@
 # app/repositories/video/video_explore_repository.py
 
+from app.models.vedio_model import TrendingVideo, Video
 from app.repositories.video.video_repository import VideoRepository
+from app.repositories.trending import TrendingRepository
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
 class VideoExploreRepository:
-    def __init__(self, video_repo: VideoRepository):
+    def __init__(self, video_repo: VideoRepository, trending_repo: TrendingRepository):
         self.video_repo = video_repo
+        self.trending_repo = trending_repo
 
-    # Your search / featured / views logic here.
+    # --- Feed ---
+
+    async def get_feed_page(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Video], bool]:
+        return await self.video_repo.get_feed_page(after=after, limit=limit, visibility=visibility)
+
+    async def get_featured_page(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Video], bool]:
+        return await self.video_repo.get_featured_page(after=after, limit=limit, visibility=visibility)
+
+    async def get_by_media(self, values: List[str]) -> List[Video]:
+        return await self.video_repo.get_by_media(values)
+
+    async def get_trending_page(
+        self,
+        after: Optional[Tuple[float, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[TrendingVideo], Dict[UUID, Video], bool]:
+        """
+        One page of ranking rows plus the videos they point at, loaded with one $in.
+        Rows whose video has since been unpublished or hidden from this viewer are missing from the dict.
+        """
+        rows, has_more = await self.trending_repo.get_page(after=after, limit=limit, visibility=visibility)
+        videos = await self.video_repo.get_published_by_ids([row.video_id for row in rows], visibility=visibility)
+        return rows, videos, has_more
@@ -2,16 +2,283 @@
 
 from app.models.vedio_model import Video
 from app.repositories.base import BaseRepository
+from app.core.enums import PrivacySetting, VideoStatus
+from app.core.visibility import account_visibility_update
+from app.db.mongo import get_feed_read_preference
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, TEXT
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Feed pages are ordered newest first; video_id breaks ties between identical upload dates.
+FEED_SORT = [("upload_date", DESCENDING), ("video_id", DESCENDING)]
+FEED_INDEX = [("status", ASCENDING), ("upload_date", DESCENDING), ("video_id", DESCENDING)]
+# Serve the branches of a visibility filter: public videos, and videos by specific authors
+VISIBILITY_FEED_INDEX = [("status", ASCENDING), ("visibility", ASCENDING), ("upload_date", DESCENDING), ("video_id", DESCENDING)]
+AUTHOR_FEED_INDEX = [("status", ASCENDING), ("user_id", ASCENDING), ("upload_date", DESCENDING), ("video_id", DESCENDING)]
+FEATURED_INDEX = [("status", ASCENDING), ("is_featured", ASCENDING), ("visibility", ASCENDING), ("upload_date", DESCENDING), ("video_id", DESCENDING)]
+# Tag pages: Video.tags is an array, so this is a multikey index with one entry per tag
+TAG_FEED_INDEX = [("status", ASCENDING), ("tags", ASCENDING), ("visibility", ASCENDING), ("upload_date", DESCENDING), ("video_id", DESCENDING)]
+# Keyword search; a tag hit counts for more than a word in the description
+VIDEO_TEXT_INDEX = [("description", TEXT), ("tags", TEXT), ("location", TEXT)]
+VIDEO_TEXT_WEIGHTS = {"tags": 5, "description": 2, "location": 1}
+# Presigning looks up which video owns an object, by its stored key or URL
+VIDEO_MEDIA_INDEX = [("s3_url", ASCENDING)]
+VIDEO_THUMBNAIL_INDEX = [("thumbnail_url", ASCENDING)]
+
+
+def _published_query(visibility: Optional[Dict[str, Any]], after: Optional[Tuple[datetime, UUID]] = None) -> Dict[str, Any]:
+    """Published videos, optionally restricted by a visibility filter and started after a keyset position."""
+    query: Dict[str, Any] = {"status": VideoStatus.PUBLISHED.value}
+    clauses = []
+    if visibility:
+        clauses.append(visibility)
+    if after:
+        upload_date, video_id = after
+        clauses.append({"$or": [
+            {"upload_date": {"$lt": upload_date}},
+            {"upload_date": upload_date, "video_id": {"$lt": video_id}},
+        ]})
+    if len(clauses) == 1:
+        query.update(clauses[0])
+    elif clauses:
+        query["$and"] = clauses
+    return query
+
 
 class VideoRepository(BaseRepository[Video]):
     def __init__(self, collection: AsyncIOMotorCollection):
-        super().__init__(collection)
+        super().__init__(collection, Video)
+        # Feed reads can be served by secondaries; writes and point lookups stay on the default
+        self.feed_collection = collection.with_options(read_preference=get_feed_read_preference())
 
     async def get_by_id(self, video_id: UUID) -> Video | None:
         doc = await self.collection.find_one({"video_id": video_id})
-        return self.map_document(doc)
-    
+        return self.model(**doc) if doc else None
+
+    async def get_access(self, video_id: UUID) -> Optional[Dict[str, Any]]:
+        """Only what a visibility check needs: the owner, privacy, visibility and status."""
+        return await self.collection.find_one(
+            {"video_id": video_id},
+            {"_id": 0, "user_id": 1, "privacy": 1, "visibility": 1, "status": 1},
+        )
+
+    async def create_video(self, video: Video, session=None) -> Video:
+        try:
+            await self.collection.insert_one(video.model_dump(), session=session)
+            logger.info(f"[Create Video] Inserted video_id={video.video_id}")
+            return video
+        except Exception as e:
+            logger.error(f"[Create Video] Failed for video_id={video.video_id}: {e}")
+            raise
+
+    async def get_feed_page(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Video], bool]:
+        """
+        Keyset pagination over published videos. `after` is the (upload_date, video_id)
+        of the last video on the previous page, so every page is a bounded index range scan.
+        `visibility` (see app.core.visibility) is applied in the same query so pages stay full.
+        """
+        query = _published_query(visibility, after)
+        try:
+            # One extra document tells us whether another page exists without a count query.
+            cursor = self.feed_collection.find(query).sort(FEED_SORT).limit(limit + 1)
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Feed Page] Failed after={after} limit={limit}: {e}")
+            raise
+
+    async def get_published_by_ids(self, video_ids: List[UUID], visibility: Optional[Dict[str, Any]] = None) -> Dict[UUID, Video]:
+        """Hydrate a page of ids in one $in query; deleted, unpublished or hidden videos are simply absent."""
+        if not video_ids:
+            return {}
+        query = _published_query(visibility)
+        query["video_id"] = {"$in": video_ids}
+        try:
+            cursor = self.feed_collection.find(query)
+            return {doc["video_id"]: self.model(**doc) async for doc in cursor}
+        except Exception as e:
+            logger.error(f"[Videos By IDs] Failed for {len(video_ids)} ids: {e}")
+            raise
+
+    async def get_by_media(self, values: List[str]) -> List[Video]:
+        """Videos whose s3_url or thumbnail_url is one of `values`, whatever their status or visibility."""
+        if not values:
+            return []
+        query = {"$or": [{"s3_url": {"$in": values}}, {"thumbnail_url": {"$in": values}}]}
+        try:
+            return [self.model(**doc) async for doc in self.collection.find(query)]
+        except Exception as e:
+            logger.error(f"[Videos By Media] Failed for {len(values)} values: {e}")
+            raise
+
+    async def get_recent_by_authors(
+        self,
+        user_ids: List[UUID],
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> List[Video]:
+        """Newest published videos across a few authors; merges per-author ranges of the author feed index."""
+        if not user_ids:
+            return []
+        query = _published_query(visibility, after)
+        query["user_id"] = {"$in": user_ids}
+        try:
+            cursor = self.feed_collection.find(query).sort(FEED_SORT).limit(limit)
+            return [self.model(**doc) async for doc in cursor]
+        except Exception as e:
+            logger.error(f"[Videos By Authors] Failed for {len(user_ids)} authors: {e}")
+            raise
+
+    async def get_featured_page(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Video], bool]:
+        """Editor-featured videos, newest first, with the same keyset contract as get_feed_page."""
+        query = _published_query(visibility, after)
+        query["is_featured"] = True
+        try:
+            cursor = self.feed_collection.find(query).sort(FEED_SORT).limit(limit + 1)
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Featured Page] Failed after={after} limit={limit}: {e}")
+            raise
+
+    async def get_tag_page(
+        self,
+        tag: str,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Video], bool]:
+        """Videos carrying a (normalized) tag, newest first, with the same keyset contract as get_feed_page."""
+        query = _published_query(visibility, after)
+        query["tags"] = tag
+        try:
+            cursor = self.feed_collection.find(query).sort(FEED_SORT).limit(limit + 1)
+            docs = await cursor.to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [self.model(**doc) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Tag Page] Failed tag={tag} after={after} limit={limit}: {e}")
+            raise
+
+    async def iter_published_since(self, since: datetime, batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream the ranking inputs of videos published since `since`, in batches, off the feed index."""
+        async for batch in self.iter_batches(
+            {"status": VideoStatus.PUBLISHED.value, "upload_date": {"$gte": since}},
+            batch_size=batch_size,
+            projection={
+                "_id": 0, "video_id": 1, "user_id": 1, "privacy": 1, "visibility": 1,
+                "upload_date": 1, "views": 1, "like_count": 1, "comment_count": 1,
+            },
+            raw=True,
+        ):
+            yield batch
+
+    async def search_page(
+        self,
+        text: str,
+        after: Optional[Tuple[float, UUID]] = None,
+        limit: int = 20,
+        visibility: Optional[Dict[str, Any]] = None,
+        tag: Optional[str] = None,
+    ) -> Tuple[List[Tuple[Video, float]], bool]:
+        """
+        Relevance-ranked keyword search over the text index. `after` is the (score, video_id) of
+        the last hit on the previous page; scores are stable for a given query, so the keyset holds.
+        """
+        match = _published_query(visibility)
+        match["$text"] = {"$search": text}
+        if tag:
+            match["tags"] = tag
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": match},
+            {"$addFields": {"_score": {"$meta": "textScore"}}},
+        ]
+        if after:
+            score, video_id = after
+            pipeline.append({"$match": {"$or": [
+                {"_score": {"$lt": score}},
+                {"_score": score, "video_id": {"$lt": video_id}},
+            ]}})
+        pipeline += [{"$sort": {"_score": -1, "video_id": -1}}, {"$limit": limit + 1}]
+        try:
+            docs = await self.feed_collection.aggregate(pipeline).to_list(length=limit + 1)
+            has_more = len(docs) > limit
+            return [(self.model(**doc), doc["_score"]) for doc in docs[:limit]], has_more
+        except Exception as e:
+            logger.error(f"[Video Search] Failed text='{text}' tag={tag} after={after}: {e}")
+            raise
+
+    async def apply_account_privacy(self, user_id: UUID, account_privacy: PrivacySetting) -> int:
+        """Recompute visibility on all of a user's videos after their account privacy changed."""
+        try:
+            result = await self.collection.update_many({"user_id": user_id}, account_visibility_update(account_privacy))
+            logger.info(f"[Account Privacy] Updated visibility on {result.modified_count} videos for user_id={user_id}")
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"[Account Privacy] Failed for user_id={user_id}: {e}")
+            raise
+
+    async def backfill_visibility(self, profile_collection: AsyncIOMotorCollection, batch_size: int = 1000) -> int:
+        """
+        Give videos written before visibility existed one derived from their privacy capped by their
+        author's account setting, batch by batch of authors. The probe uses the visibility feed index,
+        so once nothing is left this is a single index lookup.
+        """
+        try:
+            if await self.collection.find_one({"status": VideoStatus.PUBLISHED.value, "visibility": None}, {"_id": 1}) is None:
+                return 0
+            modified = 0
+            authors: List[UUID] = []
+            async for doc in self.collection.aggregate([{"$match": {"visibility": None}}, {"$group": {"_id": "$user_id"}}]):
+                authors.append(doc["_id"])
+                if len(authors) >= batch_size:
+                    modified += await self._backfill_authors(authors, profile_collection)
+                    authors = []
+            if authors:
+                modified += await self._backfill_authors(authors, profile_collection)
+            logger.info(f"[Visibility Backfill] Set visibility on {modified} videos")
+            return modified
+        except Exception as e:
+            logger.error(f"[Visibility Backfill] Failed: {e}")
+            raise
+
+    async def _backfill_authors(self, user_ids: List[UUID], profile_collection: AsyncIOMotorCollection) -> int:
+        """One update per account setting present in the batch, each using account_visibility_update."""
+        by_privacy: Dict[PrivacySetting, List[UUID]] = {}
+        settings_by_user = {
+            doc["user_id"]: doc.get("privacy_setting")
+            async for doc in profile_collection.find({"user_id": {"$in": user_ids}}, {"user_id": 1, "privacy_setting": 1, "_id": 0})
+        }
+        for user_id in user_ids:
+            # Authors without a stored setting get the profile default (followers only), never public
+            privacy = PrivacySetting(settings_by_user.get(user_id) or PrivacySetting.FOLLOWERS_ONLY)
+            by_privacy.setdefault(privacy, []).append(user_id)
+        modified = 0
+        for privacy, authors in by_privacy.items():
+            result = await self.collection.update_many(
+                {"user_id": {"$in": authors}, "visibility": None},
+                account_visibility_update(privacy),
+            )
+            modified += result.modified_count
+        return modified
+
     # Common base methods can go here:
-    # create_video, update_video, delete_video, search_videos, etc.
+    # update_video, delete_video, search_videos, etc.
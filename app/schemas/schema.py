@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Tuple, Generic, TypeVar
+from typing import Optional, List, Any, Tuple, Generic, TypeVar, Dict
 from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
 from datetime import datetime
@@ -33,6 +33,33 @@ class CommentSchema(BaseModel):
 class CommentListResponse(BaseResponse[List[CommentSchema]]):
     data: List[CommentSchema]
 
+class CommentCreateSchema(BaseModel):
+    text: str = Field(..., min_length=1, max_length=2200)
+
+class CommentAuthorSchema(BaseModel):
+    user_id: UUID
+    display_name: Optional[str] = None
+    profile_picture_url: Optional[str] = None
+    is_verified: bool = False
+
+class CommentThreadItemSchema(BaseModel):
+    id: UUID
+    video_id: UUID
+    text: str
+    created_at: datetime
+    author: CommentAuthorSchema
+
+class CommentPageSchema(BaseModel):
+    items: List[CommentThreadItemSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+class CommentPageResponse(BaseResponse[CommentPageSchema]):
+    data: CommentPageSchema
+
+class CommentItemResponse(BaseResponse[CommentThreadItemSchema]):
+    data: CommentThreadItemSchema
+
 
 # ---------------------- Like Schemas ---------------------- #
 
@@ -44,6 +71,17 @@ class LikeSchema(BaseModel):
 class LikeListResponse(BaseResponse[List[LikeSchema]]):
     data: List[LikeSchema]
 
+class LikeStatusSchema(BaseModel):
+    video_id: UUID
+    liked: bool
+    like_count: int
+
+class LikeStatusResponse(BaseResponse[LikeStatusSchema]):
+    data: LikeStatusSchema
+
+class LikedByMeResponse(BaseResponse[Dict[UUID, bool]]):
+    data: Dict[UUID, bool]
+
 
 # ---------------------- Follow Schemas ---------------------- #
 
@@ -55,12 +93,70 @@ class FollowSchema(BaseModel):
 class FollowListResponse(BaseResponse[List[FollowSchema]]):
     data: List[FollowSchema]
 
+class FollowStatusSchema(BaseModel):
+    user_id: UUID
+    following: bool
+    follower_count: int
+
+class FollowStatusResponse(BaseResponse[FollowStatusSchema]):
+    data: FollowStatusSchema
+
+class FollowUserSchema(BaseModel):
+    user_id: UUID
+    display_name: Optional[str] = None
+    profile_picture_url: Optional[str] = None
+    is_verified: bool = False
+    followed_at: datetime
+
+class FollowPageSchema(BaseModel):
+    items: List[FollowUserSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+class FollowPageResponse(BaseResponse[FollowPageSchema]):
+    data: FollowPageSchema
+
+
+# ---------------------- Tag Schemas ---------------------- #
+
+class TagSchema(BaseModel):
+    name: str
+    usage_count: int = 0
+
+class TagResponse(BaseResponse[TagSchema]):
+    data: TagSchema
+
+class TagListResponse(BaseResponse[List[TagSchema]]):
+    data: List[TagSchema]
+
+
+# ---------------------- Search Schemas ---------------------- #
+
+class UserSearchItemSchema(BaseModel):
+    user_id: UUID
+    display_name: Optional[str] = None
+    profile_picture_url: Optional[str] = None
+    is_verified: bool = False
+    follower_count: int = 0
+
+class UserSearchPageSchema(BaseModel):
+    items: List[UserSearchItemSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+class UserSearchPageResponse(BaseResponse[UserSearchPageSchema]):
+    data: UserSearchPageSchema
+
+class UserAutocompleteResponse(BaseResponse[List[UserSearchItemSchema]]):
+    data: List[UserSearchItemSchema]
+
 
 
 # ---------------------- Message & Conversation Schemas ---------------------- #
 
 class MessageSchema(BaseModel):
     id: UUID
+    conversation_id: Optional[UUID] = None
     sender_user_id: UUID
     receiver_user_id: UUID
     text: str
@@ -77,6 +173,55 @@ class ConversationSchema(BaseModel):
 class ConversationListResponse(BaseResponse[List[ConversationSchema]]):
     data: List[ConversationSchema]
 
+class SendMessageRequestSchema(BaseModel):
+    receiver_user_id: UUID
+    text: str = Field(..., min_length=1, max_length=2000)
+
+class MessageResponse(BaseResponse[MessageSchema]):
+    data: MessageSchema
+
+class MessagePageSchema(BaseModel):
+    items: List[MessageSchema]  # Newest first
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+class MessagePageResponse(BaseResponse[MessagePageSchema]):
+    data: MessagePageSchema
+
+class InboxItemSchema(BaseModel):
+    id: UUID
+    type: ConversationType
+    participants: List[CommentAuthorSchema]  # Everyone except the viewer
+    last_message_at: Optional[datetime]
+    last_message_preview: Optional[str] = None
+    last_sender_id: Optional[UUID] = None
+    unread_count: int = 0
+    online_user_ids: List[UUID] = []  # Participants with a live connection right now
+
+class InboxPageSchema(BaseModel):
+    items: List[InboxItemSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+class InboxPageResponse(BaseResponse[InboxPageSchema]):
+    data: InboxPageSchema
+
+class MarkReadSchema(BaseModel):
+    conversation_id: UUID
+    marked_read: int
+
+class MarkReadResponse(BaseResponse[MarkReadSchema]):
+    data: MarkReadSchema
+
+
+# ---------------------- Presence Schemas ---------------------- #
+
+class PresenceSchema(BaseModel):
+    online_user_ids: List[UUID]  # The requested users that are online, in request order
+
+class PresenceResponse(BaseResponse[PresenceSchema]):
+    data: PresenceSchema
+
 
 # ---------------------- Call Session Schemas ---------------------- #
 
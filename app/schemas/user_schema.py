@@ -26,6 +26,8 @@ class UserProfileSchema(BaseModel):
     privacy_setting: PrivacySetting
     is_verified: bool
     uploaded_videos: List[UUID]
+    follower_count: int = 0
+    following_count: int = 0
 
     class Config:
         orm_mode = True
@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Tuple, Generic, TypeVar
+from typing import Optional, List, Any, Tuple, Generic, TypeVar, Dict
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
 from uuid import UUID
@@ -38,6 +38,15 @@ class UploadURLResponse(BaseModel):
     key: str
 
 
+class PresignBatchRequestSchema(BaseModel):
+    keys: List[str] = Field(..., min_length=1, max_length=200)  # S3 keys or full object URLs
+    expires_in: int = Field(3600, ge=60, le=86400)
+
+
+class PresignBatchResponse(BaseResponse[Dict[str, str]]):
+    data: Dict[str, str]
+
+
 # ------------------ Upload ------------------
 
 # VideoUploadRequestSchema is for pre-signed URL endpoint.
@@ -113,7 +122,21 @@ class VideoResponseSchema(VideoCreateSchema):
     video_id: UUID
     upload_date: datetime
     views: int
+    like_count: int = 0
+    comment_count: int = 0
     status: VideoStatus
 
     class Config:
         orm_mode = True
+
+
+# ------------------ Feed ------------------
+
+class VideoFeedPageSchema(BaseModel):
+    items: List[VideoResponseSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class VideoFeedResponse(BaseResponse[VideoFeedPageSchema]):
+    data: VideoFeedPageSchema
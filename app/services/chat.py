@@ -0,0 +1,276 @@
+# app/services/chat.py
+
+import asyncio
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from fastapi import WebSocket
+import orjson
+from app.models.models import Message
+from app.repositories.message import MessageRepository
+from app.repositories.conversation import ConversationRepository
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pagination import encode_cursor
+from app.core.pubsub import PubSub
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEND_TIMEOUT_SECONDS = 2.0
+PARTICIPANTS_CACHE_SIZE = 10_000
+PARTICIPANTS_CACHE_TTL_SECONDS = 300
+
+
+def to_stored_precision(timestamp: datetime) -> datetime:
+    """MongoDB keeps datetimes to the millisecond; cursors compared against stored values must match."""
+    return timestamp.replace(microsecond=timestamp.microsecond // 1000 * 1000)
+
+
+def sync_cursor(timestamp: datetime, message_id: Optional[UUID] = None) -> str:
+    """Position in a user's received messages; GET /messages/sync resumes from it."""
+    return encode_cursor({"d": to_stored_precision(timestamp).isoformat(), "id": str(message_id or UUID(int=0))})
+
+
+class ChatRelay:
+    """
+    Live DM delivery. Each worker keeps an in-memory registry of the sockets its users have open
+    and subscribes to `dm:{user_id}` for each of them, so an event published once reaches every
+    tab on every worker. A publish nobody receives means the user is offline; they catch up by
+    polling GET /messages/sync with the cursor of the last message they saw.
+
+    Read receipts are coalesced: a "read" event only records the newest read time per
+    (conversation, reader), and every `read_flush_interval` the batch is written as one bulk of
+    update_many calls, after which the other participants are notified. Typing indicators are
+    relayed at most once per `typing_interval` per user and conversation and never stored.
+    """
+
+    def __init__(self, read_flush_interval: float, typing_interval: float):
+        self.read_flush_interval = read_flush_interval
+        self.typing_interval = typing_interval
+        self._sockets: Dict[UUID, Set[WebSocket]] = defaultdict(set)
+        self._pending_reads: Dict[Tuple[UUID, UUID], datetime] = {}
+        self._typing_sent: Dict[Tuple[UUID, UUID], float] = {}
+        self.participants: TTLCache[UUID, Tuple[UUID, ...]] = TTLCache(
+            max_size=PARTICIPANTS_CACHE_SIZE,
+            ttl=PARTICIPANTS_CACHE_TTL_SECONDS,
+        )
+        self.message_repo: Optional[MessageRepository] = None
+        self.conversation_repo: Optional[ConversationRepository] = None
+        self._pubsub: Optional[PubSub] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._delivered = 0
+        self._offline = 0
+        self._read_events = 0
+        self._read_flushes = 0
+
+    @staticmethod
+    def channel(user_id: UUID) -> str:
+        return f"dm:{user_id}"
+
+    # --- Presence ---
+
+    async def connect(self, user_id: UUID, websocket: WebSocket) -> None:
+        first = not self._sockets.get(user_id)
+        self._sockets[user_id].add(websocket)
+        if first and self._pubsub is not None:
+            await self._pubsub.subscribe(self.channel(user_id), self._deliver)
+
+    async def disconnect(self, user_id: UUID, websocket: WebSocket) -> None:
+        sockets = self._sockets.get(user_id)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del self._sockets[user_id]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(self.channel(user_id), self._deliver)
+
+    def is_connected_here(self, user_id: UUID) -> bool:
+        return bool(self._sockets.get(user_id))
+
+    # --- Events ---
+
+    async def message_sent(self, message: Message) -> bool:
+        """Push a stored message to the receiver and to the sender's other tabs; False if the receiver is offline."""
+        payload = {
+            "type": "message",
+            "message": {
+                "id": str(message.id),
+                "conversation_id": str(message.conversation_id),
+                "sender_user_id": str(message.sender_user_id),
+                "receiver_user_id": str(message.receiver_user_id),
+                "text": message.text,
+                "timestamp": message.timestamp.isoformat(),
+            },
+            "cursor": sync_cursor(message.timestamp, message.id),
+        }
+        delivered = await self._route(message.receiver_user_id, payload)
+        await self._route(message.sender_user_id, payload)
+        if not delivered:
+            self._offline += 1
+        return delivered
+
+    async def record_read(self, conversation_id: UUID, reader_id: UUID) -> bool:
+        """Queue a read receipt; False when `reader_id` is not part of the conversation."""
+        if await self._participants(conversation_id, reader_id) is None:
+            return False
+        self._read_events += 1
+        self._pending_reads[(conversation_id, reader_id)] = datetime.utcnow()
+        return True
+
+    async def typing(self, conversation_id: UUID, user_id: UUID) -> bool:
+        """Relay a typing indicator to the other participants, throttled; nothing is stored."""
+        key = (conversation_id, user_id)
+        now = time.monotonic()
+        if now - self._typing_sent.get(key, 0.0) < self.typing_interval:
+            return True
+        participants = await self._participants(conversation_id, user_id)
+        if participants is None:
+            return False
+        self._typing_sent[key] = now
+        payload = {"type": "typing", "conversation_id": str(conversation_id), "user_id": str(user_id)}
+        for other_id in participants:
+            if other_id != user_id:
+                await self._route(other_id, payload)
+        return True
+
+    async def publish_read(self, conversation_id: UUID, reader_id: UUID, read_at: datetime, participants: List[UUID]) -> None:
+        payload = {
+            "type": "read",
+            "conversation_id": str(conversation_id),
+            "reader_id": str(reader_id),
+            "read_at": read_at.isoformat(),
+        }
+        for user_id in participants:
+            await self._route(user_id, payload)
+
+    # --- Read receipt batching ---
+
+    async def flush_reads(self) -> int:
+        async with self._flush_lock:
+            if not self._pending_reads or self.message_repo is None:
+                return 0
+            batch, self._pending_reads = self._pending_reads, {}
+            reads = [(conversation_id, reader_id, read_at) for (conversation_id, reader_id), read_at in batch.items()]
+            try:
+                await self.message_repo.mark_read_many(reads)
+            except asyncio.CancelledError:
+                # The batch is already out of _pending_reads; put it back so the final flush writes it
+                self._requeue_reads(batch)
+                raise
+            except Exception as e:
+                logger.error(f"[Chat] Read receipt flush of {len(reads)} conversations failed: {e}")
+                self._requeue_reads(batch)
+                return 0
+            self._read_flushes += 1
+            for conversation_id, reader_id, read_at in reads:
+                participants = self.participants.get(conversation_id) or (reader_id,)
+                await self.publish_read(conversation_id, reader_id, read_at, list(participants))
+            return len(reads)
+
+    def _requeue_reads(self, batch: Dict[Tuple[UUID, UUID], datetime]) -> None:
+        # Keep the newest time per key; receipts queued since the swap win
+        for key, read_at in batch.items():
+            self._pending_reads.setdefault(key, read_at)
+
+    # --- Delivery ---
+
+    async def _participants(self, conversation_id: UUID, user_id: UUID) -> Optional[Tuple[UUID, ...]]:
+        participants = self.participants.get(conversation_id)
+        if participants is None and self.conversation_repo is not None:
+            conversation = await self.conversation_repo.get_for_participant(conversation_id, user_id)
+            if conversation is None:
+                return None
+            participants = tuple(conversation.user_ids)
+            self.participants.set(conversation_id, participants)
+        if participants is None or user_id not in participants:
+            return None
+        return participants
+
+    async def _route(self, user_id: UUID, payload: Dict[str, Any]) -> bool:
+        if self._pubsub is not None:
+            try:
+                return await self._pubsub.publish(self.channel(user_id), payload) > 0
+            except Exception as e:
+                logger.error(f"[Chat] Publish to user_id={user_id} failed: {e}")
+                return False
+        await self._send_local(user_id, payload)
+        return self.is_connected_here(user_id)
+
+    async def _deliver(self, channel: str, payload: Dict[str, Any]) -> None:
+        await self._send_local(UUID(channel.split(":", 1)[1]), payload)
+
+    async def _send_local(self, user_id: UUID, payload: Dict[str, Any]) -> None:
+        sockets = list(self._sockets.get(user_id, ()))
+        if not sockets:
+            return
+        text = orjson.dumps(payload, default=str).decode()
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_text(text), SEND_TIMEOUT_SECONDS) for ws in sockets),
+            return_exceptions=True,
+        )
+        for ws, result in zip(sockets, results):
+            if isinstance(result, BaseException):
+                await self.disconnect(user_id, ws)
+            else:
+                self._delivered += 1
+
+    def _prune_typing(self) -> None:
+        cutoff = time.monotonic() - self.typing_interval
+        for key in [key for key, sent_at in self._typing_sent.items() if sent_at < cutoff]:
+            del self._typing_sent[key]
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.read_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            self._prune_typing()
+            try:
+                await self.flush_reads()
+            except Exception as e:
+                logger.error(f"[Chat] Read receipt flush failed: {e}")
+
+    # --- Lifecycle ---
+
+    def start(self, pubsub: PubSub, message_repository: MessageRepository, conversation_repository: ConversationRepository) -> None:
+        self._pubsub = pubsub
+        self.message_repo = message_repository
+        self.conversation_repo = conversation_repository
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Let the loop finish its current flush and exit instead of cancelling it mid-write
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush_reads()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "users": len(self._sockets),
+            "sockets": sum(len(sockets) for sockets in self._sockets.values()),
+            "delivered": self._delivered,
+            "offline_receivers": self._offline,
+            "pending_reads": len(self._pending_reads),
+            "read_events": self._read_events,
+            "read_flushes": self._read_flushes,
+        }
+
+
+chat_relay = ChatRelay(
+    read_flush_interval=settings.CHAT_READ_RECEIPT_FLUSH_MS / 1000,
+    typing_interval=settings.CHAT_TYPING_MIN_INTERVAL_MS / 1000,
+)
@@ -0,0 +1,91 @@
+from typing import Dict, Optional
+from uuid import UUID
+from fastapi import HTTPException, status
+from app.models.models import Comment
+from app.repositories.comment import CommentRepository
+from app.repositories.user.user_profile import UserProfileRepository
+from app.repositories.video.video_repository import VideoRepository
+from app.schemas.schema import CommentAuthorSchema, CommentPageSchema, CommentThreadItemSchema
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.visibility import Viewer, can_watch
+from app.core.logging import get_logger
+from app.services.base import BaseService
+from app.services.follow import FollowService
+from app.services.video.video_room_hub import VideoRoomHub
+
+logger = get_logger()
+
+
+class CommentService(BaseService):
+    def __init__(
+        self,
+        comment_repository: CommentRepository,
+        profile_repository: UserProfileRepository,
+        video_repository: VideoRepository,
+        follow_service: FollowService,
+        room_hub: Optional[VideoRoomHub] = None,
+    ):
+        super().__init__(comment_repository)
+        self.comment_repo = comment_repository
+        self.profile_repo = profile_repository
+        self.video_repo = video_repository
+        self.follow_service = follow_service
+        self.room_hub = room_hub
+
+    async def add_comment(self, video_id: UUID, user_id: UUID, text: str) -> CommentThreadItemSchema:
+        await self.ensure_viewable(video_id, await self.follow_service.viewer_for(user_id))
+        comment = await self.comment_repo.add_comment(Comment(user_id=user_id, video_id=video_id, text=text))
+        if comment is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+        logger.info(f"[Add Comment] user_id={user_id} commented on video_id={video_id}")
+        authors = await self.profile_repo.get_summaries_by_user_ids([user_id])
+        item = self.to_item(comment, authors)
+        if self.room_hub:
+            self.room_hub.record_comment(video_id, item.model_dump(mode="json"))
+        return item
+
+    async def delete_comment(self, comment_id: UUID, user_id: UUID) -> None:
+        deleted = await self.comment_repo.delete_comment(comment_id, user_id)
+        if deleted is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+        if self.room_hub:
+            self.room_hub.record_comment(deleted.video_id, {}, delta=-1)
+        logger.info(f"[Delete Comment] comment_id={comment_id} deleted by user_id={user_id}")
+
+    async def get_thread(self, video_id: UUID, viewer: Viewer, cursor: Optional[str] = None, limit: int = 20) -> CommentPageSchema:
+        limit = clamp_page_size(limit)
+        after = parse_cursor(cursor)
+        await self.ensure_viewable(video_id, viewer)
+
+        comments, has_more = await self.comment_repo.get_thread_page(video_id, after=after, limit=limit)
+        # One $in over every commenter on the page, not one profile lookup per comment
+        authors = await self.profile_repo.get_summaries_by_user_ids([comment.user_id for comment in comments])
+
+        next_cursor = None
+        if has_more and comments:
+            last = comments[-1]
+            next_cursor = encode_cursor({"d": last.created_at.isoformat(), "id": str(last.id)})
+
+        return CommentPageSchema(
+            items=[self.to_item(comment, authors) for comment in comments],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    # --- Helpers ---
+    async def ensure_viewable(self, video_id: UUID, viewer: Viewer) -> None:
+        # Videos the viewer may not see answer like missing ones, so their existence does not leak
+        video = await self.video_repo.get_access(video_id)
+        if video is None or not can_watch(viewer, video):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+
+    def to_item(self, comment: Comment, authors: Dict[UUID, Dict]) -> CommentThreadItemSchema:
+        # Users without a profile yet still render, just without display fields
+        author = authors.get(comment.user_id) or {"user_id": comment.user_id}
+        return CommentThreadItemSchema(
+            id=comment.id,
+            video_id=comment.video_id,
+            text=comment.text,
+            created_at=comment.created_at,
+            author=CommentAuthorSchema(**author),
+        )
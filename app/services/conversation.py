@@ -0,0 +1,62 @@
+from typing import Optional
+from uuid import UUID
+from app.repositories.conversation import ConversationRepository
+from app.repositories.user.user_profile import UserProfileRepository
+from app.schemas.schema import CommentAuthorSchema, InboxItemSchema, InboxPageSchema
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.logging import get_logger
+from app.services.base import BaseService
+from app.services.presence import PresenceTracker
+
+logger = get_logger()
+
+
+class ConversationService(BaseService):
+    """
+    The inbox is one read on the (user_ids, last_message_at) index; previews and unread counts are
+    stored on each conversation, and the other participants' profiles are loaded with a single $in.
+    Who of them is online is one batched presence lookup for the whole page.
+    """
+
+    def __init__(
+        self,
+        conversation_repository: ConversationRepository,
+        profile_repository: UserProfileRepository,
+        presence: Optional[PresenceTracker] = None,
+    ):
+        super().__init__(conversation_repository)
+        self.conversation_repo = conversation_repository
+        self.profile_repo = profile_repository
+        self.presence = presence
+
+    async def get_inbox(self, user_id: UUID, cursor: Optional[str] = None, limit: int = 20) -> InboxPageSchema:
+        conversations, has_more = await self.conversation_repo.get_inbox_page(
+            user_id,
+            after=parse_cursor(cursor),
+            limit=clamp_page_size(limit),
+        )
+        others = {other_id for conversation in conversations for other_id in conversation.user_ids if other_id != user_id}
+        profiles = await self.profile_repo.get_summaries_by_user_ids(list(others))
+        online = await self.presence.online(others) if self.presence and others else set()
+        items = [
+            InboxItemSchema(
+                id=conversation.id,
+                type=conversation.type,
+                participants=[
+                    CommentAuthorSchema(**(profiles.get(other_id) or {"user_id": other_id}))
+                    for other_id in conversation.user_ids
+                    if other_id != user_id
+                ],
+                last_message_at=conversation.last_message_at,
+                last_message_preview=conversation.last_message_preview,
+                last_sender_id=conversation.last_sender_id,
+                unread_count=conversation.unread_counts.get(str(user_id), 0),
+                online_user_ids=[other_id for other_id in conversation.user_ids if other_id in online],
+            )
+            for conversation in conversations
+        ]
+        next_cursor = None
+        if has_more and conversations:
+            last = conversations[-1]
+            next_cursor = encode_cursor({"d": last.last_message_at.isoformat(), "id": str(last.id)})
+        return InboxPageSchema(items=items, next_cursor=next_cursor, has_more=has_more)
@@ -0,0 +1,100 @@
+from typing import Dict, FrozenSet, List, Optional
+from uuid import UUID
+from fastapi import HTTPException, status
+from app.models.models import Follow
+from app.repositories.follow import FollowRepository
+from app.repositories.user.user_profile import UserProfileRepository
+from app.schemas.schema import FollowPageSchema, FollowStatusSchema, FollowUserSchema
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.visibility import Viewer
+from app.core.logging import get_logger
+from app.services.base import BaseService
+
+logger = get_logger()
+
+
+class FollowService(BaseService):
+    def __init__(self, follow_repository: FollowRepository, profile_repository: UserProfileRepository):
+        super().__init__(follow_repository)
+        self.follow_repo = follow_repository
+        self.profile_repo = profile_repository
+        # user_id -> everyone they follow. Feed assembly and privacy checks read this instead of
+        # querying the edges each time; this worker drops an entry whenever that user follows or
+        # unfollows, and the TTL bounds staleness from changes made on other workers.
+        self.following_cache: TTLCache[UUID, FrozenSet[UUID]] = TTLCache(
+            max_size=settings.FOLLOWING_CACHE_SIZE,
+            ttl=settings.FOLLOWING_CACHE_TTL_SECONDS,
+        )
+
+    async def follow(self, user_id: UUID, target_id: UUID) -> FollowStatusSchema:
+        if user_id == target_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You cannot follow yourself")
+        result = await self.follow_repo.follow(user_id, target_id)
+        if result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        changed, follower_count = result
+        if changed:
+            self.invalidate(user_id)
+            logger.info(f"[Follow] user_id={user_id} followed user_id={target_id}")
+        return FollowStatusSchema(user_id=target_id, following=True, follower_count=follower_count)
+
+    async def unfollow(self, user_id: UUID, target_id: UUID) -> FollowStatusSchema:
+        result = await self.follow_repo.unfollow(user_id, target_id)
+        if result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        changed, follower_count = result
+        if changed:
+            self.invalidate(user_id)
+            logger.info(f"[Unfollow] user_id={user_id} unfollowed user_id={target_id}")
+        return FollowStatusSchema(user_id=target_id, following=False, follower_count=follower_count)
+
+    # --- Cached adjacency ---
+
+    async def get_following_ids(self, user_id: UUID) -> FrozenSet[UUID]:
+        cached = self.following_cache.get(user_id)
+        if cached is not None:
+            return cached
+        following = frozenset(await self.follow_repo.following_ids(user_id))
+        self.following_cache.set(user_id, following)
+        return following
+
+    async def is_following(self, user_id: UUID, target_id: UUID) -> bool:
+        return target_id in await self.get_following_ids(user_id)
+
+    async def viewer_for(self, user_id: Optional[UUID]) -> Viewer:
+        """The permissions a visibility filter is compiled from; anonymous when signed out."""
+        if user_id is None:
+            return Viewer.anonymous()
+        return Viewer(user_id=user_id, following=await self.get_following_ids(user_id))
+
+    def invalidate(self, user_id: UUID) -> None:
+        self.following_cache.pop(user_id)
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self.following_cache.stats()
+
+    # --- Lists ---
+
+    async def get_followers(self, user_id: UUID, cursor: Optional[str] = None, limit: int = 20) -> FollowPageSchema:
+        edges, has_more = await self.follow_repo.get_followers_page(user_id, after=parse_cursor(cursor), limit=clamp_page_size(limit))
+        return await self._to_page([edge.follower_user_id for edge in edges], edges, has_more)
+
+    async def get_following(self, user_id: UUID, cursor: Optional[str] = None, limit: int = 20) -> FollowPageSchema:
+        edges, has_more = await self.follow_repo.get_following_page(user_id, after=parse_cursor(cursor), limit=clamp_page_size(limit))
+        return await self._to_page([edge.following_user_id for edge in edges], edges, has_more)
+
+    # --- Helpers ---
+    async def _to_page(self, user_ids: List[UUID], edges: List[Follow], has_more: bool) -> FollowPageSchema:
+        # One $in over every user on the page, not one profile lookup per row
+        profiles = await self.profile_repo.get_summaries_by_user_ids(user_ids)
+        items = [
+            FollowUserSchema(**(profiles.get(other_id) or {"user_id": other_id}), followed_at=edge.created_at)
+            for other_id, edge in zip(user_ids, edges)
+        ]
+        next_cursor = None
+        if has_more and edges:
+            next_cursor = encode_cursor({"d": edges[-1].created_at.isoformat(), "id": str(user_ids[-1])})
+        return FollowPageSchema(items=items, next_cursor=next_cursor, has_more=has_more)
+
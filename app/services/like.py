@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+from fastapi import HTTPException, status
+from app.repositories.like import LikeRepository
+from app.repositories.video.video_repository import VideoRepository
+from app.schemas.schema import LikeStatusSchema
+from app.core.pagination import MAX_PAGE_SIZE
+from app.core.visibility import can_watch
+from app.core.logging import get_logger
+from app.services.base import BaseService
+from app.services.follow import FollowService
+from app.services.video.video_room_hub import VideoRoomHub
+
+logger = get_logger()
+
+
+class LikeService(BaseService):
+    def __init__(
+        self,
+        like_repository: LikeRepository,
+        video_repository: VideoRepository,
+        follow_service: FollowService,
+        room_hub: Optional[VideoRoomHub] = None,
+    ):
+        super().__init__(like_repository)
+        self.like_repo = like_repository
+        self.video_repo = video_repository
+        self.follow_service = follow_service
+        self.room_hub = room_hub
+
+    async def like(self, user_id: UUID, video_id: UUID) -> LikeStatusSchema:
+        await self.ensure_viewable(user_id, video_id)
+        return await self._like(user_id, video_id)
+
+    async def _like(self, user_id: UUID, video_id: UUID) -> LikeStatusSchema:
+        result = await self.like_repo.like(user_id, video_id)
+        if result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+        changed, like_count = result
+        if changed:
+            logger.info(f"[Like] user_id={user_id} liked video_id={video_id}")
+            if self.room_hub:
+                self.room_hub.record_like(video_id, 1, like_count)
+        return LikeStatusSchema(video_id=video_id, liked=True, like_count=like_count)
+
+    async def unlike(self, user_id: UUID, video_id: UUID) -> LikeStatusSchema:
+        await self.ensure_viewable(user_id, video_id)
+        result = await self.like_repo.unlike(user_id, video_id)
+        if result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+        changed, like_count = result
+        if changed:
+            logger.info(f"[Unlike] user_id={user_id} unliked video_id={video_id}")
+            if self.room_hub:
+                self.room_hub.record_like(video_id, -1, like_count)
+        return LikeStatusSchema(video_id=video_id, liked=False, like_count=like_count)
+
+    async def toggle(self, user_id: UUID, video_id: UUID) -> LikeStatusSchema:
+        await self.ensure_viewable(user_id, video_id)
+        # Try the cheaper delete first; only a miss needs the insert
+        result = await self.like_repo.unlike(user_id, video_id)
+        if result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+        changed, like_count = result
+        if changed:
+            if self.room_hub:
+                self.room_hub.record_like(video_id, -1, like_count)
+            return LikeStatusSchema(video_id=video_id, liked=False, like_count=like_count)
+        return await self._like(user_id, video_id)
+
+    async def liked_by_me(self, user_id: UUID, video_ids: List[UUID]) -> Dict[UUID, bool]:
+        if len(video_ids) > MAX_PAGE_SIZE:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_PAGE_SIZE} video_ids per lookup")
+        liked = await self.like_repo.liked_video_ids(user_id, video_ids)
+        return {video_id: video_id in liked for video_id in video_ids}
+
+    # --- Helpers ---
+    async def ensure_viewable(self, user_id: UUID, video_id: UUID) -> None:
+        # Videos the user may not see answer like missing ones, so their existence does not leak
+        video = await self.video_repo.get_access(video_id)
+        if video is None or not can_watch(await self.follow_service.viewer_for(user_id), video):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
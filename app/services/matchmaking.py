@@ -0,0 +1,219 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Optional
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import InsertOne
+from app.core.collections import CollectionName
+from app.core.config import settings
+from app.core.enums import CallStatus, MatchmakingStatus
+from app.core.metrics import Histogram
+from app.db.bulk_writer import BulkWriter
+from app.models.models import AnonymousCallSession
+import logging
+
+logger = logging.getLogger(__name__)
+
+ANY_BUCKET = "*"
+TIME_TO_MATCH_BUCKETS = [0.1, 0.5, 1, 2, 5, 10, 30, 60, 120]
+
+
+@dataclass(eq=False)
+class Waiter:
+    user_id: UUID
+    tags: FrozenSet[str]
+    joined_at: float = field(default_factory=time.monotonic)
+    match: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+@dataclass
+class Match:
+    session_id: UUID
+    peer_id: UUID
+    initiator: bool  # Exactly one side of a match creates the WebRTC offer
+    shared_tags: FrozenSet[str]
+
+
+class MatchmakingService:
+    """
+    Pairs random-call seekers on this node. Every waiter sits in the catch-all bucket plus one
+    FIFO bucket per interest tag; buckets are insertion-ordered dicts, so taking the oldest waiter,
+    enqueueing and removing a disconnected user are all O(1) (times the handful of tags).
+    All state is touched only from the event loop, so no locks are needed.
+    Matched sessions are persisted write-behind and never delay the match itself.
+    """
+
+    def __init__(self, session_writer: Optional[BulkWriter], timeout_seconds: float, max_tags: int):
+        self.session_writer = session_writer
+        self.timeout_seconds = timeout_seconds
+        self.max_tags = max_tags
+        self._buckets: Dict[str, "OrderedDict[UUID, Waiter]"] = {}
+        self._waiting: Dict[UUID, Waiter] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self.time_to_match = Histogram(TIME_TO_MATCH_BUCKETS)
+        self._matches = 0
+        self._timeouts = 0
+        self._cancelled = 0
+
+    # --- Queue operations ---
+
+    def join(self, user_id: UUID, tags: Iterable[str] = ()) -> Waiter:
+        """Match immediately if someone compatible is waiting, otherwise enqueue. Await `waiter.match`."""
+        self.leave(user_id)  # A user re-joining replaces their previous place in line
+        normalized = frozenset(tag.strip().lower() for tag in tags if tag and tag.strip())
+        waiter = Waiter(user_id=user_id, tags=frozenset(sorted(normalized)[:self.max_tags]))
+
+        # Prefer someone sharing an interest, then anyone
+        for bucket in [*waiter.tags, ANY_BUCKET]:
+            peer = self._pop_oldest(bucket)
+            if peer is not None:
+                self._pair(peer, waiter)
+                return waiter
+
+        self._waiting[user_id] = waiter
+        for bucket in [*waiter.tags, ANY_BUCKET]:
+            self._buckets.setdefault(bucket, OrderedDict())[user_id] = waiter
+        return waiter
+
+    def leave(self, user_id: UUID) -> bool:
+        waiter = self._remove(user_id)
+        if waiter is None:
+            return False
+        if not waiter.match.done():
+            waiter.match.cancel()
+        self._cancelled += 1
+        return True
+
+    def _pop_oldest(self, bucket: str) -> Optional[Waiter]:
+        queue = self._buckets.get(bucket)
+        if not queue:
+            return None
+        _, waiter = queue.popitem(last=False)
+        self._remove(waiter.user_id)
+        return waiter
+
+    def _remove(self, user_id: UUID) -> Optional[Waiter]:
+        waiter = self._waiting.pop(user_id, None)
+        if waiter is None:
+            return None
+        for bucket in [*waiter.tags, ANY_BUCKET]:
+            queue = self._buckets.get(bucket)
+            if queue is not None:
+                queue.pop(user_id, None)
+                if not queue:
+                    del self._buckets[bucket]
+        return waiter
+
+    def _pair(self, first: Waiter, second: Waiter) -> None:
+        session = AnonymousCallSession(
+            user_a_id=first.user_id,
+            user_b_id=second.user_id,
+            status=CallStatus.ACCEPTED,
+        )
+        shared = first.tags & second.tags
+        now = time.monotonic()
+        self.time_to_match.observe(now - first.joined_at)
+        self.time_to_match.observe(now - second.joined_at)
+        self._matches += 1
+
+        first.match.set_result(Match(session_id=session.id, peer_id=second.user_id, initiator=True, shared_tags=shared))
+        second.match.set_result(Match(session_id=session.id, peer_id=first.user_id, initiator=False, shared_tags=shared))
+
+        if self.session_writer is not None:
+            self.session_writer.add(InsertOne(session.model_dump()))
+
+    # --- Eviction ---
+
+    def evict_expired(self) -> int:
+        cutoff = time.monotonic() - self.timeout_seconds
+        # The catch-all bucket holds every waiter oldest first, so expired ones are at its head
+        queue = self._buckets.get(ANY_BUCKET)
+        evicted = 0
+        while queue:
+            user_id, waiter = next(iter(queue.items()))
+            if waiter.joined_at > cutoff:
+                break
+            self._remove(user_id)
+            if not waiter.match.done():
+                waiter.match.set_exception(asyncio.TimeoutError())
+            evicted += 1
+            queue = self._buckets.get(ANY_BUCKET)
+        self._timeouts += evicted
+        return evicted
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(min(5.0, self.timeout_seconds / 4))
+            evicted = self.evict_expired()
+            if evicted:
+                logger.info(f"[Matchmaking] Evicted {evicted} waiters after {self.timeout_seconds}s")
+
+    def start(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+        if self.session_writer is not None:
+            self.session_writer.start()
+
+    async def stop(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+        for user_id in list(self._waiting):
+            self.leave(user_id)
+        if self.session_writer is not None:
+            await self.session_writer.stop()
+
+    # --- Metrics ---
+
+    def status_of(self, user_id: UUID) -> MatchmakingStatus:
+        return MatchmakingStatus.WAITING if user_id in self._waiting else MatchmakingStatus.DISCONNECTED
+
+    def metrics(self) -> Dict[str, object]:
+        return {
+            "waiting": len(self._waiting),
+            "buckets": {bucket: len(queue) for bucket, queue in self._buckets.items() if bucket != ANY_BUCKET},
+            "matches": self._matches,
+            "timeouts": self._timeouts,
+            "cancelled": self._cancelled,
+            "time_to_match_seconds": self.time_to_match.snapshot(),
+            "persistence": self.session_writer.metrics() if self.session_writer else None,
+        }
+
+
+# --- Lifecycle ---
+
+matchmaking_service: Optional[MatchmakingService] = None
+
+# Called from the application lifespan once the database is connected
+def start_matchmaking(db: AsyncIOMotorDatabase) -> MatchmakingService:
+    global matchmaking_service
+    if matchmaking_service is None:
+        writer = BulkWriter(
+            db[CollectionName.ANONYMOUS_CALL_SESSIONS.value],
+            name="anonymous_call_sessions",
+            batch_size=settings.MATCHMAKING_PERSIST_BATCH_SIZE,
+        )
+        matchmaking_service = MatchmakingService(
+            session_writer=writer,
+            timeout_seconds=settings.MATCHMAKING_TIMEOUT_SECONDS,
+            max_tags=settings.MATCHMAKING_MAX_TAGS,
+        )
+        matchmaking_service.start()
+    return matchmaking_service
+
+def get_matchmaking_service() -> MatchmakingService:
+    if matchmaking_service is None:
+        raise RuntimeError("Matchmaking not started. Call start_matchmaking() first.")
+    return matchmaking_service
+
+async def stop_matchmaking():
+    global matchmaking_service
+    if matchmaking_service is not None:
+        await matchmaking_service.stop()
+        matchmaking_service = None
@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from fastapi import HTTPException, status
+from app.models.models import Conversation, Message
+from app.repositories.message import MessageRepository
+from app.repositories.conversation import ConversationRepository
+from app.repositories.user.user_profile import UserProfileRepository
+from app.schemas.schema import MarkReadSchema, MessagePageSchema, MessageSchema, SendMessageRequestSchema
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.services.chat import ChatRelay, sync_cursor, to_stored_precision
+from app.core.logging import get_logger
+from app.services.base import BaseService
+
+logger = get_logger()
+
+
+class MessageService(BaseService):
+    def __init__(
+        self,
+        message_repository: MessageRepository,
+        conversation_repository: ConversationRepository,
+        profile_repository: UserProfileRepository,
+        relay: Optional[ChatRelay] = None,
+    ):
+        super().__init__(message_repository)
+        self.message_repo = message_repository
+        self.conversation_repo = conversation_repository
+        self.profile_repo = profile_repository
+        self.relay = relay
+
+    async def send(self, sender_id: UUID, request: SendMessageRequestSchema) -> MessageSchema:
+        if sender_id == request.receiver_user_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You cannot message yourself")
+        if await self.profile_repo.get_profile_by_user_id(request.receiver_user_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        message = Message(
+            sender_user_id=sender_id,
+            receiver_user_id=request.receiver_user_id,
+            text=request.text,
+            # What gets pushed live must equal what is stored, or cursors built from it skip messages
+            timestamp=to_stored_precision(datetime.utcnow()),
+        )
+        saved, _ = await self.message_repo.send_direct(message)
+        logger.info(f"[Send Message] {sender_id} -> {request.receiver_user_id} in conversation_id={saved.conversation_id}")
+        if self.relay:
+            # Delivery is best effort; an offline receiver picks the message up through /messages/sync
+            try:
+                await self.relay.message_sent(saved)
+            except Exception as e:
+                logger.warning(f"[Send Message] Live delivery failed for message_id={saved.id}: {e}")
+        return self.to_schema(saved)
+
+    async def get_history(
+        self,
+        conversation_id: UUID,
+        user_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> MessagePageSchema:
+        await self._require_participant(conversation_id, user_id)
+        messages, has_more = await self.message_repo.get_history_page(
+            conversation_id,
+            after=parse_cursor(cursor),
+            limit=clamp_page_size(limit),
+        )
+        next_cursor = None
+        if has_more and messages:
+            last = messages[-1]
+            next_cursor = encode_cursor({"d": last.timestamp.isoformat(), "id": str(last.id)})
+        return MessagePageSchema(items=[self.to_schema(message) for message in messages], next_cursor=next_cursor, has_more=has_more)
+
+    async def mark_read(self, conversation_id: UUID, user_id: UUID) -> MarkReadSchema:
+        conversation = await self._require_participant(conversation_id, user_id)
+        read_at = datetime.utcnow()
+        marked = await self.message_repo.mark_read(conversation_id, user_id, read_at=read_at)
+        if self.relay and marked:
+            await self.relay.publish_read(conversation_id, user_id, read_at, conversation.user_ids)
+        return MarkReadSchema(conversation_id=conversation_id, marked_read=marked)
+
+    async def sync(self, user_id: UUID, cursor: Optional[str] = None, limit: int = 100) -> MessagePageSchema:
+        """
+        Polling fallback for clients without a live socket: messages received after `cursor`, oldest
+        first. next_cursor is always set; without a cursor the sync starts from now.
+        """
+        after = parse_cursor(cursor)
+        if after is None:
+            return MessagePageSchema(items=[], next_cursor=sync_cursor(datetime.utcnow()), has_more=False)
+        messages, has_more = await self.message_repo.get_received_since(user_id, after=after, limit=clamp_page_size(limit))
+        next_cursor = sync_cursor(messages[-1].timestamp, messages[-1].id) if messages else cursor
+        return MessagePageSchema(items=[self.to_schema(message) for message in messages], next_cursor=next_cursor, has_more=has_more)
+
+    # --- Helpers ---
+    async def _require_participant(self, conversation_id: UUID, user_id: UUID) -> Conversation:
+        # Same 404 whether the conversation is missing or belongs to others, so ids cannot be probed
+        conversation = await self.conversation_repo.get_for_participant(conversation_id, user_id)
+        if conversation is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+        return conversation
+
+    def to_schema(self, message: Message) -> MessageSchema:
+        return MessageSchema(
+            id=message.id,
+            conversation_id=message.conversation_id,
+            sender_user_id=message.sender_user_id,
+            receiver_user_id=message.receiver_user_id,
+            text=message.text,
+            read=message.read,
+            read_at=message.read_at,
+            timestamp=message.timestamp,
+        )
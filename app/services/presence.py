@@ -0,0 +1,175 @@
+# app/services/presence.py
+
+import asyncio
+import os
+import socket
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+from app.core.config import settings
+from app.core.presence import PresenceBackend, InMemoryPresenceBackend
+import logging
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_BATCH_SIZE = 1000  # Users per pipelined backend write
+MAX_LOOKUP_SIZE = 200  # User ids per batched "who is online" query
+
+
+class PresenceTracker:
+    """
+    Who is online, across workers. Each worker counts the authenticated sockets its users have
+    open (DMs, signaling, matchmaking) in memory; a user's first socket marks them online in the
+    shared backend and their last one marks them offline. Every `heartbeat_interval` the worker
+    refreshes the entries of all its users in batched writes, and entries expire after `ttl`, so a
+    worker that crashes without cleaning up takes its users offline within one TTL.
+
+    Lookups answer users connected to this worker from memory and ask the backend about the rest
+    in a single round trip, never MongoDB.
+    """
+
+    def __init__(self, ttl: float, heartbeat_interval: float, node_id: Optional[str] = None):
+        if heartbeat_interval >= ttl:
+            raise ValueError("Presence heartbeat interval must be shorter than the TTL")
+        self.ttl = ttl
+        self.heartbeat_interval = heartbeat_interval
+        self.node_id = node_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._connections: Dict[UUID, int] = defaultdict(int)
+        self._syncing: Set[UUID] = set()
+        self._backend: PresenceBackend = InMemoryPresenceBackend()
+        self._task: Optional[asyncio.Task] = None
+        self._heartbeats = 0
+        self._lookups = 0
+        self._backend_errors = 0
+
+    # --- Connections ---
+
+    async def connect(self, user_id: UUID) -> None:
+        self._connections[user_id] += 1
+        if self._connections[user_id] == 1:
+            await self._sync(user_id)
+
+    async def disconnect(self, user_id: UUID) -> None:
+        count = self._connections.get(user_id)
+        if count is None:
+            return
+        if count > 1:
+            self._connections[user_id] = count - 1
+            return
+        del self._connections[user_id]
+        await self._sync(user_id)
+
+    async def _sync(self, user_id: UUID) -> None:
+        """
+        Bring the backend entry in line with the local count. Only one write per user is in flight;
+        a reconnect or disconnect that lands meanwhile is picked up when that write returns, so a
+        late set_offline can never overwrite a newer connect.
+        """
+        if user_id in self._syncing:
+            return
+        self._syncing.add(user_id)
+        try:
+            written: Optional[bool] = None
+            while (user_id in self._connections) != written:
+                written = user_id in self._connections
+                if written:
+                    await self._write(self._backend.set_online(self.node_id, [user_id], self.ttl))
+                else:
+                    await self._write(self._backend.set_offline(self.node_id, [user_id]))
+        finally:
+            self._syncing.discard(user_id)
+
+    def is_connected_here(self, user_id: UUID) -> bool:
+        return user_id in self._connections
+
+    # --- Lookups ---
+
+    async def online(self, user_ids: Iterable[UUID]) -> Set[UUID]:
+        """The subset of `user_ids` that is online on any worker."""
+        self._lookups += 1
+        local: Set[UUID] = set()
+        remote: List[UUID] = []
+        for user_id in dict.fromkeys(user_ids):
+            if user_id in self._connections:
+                local.add(user_id)
+            else:
+                remote.append(user_id)
+        if not remote:
+            return local
+        try:
+            return local | await self._backend.online(remote)
+        except Exception as e:
+            # Presence is advisory; degrade to what this worker knows rather than fail the request
+            self._backend_errors += 1
+            logger.error(f"[Presence] Lookup of {len(remote)} users failed: {e}")
+            return local
+
+    async def is_online(self, user_id: UUID) -> bool:
+        return user_id in await self.online([user_id])
+
+    # --- Heartbeat ---
+
+    async def heartbeat(self) -> int:
+        """Refresh this worker's entries; returns how many users were refreshed."""
+        user_ids = list(self._connections)
+        for start in range(0, len(user_ids), HEARTBEAT_BATCH_SIZE):
+            await self._write(self._backend.set_online(self.node_id, user_ids[start:start + HEARTBEAT_BATCH_SIZE], self.ttl))
+        # Users who left while the refresh was in flight were just marked online again
+        gone = [user_id for user_id in user_ids if user_id not in self._connections]
+        if gone:
+            await self._write(self._backend.set_offline(self.node_id, gone))
+        self._heartbeats += 1
+        return len(user_ids)
+
+    async def _write(self, operation) -> None:
+        try:
+            await operation
+        except Exception as e:
+            # The next heartbeat retries; until then the entry is at most one TTL stale
+            self._backend_errors += 1
+            logger.error(f"[Presence] Backend write failed: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.heartbeat()
+            except Exception as e:
+                logger.error(f"[Presence] Heartbeat failed: {e}")
+
+    # --- Lifecycle ---
+
+    def start(self, backend: PresenceBackend) -> None:
+        self._backend = backend
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # A clean shutdown takes its users offline now instead of after the TTL
+        user_ids = list(self._connections)
+        for start in range(0, len(user_ids), HEARTBEAT_BATCH_SIZE):
+            await self._write(self._backend.set_offline(self.node_id, user_ids[start:start + HEARTBEAT_BATCH_SIZE]))
+        await self._backend.close()
+
+    def metrics(self) -> Dict[str, object]:
+        return {
+            "node_id": self.node_id,
+            "local_users": len(self._connections),
+            "connections": sum(self._connections.values()),
+            "heartbeats": self._heartbeats,
+            "lookups": self._lookups,
+            "backend_errors": self._backend_errors,
+        }
+
+
+presence_tracker = PresenceTracker(
+    ttl=settings.PRESENCE_TTL_SECONDS,
+    heartbeat_interval=settings.PRESENCE_HEARTBEAT_SECONDS,
+)
@@ -1,62 +1,192 @@
-import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
 from uuid import uuid4
 from fastapi import UploadFile
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 import boto3
-from dotenv import load_dotenv
-from app.repositories.base import BaseRepository
+from app.core.config import settings
+from app.core.cache import TTLCache
 import logging
 logger = logging.getLogger(__name__)
 
-# Load from .env
-load_dotenv()
+MB = 1024 * 1024
+MIN_PART_SIZE = 5 * MB
 
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-AWS_REGION = os.getenv("AWS_REGION")
-S3_BUCKET_NAME = os.getenv("AWS_S3_BUCKET_NAME")
-S3_BASE_URL = f"https://{S3_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com"
 
+def create_s3_client():
+    config = Config(
+        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+        # "standard" retries throttling and transient errors with jittered exponential backoff
+        retries={"max_attempts": settings.S3_MAX_ATTEMPTS, "mode": "standard"},
+    )
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        endpoint_url=settings.S3_ENDPOINT_URL,
+        config=config,
+    )
 
 
 class S3Service:
-    def __init__(self):
-        self.bucket_name = S3_BUCKET_NAME
-        self.base_url = S3_BASE_URL
-        self.s3_client = boto3.client(
-            "s3",
-            region_name=self.AWS_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    """
+    Async facade over boto3. Network calls run on a dedicated thread pool so uploads and deletes
+    never block the event loop; presigning is a local HMAC and stays synchronous.
+    """
+
+    def __init__(self, s3_client=None, bucket_name: Optional[str] = None):
+        self.bucket_name = bucket_name or settings.AWS_S3_BUCKET_NAME
+        self.base_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com"
+        self.s3_client = s3_client or create_s3_client()
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * MB,
+            multipart_chunksize=settings.S3_MULTIPART_CHUNK_MB * MB,
+            max_concurrency=4,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=settings.S3_WORKERS, thread_name_prefix="s3")
+        # (key, expires_in) -> signed GET URL; each entry lives for S3_PRESIGN_REUSE_FRACTION of its expiry
+        self.presign_cache: TTLCache[Tuple[str, int], str] = TTLCache(
+            max_size=settings.S3_PRESIGN_CACHE_SIZE,
+            ttl=settings.S3_PRESIGN_EXPIRES_SECONDS * settings.S3_PRESIGN_REUSE_FRACTION,
         )
 
+    async def _run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
     def _generate_key(self, folder: str, filename: str) -> str:
         file_extension = filename.split(".")[-1]
-        from pathlib import Path
         return str(Path(folder) / f"{uuid4()}.{file_extension}")
 
+    def key_from_url(self, file_url: str) -> str:
+        return file_url.split(f"{self.base_url}/")[-1]
 
     async def upload_file(self, file: UploadFile, folder: str = "uploads") -> str:
         key = self._generate_key(folder, file.filename)
 
         try:
-            file_content = await file.read()
-            self.s3_client.put_object(
+            # upload_fileobj reads the spooled upload in chunks and switches to multipart above the threshold
+            await file.seek(0)
+            await self._run(
+                self.s3_client.upload_fileobj,
+                file.file,
+                self.bucket_name,
+                key,
+                ExtraArgs={"ContentType": file.content_type},
+                Config=self.transfer_config,
+            )
+            logger.info(f"File uploaded to S3: {key}")
+        except (ClientError, S3UploadFailedError) as e:
+            # The transfer manager wraps failed part uploads in S3UploadFailedError rather than ClientError
+            raise Exception(f"S3 upload error: {str(e)}")
+
+        return f"{self.base_url}/{key}"
+
+    async def _iter_parts(self, file: UploadFile, part_size: int, read_size: int) -> AsyncIterator[bytes]:
+        buffer = bytearray()
+        while chunk := await file.read(read_size):
+            buffer.extend(chunk)
+            if len(buffer) >= part_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    async def upload_stream(self, file: UploadFile, folder: str = "uploads", part_size: Optional[int] = None) -> str:
+        """
+        Pipe the upload to S3 part by part, so memory per upload is bounded by two parts whatever
+        the file size. Bodies that fit in one part go up as a single put_object.
+        """
+        key = self._generate_key(folder, file.filename)
+        part_size = max(part_size or settings.S3_STREAM_PART_SIZE_MB * MB, MIN_PART_SIZE)
+        read_size = settings.S3_STREAM_READ_CHUNK_KB * 1024
+
+        await file.seek(0)
+        parts_iter = self._iter_parts(file, part_size, read_size)
+        body = await anext(parts_iter, b"")
+        next_body = await anext(parts_iter, None)
+
+        if next_body is None:
+            try:
+                await self._run(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=body,
+                    ContentType=file.content_type,
+                )
+                logger.info(f"File uploaded to S3: {key}")
+            except ClientError as e:
+                raise Exception(f"S3 upload error: {str(e)}")
+            return f"{self.base_url}/{key}"
+
+        try:
+            response = await self._run(
+                self.s3_client.create_multipart_upload,
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=file_content,
                 ContentType=file.content_type,
             )
-            logger.info(f"File uploaded to S3: {key}")
         except ClientError as e:
             raise Exception(f"S3 upload error: {str(e)}")
+        upload_id = response["UploadId"]
+
+        parts = []
+
+        async def upload_part(part_body: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await self._run(
+                self.s3_client.upload_part,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=part_body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            await upload_part(body)
+            await upload_part(next_body)
+            del body, next_body
+            async for part_body in parts_iter:
+                await upload_part(part_body)
+
+            await self._run(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            logger.info(f"File streamed to S3: {key} ({len(parts)} parts)")
+        except ClientError as e:
+            await self._abort_multipart(key, upload_id)
+            raise Exception(f"S3 upload error: {str(e)}")
+        except BaseException:
+            # Client disconnects and cancellation must not leave billed, orphaned parts behind
+            await self._abort_multipart(key, upload_id)
+            raise
 
         return f"{self.base_url}/{key}"
 
-    def delete_file(self, file_url: str):
+    async def _abort_multipart(self, key: str, upload_id: str) -> None:
+        # Uploaded parts are billed until the multipart upload is aborted
         try:
-            key = file_url.split(f"{self.base_url}/")[-1]
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+            await self._run(self.s3_client.abort_multipart_upload, Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+        except ClientError as e:
+            logger.error(f"Failed to abort multipart upload {upload_id} for {key}: {e}")
+
+    async def delete_file(self, file_url: str):
+        try:
+            key = self.key_from_url(file_url)
+            await self._run(self.s3_client.delete_object, Bucket=self.bucket_name, Key=key)
             logger.info(f"File deleted to S3: {key}")
         except ClientError as e:
             raise Exception(f"S3 deletion error: {str(e)}")
@@ -79,9 +209,12 @@ class S3Service:
         except ClientError as e:
             raise Exception(f"S3 presigned upload URL error: {str(e)}")
 
-    def generate_presigned_download_url(self, key: str, expires_in: int = 3600) -> str:
+    def generate_presigned_download_url(self, key: str, expires_in: int = settings.S3_PRESIGN_EXPIRES_SECONDS) -> str:
+        cached = self.presign_cache.get((key, expires_in))
+        if cached:
+            return cached
         try:
-            return self.s3_client.generate_presigned_url(
+            url = self.s3_client.generate_presigned_url(
                 ClientMethod="get_object",
                 Params={
                     "Bucket": self.bucket_name,
@@ -90,4 +223,27 @@ class S3Service:
                 ExpiresIn=expires_in,
             )
         except ClientError as e:
-            raise Exception(f"S3 presigned download URL error: {str(e)}")
\ No newline at end of file
+            raise Exception(f"S3 presigned download URL error: {str(e)}")
+        self.presign_cache.set((key, expires_in), url, ttl=expires_in * settings.S3_PRESIGN_REUSE_FRACTION)
+        return url
+
+    def generate_presigned_download_urls(self, keys: Iterable[str], expires_in: int = settings.S3_PRESIGN_EXPIRES_SECONDS) -> Dict[str, str]:
+        """Sign a page worth of keys at once; repeated and recently signed keys cost a dict lookup."""
+        urls: Dict[str, str] = {}
+        for key in keys:
+            if key not in urls:
+                urls[key] = self.generate_presigned_download_url(key, expires_in)
+        return urls
+
+    def is_presignable_key(self, key: str) -> bool:
+        return any(key.startswith(prefix) for prefix in settings.S3_PRESIGN_ALLOWED_PREFIXES)
+
+    def is_video_media_key(self, key: str) -> bool:
+        """Keys that may only be signed for callers allowed to watch the video that owns them."""
+        return any(key.startswith(prefix) for prefix in settings.S3_PRESIGN_VIDEO_PREFIXES)
+
+    def url_for_key(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
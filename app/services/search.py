@@ -0,0 +1,74 @@
+from typing import Optional
+from app.repositories.user.user_profile import UserProfileRepository
+from app.repositories.video.video_repository import VideoRepository
+from app.schemas.schema import UserSearchItemSchema, UserSearchPageSchema
+from app.schemas.video_schema import VideoFeedPageSchema
+from app.services.video.mappers import video_to_response
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.visibility import Viewer, video_visibility_filter
+from app.core.tags import normalize_tag
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+AUTOCOMPLETE_LIMIT = 10
+
+
+class SearchService:
+    """
+    Keyword search over published videos and profiles, backed by MongoDB text indexes and ranked
+    by text score. Pages continue from the last hit's (score, id), so they stay consistent
+    while new documents are indexed.
+    """
+
+    def __init__(self, video_repository: VideoRepository, profile_repository: UserProfileRepository):
+        self.video_repo = video_repository
+        self.profile_repo = profile_repository
+
+    async def search_videos(
+        self,
+        query: str,
+        viewer: Optional[Viewer] = None,
+        tag: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+    ) -> VideoFeedPageSchema:
+        visibility = video_visibility_filter(viewer or Viewer.anonymous())
+        hits, has_more = await self.video_repo.search_page(
+            query,
+            after=parse_cursor(cursor, "s", float),
+            limit=clamp_page_size(limit),
+            visibility=visibility,
+            tag=normalize_tag(tag),
+        )
+        next_cursor = None
+        if has_more and hits:
+            video, score = hits[-1]
+            next_cursor = encode_cursor({"s": score, "id": str(video.video_id)})
+        return VideoFeedPageSchema(
+            items=[video_to_response(video) for video, _ in hits],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    async def search_users(self, query: str, cursor: Optional[str] = None, limit: int = 20) -> UserSearchPageSchema:
+        hits, has_more = await self.profile_repo.search_page(query, after=parse_cursor(cursor, "s", float), limit=clamp_page_size(limit))
+        next_cursor = None
+        if has_more and hits:
+            profile, score = hits[-1]
+            next_cursor = encode_cursor({"s": score, "id": str(profile.user_id)})
+        items = [
+            UserSearchItemSchema(
+                user_id=profile.user_id,
+                display_name=profile.display_name,
+                profile_picture_url=profile.profile_picture_url,
+                is_verified=profile.is_verified,
+                follower_count=profile.follower_count,
+            )
+            for profile, _ in hits
+        ]
+        return UserSearchPageSchema(items=items, next_cursor=next_cursor, has_more=has_more)
+
+    async def autocomplete_users(self, prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> list[UserSearchItemSchema]:
+        docs = await self.profile_repo.autocomplete(prefix, limit=max(1, min(limit, AUTOCOMPLETE_LIMIT)))
+        return [UserSearchItemSchema(**doc) for doc in docs]
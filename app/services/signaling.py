@@ -0,0 +1,318 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+from fastapi import WebSocket
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+import orjson
+from app.core.collections import CollectionName
+from app.core.config import settings
+from app.core.enums import CallStatus, SignalingMessageType
+from app.core.pubsub import PubSub
+from app.db.bulk_writer import BulkWriter
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEND_TIMEOUT_SECONDS = 2.0
+CANDIDATE_BATCH = "candidates"
+
+
+@dataclass
+class CallState:
+    call_id: UUID
+    caller_id: UUID
+    receiver_id: UUID
+    status: CallStatus = CallStatus.RINGING
+
+    def peer_of(self, user_id: UUID) -> Optional[UUID]:
+        if user_id == self.caller_id:
+            return self.receiver_id
+        if user_id == self.receiver_id:
+            return self.caller_id
+        return None
+
+
+class SignalingError(Exception):
+    pass
+
+
+class SignalingRelay:
+    """
+    Relays offer/answer/candidate/bye between the two sockets of a call. Sockets are kept in a
+    registry keyed by user_id; a peer connected to this worker is written to directly, a peer on
+    another worker is reached through its `signal:{user_id}` pub/sub channel.
+    Signaling messages themselves are never stored. Only CallSession transitions (ringing on the
+    first offer, accepted on the answer, ended/declined on bye or disconnect) are persisted, write-behind,
+    by the worker where the transition originated. Trickle-ICE candidates headed to the same peer
+    are coalesced for `candidate_batch_interval` seconds and sent as one message.
+    """
+
+    def __init__(self, session_writer: Optional[BulkWriter], candidate_batch_interval: float):
+        self.session_writer = session_writer
+        self.candidate_batch_interval = candidate_batch_interval
+        self._sockets: Dict[UUID, WebSocket] = {}
+        self._calls: Dict[UUID, CallState] = {}
+        self._user_calls: Dict[UUID, Set[UUID]] = {}
+        self._pending_candidates: Dict[Tuple[UUID, UUID], List[Dict[str, Any]]] = {}
+        self._flush_handles: Dict[Tuple[UUID, UUID], asyncio.TimerHandle] = {}
+        self._pubsub: Optional[PubSub] = None
+        self._relayed = 0
+        self._candidate_batches = 0
+        self._undeliverable = 0
+
+    @staticmethod
+    def channel(user_id: UUID) -> str:
+        return f"signal:{user_id}"
+
+    # --- Connections ---
+
+    async def connect(self, user_id: UUID, websocket: WebSocket) -> None:
+        # The newest socket wins; an older tab stays open but stops receiving signals
+        first = user_id not in self._sockets
+        self._sockets[user_id] = websocket
+        if first and self._pubsub is not None:
+            await self._pubsub.subscribe(self.channel(user_id), self._deliver)
+
+    async def disconnect(self, user_id: UUID, websocket: WebSocket) -> None:
+        if self._sockets.get(user_id) is not websocket:
+            return
+        del self._sockets[user_id]
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel(user_id), self._deliver)
+        # Hang up whatever this user was still part of so the peer is not left ringing
+        for call_id in list(self._user_calls.get(user_id, ())):
+            call = self._calls.get(call_id)
+            if call is not None:
+                await self.handle(user_id, {"type": SignalingMessageType.BYE.value, "call_id": str(call_id), "data": {"reason": "disconnected"}})
+
+    # --- Inbound (from a local socket) ---
+
+    async def handle(self, user_id: UUID, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Route one client message. Returns an ack for the sender; raises SignalingError on bad input."""
+        try:
+            kind = SignalingMessageType(message.get("type"))
+        except ValueError:
+            raise SignalingError(f"Unknown type: {message.get('type')}")
+        data = message.get("data") or {}
+        call_id = self._parse_uuid(message.get("call_id")) if message.get("call_id") else None
+        call = self._calls.get(call_id) if call_id else None
+
+        if kind == SignalingMessageType.OFFER and call is None:
+            # A new call; later offers on the same call are renegotiations
+            to_user_id = self._parse_uuid(message.get("to_user_id"))
+            if to_user_id == user_id:
+                raise SignalingError("Cannot call yourself")
+            call = CallState(call_id=call_id or uuid4(), caller_id=user_id, receiver_id=to_user_id)
+        elif call is None:
+            raise SignalingError("Unknown call")
+
+        to_user_id = call.peer_of(user_id)
+        if to_user_id is None:
+            raise SignalingError("Not a participant of this call")
+
+        if kind == SignalingMessageType.CANDIDATE:
+            self._queue_candidate(user_id, to_user_id, call.call_id, data)
+            return {"type": "ack", "call_id": str(call.call_id)}
+
+        # Candidates queued before this message must not overtake it
+        await self._flush_candidates(to_user_id, call.call_id)
+        payload = self._payload(kind.value, call, user_id, data)
+        delivered = await self._route(to_user_id, payload)
+
+        if kind == SignalingMessageType.OFFER and call.call_id not in self._calls:
+            if not delivered:
+                return {"type": "unavailable", "call_id": str(call.call_id), "to_user_id": str(to_user_id)}
+            self._track(call)
+            self._persist(call, insert=True)
+        elif kind == SignalingMessageType.ANSWER and call.status == CallStatus.RINGING:
+            call.status = CallStatus.ACCEPTED
+            self._persist(call)
+        elif kind == SignalingMessageType.BYE:
+            # A receiver hanging up before answering is a decline
+            declined = call.status == CallStatus.RINGING and user_id == call.receiver_id
+            call.status = CallStatus.DECLINED if declined else CallStatus.ENDED
+            self._persist(call, ended=True)
+            self._untrack(call)
+        return {"type": "ack", "call_id": str(call.call_id)}
+
+    # --- Candidate batching ---
+
+    def _queue_candidate(self, from_user_id: UUID, to_user_id: UUID, call_id: UUID, candidate: Dict[str, Any]) -> None:
+        key = (to_user_id, call_id)
+        pending = self._pending_candidates.setdefault(key, [])
+        pending.append(candidate)
+        if key not in self._flush_handles:
+            loop = asyncio.get_running_loop()
+            self._flush_handles[key] = loop.call_later(
+                self.candidate_batch_interval,
+                lambda: asyncio.ensure_future(self._flush_candidates(to_user_id, call_id)),
+            )
+
+    async def _flush_candidates(self, to_user_id: UUID, call_id: UUID) -> None:
+        key = (to_user_id, call_id)
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        candidates = self._pending_candidates.pop(key, None)
+        call = self._calls.get(call_id)
+        if not candidates or call is None:
+            return
+        payload = self._payload(CANDIDATE_BATCH, call, call.peer_of(to_user_id), {"candidates": candidates})
+        self._candidate_batches += 1
+        await self._route(to_user_id, payload)
+
+    # --- Delivery ---
+
+    @staticmethod
+    def _payload(kind: str, call: CallState, from_user_id: UUID, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": kind,
+            "call_id": str(call.call_id),
+            "from_user_id": str(from_user_id),
+            "caller_id": str(call.caller_id),
+            "receiver_id": str(call.receiver_id),
+            "data": data,
+        }
+
+    async def _route(self, to_user_id: UUID, payload: Dict[str, Any]) -> bool:
+        self._relayed += 1
+        if to_user_id in self._sockets:
+            return await self._send_local(to_user_id, payload)
+        if self._pubsub is not None and await self._pubsub.publish(self.channel(to_user_id), payload):
+            return True
+        self._undeliverable += 1
+        return False
+
+    async def _send_local(self, user_id: UUID, payload: Dict[str, Any]) -> bool:
+        websocket = self._sockets.get(user_id)
+        if websocket is None:
+            return False
+        try:
+            await asyncio.wait_for(websocket.send_text(orjson.dumps(payload).decode()), SEND_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logger.warning(f"[Signaling] Send to user_id={user_id} failed: {e}")
+            return False
+
+    async def _deliver(self, channel: str, payload: Dict[str, Any]) -> None:
+        """Pub/sub handler: a peer on another worker signalled a user connected here."""
+        user_id = UUID(channel.split(":", 1)[1])
+        # Mirror the call state so this side can keep signalling; the sender's worker persisted it
+        call = CallState(
+            call_id=UUID(payload["call_id"]),
+            caller_id=UUID(payload["caller_id"]),
+            receiver_id=UUID(payload["receiver_id"]),
+        )
+        kind = payload["type"]
+        if kind == SignalingMessageType.OFFER.value:
+            self._calls.setdefault(call.call_id, call)
+            self._track(self._calls[call.call_id])
+        elif kind == SignalingMessageType.ANSWER.value and call.call_id in self._calls:
+            self._calls[call.call_id].status = CallStatus.ACCEPTED
+        elif kind == SignalingMessageType.BYE.value and call.call_id in self._calls:
+            self._untrack(self._calls[call.call_id])
+        await self._send_local(user_id, payload)
+
+    # --- Call state ---
+
+    def _track(self, call: CallState) -> None:
+        self._calls[call.call_id] = call
+        self._user_calls.setdefault(call.caller_id, set()).add(call.call_id)
+        self._user_calls.setdefault(call.receiver_id, set()).add(call.call_id)
+
+    def _untrack(self, call: CallState) -> None:
+        self._calls.pop(call.call_id, None)
+        for user_id in (call.caller_id, call.receiver_id):
+            calls = self._user_calls.get(user_id)
+            if calls is not None:
+                calls.discard(call.call_id)
+                if not calls:
+                    del self._user_calls[user_id]
+            key = (user_id, call.call_id)
+            self._pending_candidates.pop(key, None)
+            handle = self._flush_handles.pop(key, None)
+            if handle is not None:
+                handle.cancel()
+
+    def _persist(self, call: CallState, insert: bool = False, ended: bool = False) -> None:
+        if self.session_writer is None:
+            return
+        # Upserts keyed by id, so a transition flushed by one worker before the insert
+        # flushed by another still lands on a single document
+        on_insert = {
+            "id": call.call_id,
+            "caller_id": call.caller_id,
+            "receiver_id": call.receiver_id,
+            "started_at": datetime.utcnow(),
+        }
+        update: Dict[str, Any] = {"$setOnInsert": on_insert}
+        if insert:
+            on_insert["status"] = call.status.value
+        else:
+            update["$set"] = {"status": call.status.value}
+            if ended:
+                update["$set"]["ended_at"] = datetime.utcnow()
+        self.session_writer.add(UpdateOne({"id": call.call_id}, update, upsert=True))
+
+    @staticmethod
+    def _parse_uuid(value: Any) -> UUID:
+        try:
+            return UUID(str(value))
+        except ValueError:
+            raise SignalingError(f"Invalid id: {value}")
+
+    # --- Lifecycle ---
+
+    def start(self, pubsub: Optional[PubSub]) -> None:
+        self._pubsub = pubsub
+        if self.session_writer is not None:
+            self.session_writer.start()
+
+    async def stop(self) -> None:
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+        self._pending_candidates.clear()
+        if self.session_writer is not None:
+            await self.session_writer.stop()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "sockets": len(self._sockets),
+            "active_calls": len(self._calls),
+            "relayed": self._relayed,
+            "candidate_batches": self._candidate_batches,
+            "undeliverable": self._undeliverable,
+            "persistence": self.session_writer.metrics() if self.session_writer else None,
+        }
+
+
+# --- Lifecycle ---
+
+signaling_relay: Optional[SignalingRelay] = None
+
+# Called from the application lifespan once Mongo and pub/sub are connected
+def start_signaling(db: AsyncIOMotorDatabase, pubsub: PubSub) -> SignalingRelay:
+    global signaling_relay
+    if signaling_relay is None:
+        writer = BulkWriter(db[CollectionName.CALL_SESSIONS.value], name="call_sessions")
+        signaling_relay = SignalingRelay(
+            session_writer=writer,
+            candidate_batch_interval=settings.SIGNALING_CANDIDATE_BATCH_MS / 1000,
+        )
+        signaling_relay.start(pubsub)
+    return signaling_relay
+
+def get_signaling_relay() -> SignalingRelay:
+    if signaling_relay is None:
+        raise RuntimeError("Signaling relay not started. Call start_signaling() first.")
+    return signaling_relay
+
+async def stop_signaling():
+    global signaling_relay
+    if signaling_relay is not None:
+        await signaling_relay.stop()
+        signaling_relay = None
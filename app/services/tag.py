@@ -0,0 +1,188 @@
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.repositories.tag import TagRepository
+from app.repositories.video.video_repository import VideoRepository
+from app.schemas.schema import TagSchema
+from app.schemas.video_schema import VideoFeedPageSchema
+from app.core.cache import TTLCache
+from app.core.collections import CollectionName
+from app.core.config import settings
+from app.core.write_behind import WriteBehindCounter
+from app.services.video.mappers import video_to_response
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.tags import normalize_tag
+from app.core.visibility import Viewer, video_visibility_filter
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+VOCABULARY_KEY = "vocabulary"
+AUTOCOMPLETE_LIMIT = 10
+POPULAR_LIMIT = 100
+
+
+@dataclass(frozen=True)
+class TagVocabulary:
+    """Snapshot of the most used tags: names sorted for prefix ranges, counts aligned with them."""
+    names: List[str]
+    counts: List[int]
+    popular: List[Tuple[str, int]]  # Most used first
+    complete: bool  # False when the collection holds more tags than the snapshot
+
+    @classmethod
+    def build(cls, rows: List[Dict], max_size: int) -> "TagVocabulary":
+        ordered = sorted((row["name"], row.get("usage_count", 0)) for row in rows)
+        return cls(
+            names=[name for name, _ in ordered],
+            counts=[count for _, count in ordered],
+            popular=[(row["name"], row.get("usage_count", 0)) for row in rows[:POPULAR_LIMIT]],
+            complete=len(rows) < max_size,
+        )
+
+    def complete_prefix(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        """Most used tags starting with `prefix`: two bisections, then a top-k over the matching range."""
+        lo = bisect_left(self.names, prefix)
+        hi = bisect_left(self.names, prefix + "\U0010ffff", lo)
+        top = heapq.nlargest(limit, range(lo, hi), key=self.counts.__getitem__)
+        return [(self.names[i], self.counts[i]) for i in top]
+
+
+class TagCounter(WriteBehindCounter):
+    """
+    Write-back aggregator for Tag.usage_count (see WriteBehindCounter): publishes are summed per tag
+    and flushed as one unordered bulk write of upserting $inc updates.
+    """
+
+    name = "Tag Counter"
+
+    def __init__(self, tag_repository: TagRepository, flush_interval: float, max_pending: int):
+        super().__init__(flush_interval=flush_interval, max_pending=max_pending)
+        self.tag_repo = tag_repository
+
+    def record(self, tags: Iterable[str], delta: int = 1) -> None:
+        for tag in tags:
+            self.add(tag, delta)
+
+    async def _write(self, batch: Counter) -> None:
+        await self.tag_repo.increment_usage(dict(batch))
+
+
+class TagService:
+    """
+    Tag pages come from the multikey tags index on videos. Autocomplete and popular tags are
+    answered from a per-worker TagVocabulary snapshot, refreshed every TAG_VOCABULARY_TTL_SECONDS;
+    only prefixes that run past the snapshot fall back to a prefix range on the tags collection.
+    """
+
+    def __init__(self, tag_repository: TagRepository, video_repository: Optional[VideoRepository] = None):
+        self.tag_repo = tag_repository
+        self.video_repo = video_repository
+        self.vocabulary_cache: TTLCache[str, TagVocabulary] = TTLCache(
+            max_size=1,
+            ttl=settings.TAG_VOCABULARY_TTL_SECONDS,
+        )
+
+    def record_usage(self, tags: Iterable[str]) -> None:
+        """Count a publish against its (already normalized) tags; written back by the TagCounter."""
+        if tag_counter is None:
+            logger.warning("[Tags] Tag counter not started; usage not recorded")
+            return
+        tag_counter.record(tags)
+
+    async def get_tag(self, name: str) -> TagSchema:
+        normalized = normalize_tag(name)
+        tag = await self.tag_repo.get_by_name(normalized) if normalized else None
+        if tag is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+        return TagSchema(name=tag.name, usage_count=tag.usage_count)
+
+    async def get_popular(self, limit: int = 20) -> List[TagSchema]:
+        vocabulary = await self._vocabulary()
+        return [TagSchema(name=name, usage_count=count) for name, count in vocabulary.popular[:limit]]
+
+    async def autocomplete(self, prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> List[TagSchema]:
+        normalized = normalize_tag(prefix)
+        if not normalized:
+            return []
+        limit = max(1, min(limit, AUTOCOMPLETE_LIMIT))
+        vocabulary = await self._vocabulary()
+        matches = vocabulary.complete_prefix(normalized, limit)
+        if len(matches) < limit and not vocabulary.complete:
+            seen = {name for name, _ in matches}
+            for row in await self.tag_repo.find_by_prefix(normalized, limit):
+                if row["name"] not in seen and len(matches) < limit:
+                    matches.append((row["name"], row.get("usage_count", 0)))
+        return [TagSchema(name=name, usage_count=count) for name, count in matches]
+
+    async def get_tag_videos(
+        self,
+        name: str,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        viewer: Optional[Viewer] = None,
+    ) -> VideoFeedPageSchema:
+        normalized = normalize_tag(name)
+        if not normalized:
+            return VideoFeedPageSchema(items=[], next_cursor=None, has_more=False)
+        visibility = video_visibility_filter(viewer or Viewer.anonymous())
+        videos, has_more = await self.video_repo.get_tag_page(
+            normalized,
+            after=parse_cursor(cursor),
+            limit=clamp_page_size(limit),
+            visibility=visibility,
+        )
+        next_cursor = None
+        if has_more and videos:
+            last = videos[-1]
+            next_cursor = encode_cursor({"d": last.upload_date.isoformat(), "id": str(last.video_id)})
+        return VideoFeedPageSchema(
+            items=[video_to_response(video) for video in videos],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self.vocabulary_cache.stats()
+
+    # --- Helpers ---
+    async def _vocabulary(self) -> TagVocabulary:
+        vocabulary = self.vocabulary_cache.get(VOCABULARY_KEY)
+        if vocabulary is None:
+            rows = await self.tag_repo.get_most_used(settings.TAG_VOCABULARY_SIZE)
+            vocabulary = TagVocabulary.build(rows, settings.TAG_VOCABULARY_SIZE)
+            self.vocabulary_cache.set(VOCABULARY_KEY, vocabulary)
+        return vocabulary
+
+
+# --- Lifecycle ---
+
+tag_counter: Optional[TagCounter] = None
+
+# Called from the application lifespan once the database is connected
+def start_tag_counter(db: AsyncIOMotorDatabase) -> TagCounter:
+    global tag_counter
+    if tag_counter is None:
+        tag_counter = TagCounter(
+            TagRepository(db[CollectionName.TAGS.value]),
+            flush_interval=settings.TAG_FLUSH_INTERVAL_SECONDS,
+            max_pending=settings.TAG_FLUSH_MAX_PENDING,
+        )
+        tag_counter.start()
+    return tag_counter
+
+def get_tag_counter() -> TagCounter:
+    if tag_counter is None:
+        raise RuntimeError("Tag counter not started. Call start_tag_counter() first.")
+    return tag_counter
+
+# Flushes whatever is still buffered; must run before the Mongo client closes
+async def stop_tag_counter():
+    global tag_counter
+    if tag_counter is not None:
+        await tag_counter.stop()
+        tag_counter = None
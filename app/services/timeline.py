@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from uuid import UUID
+from app.models.vedio_model import TimelineEntry, Video
+from app.repositories.timeline import TimelineRepository
+from app.repositories.follow import FollowRepository
+from app.repositories.user.user_profile import UserProfileRepository
+from app.repositories.video.video_repository import VideoRepository
+from app.schemas.video_schema import VideoFeedPageSchema
+from app.services.follow import FollowService
+from app.services.video.mappers import video_to_response
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.enums import PrivacySetting
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.visibility import Viewer, video_visibility_filter
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+LARGE_CREATORS_KEY = "large_creators"
+
+
+class TimelineService:
+    """
+    Home feed ("videos from people I follow"). Publishing pushes the video into each follower's
+    capped timeline document (fan-out on write), so reading a page is one point lookup plus one
+    $in to hydrate it. Creators above TIMELINE_FANOUT_MAX_FOLLOWERS are skipped at publish time;
+    their recent videos are merged in when the feed is read (fan-out on read), which keeps a
+    single upload from turning into millions of writes.
+    """
+
+    def __init__(
+        self,
+        timeline_repository: TimelineRepository,
+        follow_repository: FollowRepository,
+        follow_service: FollowService,
+        profile_repository: UserProfileRepository,
+        video_repository: VideoRepository,
+    ):
+        self.timeline_repo = timeline_repository
+        self.follow_repo = follow_repository
+        self.follow_service = follow_service
+        self.profile_repo = profile_repository
+        self.video_repo = video_repository
+        self.large_creators: TTLCache[str, FrozenSet[UUID]] = TTLCache(
+            max_size=1,
+            ttl=settings.TIMELINE_LARGE_CREATORS_TTL_SECONDS,
+        )
+        self._fan_out_tasks: Set[asyncio.Task] = set()
+
+    # --- Write path ---
+
+    def schedule_fan_out(self, video: Video) -> None:
+        """Fan out in the background so publishing does not wait on follower writes."""
+        task = asyncio.create_task(self._fan_out_logged(video))
+        self._fan_out_tasks.add(task)
+        task.add_done_callback(self._fan_out_tasks.discard)
+
+    async def _fan_out_logged(self, video: Video) -> None:
+        try:
+            await self.fan_out(video)
+        except Exception as e:
+            logger.error(f"[Timeline Fan-out] Failed for video_id={video.video_id}: {e}")
+
+    async def fan_out(self, video: Video) -> int:
+        entry = TimelineEntry(video_id=video.video_id, author_id=video.user_id, upload_date=video.upload_date)
+        # Authors see their own uploads in their home feed
+        pushed = await self.timeline_repo.push_entry([video.user_id], entry)
+        if (video.visibility or video.privacy) == PrivacySetting.PRIVATE:
+            return pushed
+
+        follower_count = await self.profile_repo.get_follower_count(video.user_id)
+        if follower_count > settings.TIMELINE_FANOUT_MAX_FOLLOWERS:
+            logger.info(f"[Timeline Fan-out] video_id={video.video_id} served on read ({follower_count} followers)")
+            return pushed
+
+        async for follower_ids in self.follow_repo.follower_id_batches(video.user_id, settings.TIMELINE_FANOUT_BATCH_SIZE):
+            pushed += await self.timeline_repo.push_entry(follower_ids, entry)
+        logger.info(f"[Timeline Fan-out] video_id={video.video_id} pushed to {pushed} timelines")
+        return pushed
+
+    async def drain(self) -> None:
+        """Wait for in-flight fan-outs; called on shutdown."""
+        if self._fan_out_tasks:
+            await asyncio.gather(*self._fan_out_tasks, return_exceptions=True)
+
+    # --- Read path ---
+
+    async def get_home_feed(self, user_id: UUID, cursor: Optional[str] = None, limit: int = 20) -> VideoFeedPageSchema:
+        limit = clamp_page_size(limit)
+        after = parse_cursor(cursor)
+
+        following = await self.follow_service.get_following_ids(user_id)
+        authors = following | {user_id}
+        # Timeline entries predate any later privacy change, so hydration re-checks visibility
+        visibility = video_visibility_filter(Viewer(user_id=user_id, following=following))
+
+        # Entries for creators the user has since unfollowed are skipped rather than deleted
+        ranked: Dict[UUID, Tuple[datetime, UUID]] = {}
+        for entry in await self.timeline_repo.get_entries(user_id):
+            key = (entry.upload_date, entry.video_id)
+            if entry.author_id in authors and (after is None or key < after):
+                ranked[entry.video_id] = key
+
+        pulled: Dict[UUID, Video] = {}
+        large = await self._followed_large_creators(following)
+        if large:
+            for video in await self.video_repo.get_recent_by_authors(list(large), after=after, limit=limit + 1, visibility=visibility):
+                pulled[video.video_id] = video
+                ranked[video.video_id] = (video.upload_date, video.video_id)
+
+        page_keys = sorted(ranked.values(), reverse=True)[:limit + 1]
+        has_more = len(page_keys) > limit
+        page_keys = page_keys[:limit]
+
+        # One $in for whatever the read-side merge did not already load
+        missing = [video_id for _, video_id in page_keys if video_id not in pulled]
+        videos = {**pulled, **await self.video_repo.get_published_by_ids(missing, visibility=visibility)}
+        items = [videos[video_id] for _, video_id in page_keys if video_id in videos]
+
+        next_cursor = None
+        if has_more and page_keys:
+            upload_date, video_id = page_keys[-1]
+            next_cursor = encode_cursor({"d": upload_date.isoformat(), "id": str(video_id)})
+
+        return VideoFeedPageSchema(
+            items=[video_to_response(video) for video in items],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    async def _followed_large_creators(self, following: FrozenSet[UUID]) -> List[UUID]:
+        if not following:
+            return []
+        large = self.large_creators.get(LARGE_CREATORS_KEY)
+        if large is None:
+            large = frozenset(await self.profile_repo.get_user_ids_with_min_followers(settings.TIMELINE_FANOUT_MAX_FOLLOWERS + 1))
+            self.large_creators.set(LARGE_CREATORS_KEY, large)
+        smaller, larger = (large, following) if len(large) <= len(following) else (following, large)
+        return [user_id for user_id in smaller if user_id in larger]
@@ -1,11 +1,12 @@
 from uuid import uuid4, UUID
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
 from typing import Optional, Tuple, Dict
 from app.models.user_models import UserAuth, UserAuthCreate
 from app.repositories.user import UserAuthRepository
-from app.core.exceptions import AuthException
-from app.schemas.user_schema import UserRegisterRequest
+from app.core.exceptions import AuthException, PasswordHashingBusyException
+from app.core.hashing import PasswordHasher, password_hasher
+from app.core.cache import TTLCache
+from app.schemas.user_schema import UserRegisterRequest, UserData
 from app.core.security import verify_password, create_access_token, create_refresh_token, jwt
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -14,28 +15,42 @@ from app.services.base import BaseService
 logger = get_logger()
 
 class UserAuthService(BaseService):
-    def __init__(self, auth_repo: UserAuthRepository):
+    def __init__(self, auth_repo: UserAuthRepository, hasher: PasswordHasher = password_hasher):
         super().__init__(auth_repo)
         self.auth_repo = auth_repo  
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.hasher = hasher
+        # user_id -> UserData for tokens that lack the username claim; never holds password hashes
+        self.user_cache: TTLCache[str, UserData] = TTLCache(
+            max_size=settings.AUTH_USER_CACHE_SIZE,
+            ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+        )
+        # Deleted user_ids whose already-issued tokens must stop working on this worker
+        self.revoked_user_ids: TTLCache[str, bool] = TTLCache(
+            max_size=settings.AUTH_USER_CACHE_SIZE,
+            ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        )
 
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         try:
-            hashed = self.pwd_context.hash(password)
+            hashed = await self.hasher.hash(password)
             logger.debug("[Hash Password] Password hashed successfully")
             return hashed
+        except PasswordHashingBusyException:
+            raise
         except Exception as e:
             logger.error(f"[Hash Password] Failed to hash password: {e}")
             raise AuthException("Internal error during password hashing")
 
-    def verify_password(self, plain: str, hashed: str) -> bool:
+    async def verify_password(self, plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
         try:
-            result = self.pwd_context.verify(plain, hashed)
+            result, new_hash = await self.hasher.verify_and_update(plain, hashed)
             logger.debug(f"[Verify Password] Password verification result: {result}")
-            return result
+            return result, new_hash
+        except PasswordHashingBusyException:
+            raise
         except Exception as e:
             logger.error(f"[Verify Password] Error comparing password hash: {e}")
-            return False
+            return False, None
 
     async def register_user(self, user_data: UserRegisterRequest) -> UserAuth:
         try:
@@ -43,13 +58,15 @@ class UserAuthService(BaseService):
                 id=uuid4(),
                 email=user_data.email,
                 username=user_data.username,
-                hashed_password=self.hash_password(user_data.password),
+                hashed_password=await self.hash_password(user_data.password),
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow()
             )
             registered_user = await self.auth_repo.register_user(user)
             logger.info(f"[Register User] Successfully registered user: {user.email}")
             return registered_user
+        except PasswordHashingBusyException:
+            raise
         except Exception as e:
             logger.error(f"[Register User] Failed to register user {user_data.email}: {e}")
             raise AuthException("Failed to register user")
@@ -57,11 +74,19 @@ class UserAuthService(BaseService):
     async def authenticate(self, email: str, password: str):
         try:
             user = await self.auth_repo.get_by_email(email)
-            if user and self.verify_password(password, user.hashed_password):
-                logger.info(f"[Authenticate] Authenticated user: {email}")
-                return user
+            if user:
+                valid, new_hash = await self.verify_password(password, user.hashed_password)
+                if valid:
+                    if new_hash:
+                        # The configured bcrypt cost changed since this hash was made
+                        await self.auth_repo.update_password_hash(user.user_id, new_hash)
+                        logger.info(f"[Authenticate] Rehashed password for user: {email}")
+                    logger.info(f"[Authenticate] Authenticated user: {email}")
+                    return user
             logger.warning(f"[Authenticate] Authentication failed for user: {email}")
             return None
+        except PasswordHashingBusyException:
+            raise
         except Exception as e:
             logger.error(f"[Authenticate] Error during authentication for {email}: {e}")
             raise AuthException("Authentication failed")
@@ -78,10 +103,30 @@ class UserAuthService(BaseService):
             logger.error(f"[Get By Email] Failed to retrieve user {email}: {e}")
             raise AuthException("User lookup failed")
 
+    async def get_auth_user(self, user_id: str, email: str) -> Optional[UserData]:
+        cached = self.user_cache.get(user_id)
+        if cached:
+            return cached
+        user = await self.get_by_email(email)
+        if not user or str(user.user_id) != user_id:
+            return None
+        user_data = UserData(user_id=user.user_id, email=user.email, username=user.username)
+        self.user_cache.set(user_id, user_data)
+        return user_data
+
+    def is_revoked(self, user_id: str) -> bool:
+        return user_id in self.revoked_user_ids
+
+    def invalidate_user(self, user_id: UUID, revoke: bool = False) -> None:
+        self.user_cache.pop(str(user_id))
+        if revoke:
+            self.revoked_user_ids.set(str(user_id), True)
+
     async def delete_user(self, user_id: UUID) -> bool:
         try:
             result = await self.delete_by_user_id(user_id)
             if result:
+                self.invalidate_user(user_id, revoke=True)
                 logger.info(f"[Delete User] Successfully deleted user_id={user_id}")
             else:
                 logger.warning(f"[Delete User] User not found for deletion: user_id={user_id}")
@@ -90,9 +135,11 @@ class UserAuthService(BaseService):
             logger.error(f"[Delete User] Failed to delete user_id={user_id}: {e}")
             raise AuthException("Failed to delete user")
 
-    async def generate_token(self, user_id: UUID, email: str) -> Tuple[str, str]:
+    async def generate_token(self, user_id: UUID, email: str, username: Optional[str] = None) -> Tuple[str, str]:
         try:
             data = {"sub": str(user_id), "email": email}
+            if username:
+                data["username"] = username
             access_token = create_access_token(data)
             refresh_token = create_refresh_token(data)
             logger.info(f"[Generate Token] Tokens generated for user_id={user_id}")
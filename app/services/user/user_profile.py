@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Tuple, dict, List
 from app.models.user_models import UserProfile, UserProfileUpdate
 from app.repositories.user.user_profile import UserProfileRepository
+from app.repositories.video.video_repository import VideoRepository
 from app.schemas.user_schema import UserRegisterRequest
 from app.core.logging import get_logger
 from app.services.base import BaseService
@@ -14,7 +15,7 @@ logger = get_logger()
 # user_profile_service.py
 class UserProfileService(BaseService):
 
-    def __init__(self, profile_repo: UserProfileRepository):    
+    def __init__(self, profile_repo: UserProfileRepository, video_repo: Optional[VideoRepository] = None):    
         
         """
         This line calls the constructor of the parent class BaseService, passing profile_repo to it.
@@ -25,6 +26,7 @@ class UserProfileService(BaseService):
         
         super().__init__(profile_repo)
         self.profile_repo = profile_repo
+        self.video_repo = video_repo
 
 
     async def create_profile(self, profile_data: UserProfile) -> UserProfile:
@@ -76,6 +78,9 @@ class UserProfileService(BaseService):
                 logger.error(f"[Update Profile] No changes applied for user_id={user_id}. Update may have failed silently.")
                 raise HTTPException(status_code=500, detail="Update failed")
             logger.info(f"[Update Profile] Successfully updated profile for user_id={user_id}")
+            # Account privacy caps the visibility stored on each video, so existing videos follow the change
+            if update_dict.get("privacy_setting") is not None and self.video_repo:
+                await self.video_repo.apply_account_privacy(user_id, update_dict["privacy_setting"])
             return updated
 
         except Exception as e:
@@ -0,0 +1,24 @@
+# app/services/video/mappers.py
+
+from app.models.vedio_model import Video
+from app.schemas.video_schema import VideoResponseSchema
+
+
+def video_to_response(video: Video) -> VideoResponseSchema:
+    """The API view of a stored video; every endpoint that returns videos goes through here."""
+    return VideoResponseSchema(
+        video_id=video.video_id,
+        s3_url=video.s3_url,
+        thumbnail_url=video.thumbnail_url,
+        description=video.description,
+        tags=video.tags,
+        location=video.location,
+        duration=video.duration,
+        privacy=video.privacy,
+        is_featured=video.is_featured,
+        views=video.views,
+        like_count=video.like_count,
+        comment_count=video.comment_count,
+        status=video.status,
+        upload_date=video.upload_date,
+    )
@@ -0,0 +1,191 @@
+# app/services/video/trending_ranker.py
+
+import asyncio
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.models.vedio_model import TrendingVideo
+from app.repositories.trending import TrendingRepository
+from app.repositories.video.video_repository import VideoRepository
+from app.db.lease import Lease
+from app.core.collections import CollectionName
+from app.core.config import settings
+from app.core.enums import PrivacySetting
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Engagement weights: a comment says more than a like, a like more than a view
+VIEW_WEIGHT = 1
+LIKE_WEIGHT = 5
+COMMENT_WEIGHT = 10
+# Scores are measured from a fixed epoch rather than "now", so a video's score only moves when its
+# counters do and rows written by earlier runs stay comparable with fresh ones.
+TRENDING_EPOCH = datetime(2024, 1, 1)
+
+
+def trending_score(views: int, likes: int, comments: int, upload_date: datetime, decay_hours: float) -> float:
+    """log10 of weighted engagement plus a recency bonus: every `decay_hours` newer is worth 10x the engagement."""
+    engagement = views * VIEW_WEIGHT + likes * LIKE_WEIGHT + comments * COMMENT_WEIGHT
+    age_bonus = (upload_date - TRENDING_EPOCH).total_seconds() / (decay_hours * 3600)
+    return math.log10(max(engagement, 1)) + age_bonus
+
+
+class TrendingRanker:
+    """
+    Background job materializing trending scores. Every `interval` seconds it streams the ranking
+    inputs of the videos published within the window (an index range on the feed index, so cost
+    tracks upload volume, not catalogue size) and upserts scores into the trending collection in
+    bulk. Feed requests then read one page of an index on that collection.
+
+    Only the worker holding the job's lease runs it. The owner remembers the inputs each row was
+    scored from, so a run rewrites only videos whose counters or visibility changed and deletes the
+    rows of videos that left the window (aged out, unpublished or deleted). Its first run after
+    taking the lease has nothing to compare against, so it rewrites the window and prunes by
+    computed_at instead.
+    """
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        trending_repository: TrendingRepository,
+        interval: float,
+        window_hours: float,
+        decay_hours: float,
+        batch_size: int,
+        lease: Optional[Lease] = None,
+    ):
+        if lease is not None and lease.ttl <= interval:
+            raise ValueError("Trending lease must outlive the refresh interval")
+        self.video_repo = video_repository
+        self.trending_repo = trending_repository
+        self.interval = interval
+        self.window = timedelta(hours=window_hours)
+        self.decay_hours = decay_hours
+        self.batch_size = batch_size
+        self.lease = lease
+        # video_id -> the inputs its trending row was last written from
+        self._scored: Dict[UUID, Tuple] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._runs = 0
+        self._skipped = 0
+        self._failures = 0
+        self._last_scored = 0
+        self._last_pruned = 0
+        self._last_duration_ms = 0.0
+        self._last_run_at: Optional[datetime] = None
+
+    async def refresh(self) -> int:
+        """Rescore what changed since the last run; returns how many rows were written."""
+        started = datetime.utcnow()
+        if self.lease is not None and not await self.lease.acquire():
+            # Another worker owns the rows now; rebuild them in full if the lease comes back here
+            self._scored.clear()
+            self._skipped += 1
+            return 0
+
+        rebuild = not self._scored
+        seen: Dict[UUID, Tuple] = {}
+        scored = 0
+        async for batch in self.video_repo.iter_published_since(started - self.window, self.batch_size):
+            rows = []
+            for doc in batch:
+                visibility = doc.get("visibility") or doc.get("privacy") or PrivacySetting.FOLLOWERS_ONLY
+                views, likes, comments = doc.get("views", 0), doc.get("like_count", 0), doc.get("comment_count", 0)
+                inputs = (doc["user_id"], visibility, views, likes, comments)
+                seen[doc["video_id"]] = inputs
+                if self._scored.get(doc["video_id"]) == inputs:
+                    continue  # Scores are measured from a fixed epoch, so unchanged inputs mean an unchanged row
+                rows.append(TrendingVideo(
+                    video_id=doc["video_id"],
+                    user_id=doc["user_id"],
+                    visibility=visibility,
+                    upload_date=doc["upload_date"],
+                    score=trending_score(views, likes, comments, doc["upload_date"], self.decay_hours),
+                    computed_at=started,
+                ))
+            await self.trending_repo.upsert_scores(rows)
+            scored += len(rows)
+
+        if rebuild:
+            pruned = await self.trending_repo.prune(computed_before=started)
+        else:
+            pruned = await self.trending_repo.delete_by_video_ids([video_id for video_id in self._scored if video_id not in seen])
+        self._scored = seen
+
+        self._runs += 1
+        self._last_scored = scored
+        self._last_pruned = pruned
+        self._last_run_at = started
+        self._last_duration_ms = (datetime.utcnow() - started).total_seconds() * 1000
+        logger.info(f"[Trending] Scored {scored} of {len(seen)} videos, pruned {pruned} in {self._last_duration_ms:.0f}ms")
+        return scored
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self._failures += 1
+                logger.error(f"[Trending] Refresh failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.lease is not None:
+            await self.lease.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "runs": self._runs,
+            "skipped": self._skipped,  # Runs left to the worker holding the lease
+            "tracked": len(self._scored),
+            "failures": self._failures,
+            "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+            "last_scored": self._last_scored,
+            "last_pruned": self._last_pruned,
+            "last_duration_ms": round(self._last_duration_ms, 1),
+        }
+
+
+# --- Lifecycle ---
+
+trending_ranker: Optional[TrendingRanker] = None
+
+# Called from the application lifespan once the database is connected
+def start_trending_ranker(db: AsyncIOMotorDatabase) -> Optional[TrendingRanker]:
+    global trending_ranker
+    if trending_ranker is None and settings.TRENDING_JOB_ENABLED:
+        trending_ranker = TrendingRanker(
+            VideoRepository(db[CollectionName.VIDEOS.value]),
+            TrendingRepository(db[CollectionName.TRENDING.value]),
+            interval=settings.TRENDING_REFRESH_INTERVAL_SECONDS,
+            window_hours=settings.TRENDING_WINDOW_HOURS,
+            decay_hours=settings.TRENDING_DECAY_HOURS,
+            batch_size=settings.TRENDING_BATCH_SIZE,
+            lease=Lease(db[CollectionName.LEASES.value], "trending_ranker", ttl=settings.TRENDING_LEASE_SECONDS),
+        )
+        trending_ranker.start()
+    return trending_ranker
+
+def get_trending_ranker() -> Optional[TrendingRanker]:
+    """None on workers where the job is disabled."""
+    return trending_ranker
+
+async def stop_trending_ranker():
+    global trending_ranker
+    if trending_ranker is not None:
+        await trending_ranker.stop()
+        trending_ranker = None
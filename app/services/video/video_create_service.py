@@ -2,6 +2,12 @@
 
 from app.repositories.video.video_create_repository import VideoCreateRepository
 from app.services.s3 import S3Service
+from app.services.timeline import TimelineService
+from app.services.tag import TagService
+from app.services.video.mappers import video_to_response
+from app.repositories.user.user_profile import UserProfileRepository
+from app.core.visibility import stricter
+from app.core.tags import normalize_tags
 from app.models.vedio_model import VideoDraft, Video
 from app.schemas.video_schema import (
     VideoDraftCreateSchema,
@@ -12,12 +18,23 @@ from app.schemas.video_schema import (
 )
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
+from typing import Optional
 from app.core.enums import VideoStatus
 
 class VideoCreateService:
-    def __init__(self, repo: VideoCreateRepository, s3_service: S3Service):
+    def __init__(
+        self,
+        repo: VideoCreateRepository,
+        s3_service: S3Service,
+        timeline_service: Optional[TimelineService] = None,
+        profile_repository: Optional[UserProfileRepository] = None,
+        tag_service: Optional[TagService] = None,
+    ):
         self.repo = repo
         self.s3_service = s3_service
+        self.timeline_service = timeline_service
+        self.profile_repo = profile_repository
+        self.tag_service = tag_service
 
     # --- Create Draft ---
     async def create_draft(self, draft_data: VideoDraftCreateSchema, user_id: UUID) -> VideoDraftResponseSchema:
@@ -72,48 +89,49 @@ class VideoCreateService:
         )
 
     # --- Finalize Draft ---
-    async def finalize_draft(self, draft_id: UUID, user_id: UUID) -> tuple[VideoResponseSchema, str | None]:
-        draft = await self.repo.get_draft_by_id_and_user(draft_id, user_id)
-        if not draft:
-            raise ValueError("Draft not found or access denied")
+    async def finalize_draft(
+        self,
+        draft_id: UUID,
+        user_id: UUID,
+        idempotency_key: str | None = None,
+    ) -> tuple[VideoResponseSchema, str | None]:
+        video_id = uuid4()
+        # The account setting caps every video's visibility, e.g. a public video on a private account is private
+        account_privacy = await self.profile_repo.get_privacy_setting(user_id) if self.profile_repo else None
 
-        if draft.finalized:
-            raise ValueError("Draft already finalized")
+        def build_video(draft: VideoDraft) -> Video:
+            return Video(
+                video_id=video_id,
+                user_id=user_id,
+                draft_id=draft.draft_id,
+                s3_url=draft.edited_file_name,
+                thumbnail_url=None,  # optional enhancement
+                description=draft.description,
+                location=draft.location,
+                tags=normalize_tags(draft.tags),
+                privacy=draft.privacy,
+                visibility=stricter(draft.privacy, account_privacy),
+                upload_date=datetime.now(timezone.utc),
+                views=0,
+                is_featured=False,
+                status=VideoStatus.PUBLISHED,
+            )
 
-        # Create video from draft
-        video = Video(
-            video_id=uuid4(),
-            user_id=user_id,
-            s3_url=draft.edited_file_name,
-            thumbnail_url=None,  # optional enhancement
-            description=draft.description,
-            location=draft.location,
-            tags=draft.tags,
-            privacy=draft.privacy,
-            upload_date=datetime.now(timezone.utc),
-            views=0,
-            is_featured=False,
-            status=VideoStatus.PUBLISHED,
-        )
-        saved_video = await self.repo.create_video(video)
+        result = await self.repo.finalize_draft(draft_id, user_id, video_id, build_video, idempotency_key)
+        if result is None:
+            # A retry of a finalize that already succeeded gets the same video back
+            if idempotency_key:
+                existing = await self.repo.get_finalized_video(draft_id, user_id, idempotency_key)
+                if existing:
+                    return video_to_response(existing), None
+            raise ValueError("Draft not found, already finalized, or access denied")
 
-        # Mark draft finalized
-        await self.repo.mark_draft_finalized(draft_id)
-
-        response = VideoResponseSchema(
-            video_id=saved_video.video_id,
-            s3_url=saved_video.s3_url,
-            thumbnail_url=saved_video.thumbnail_url,
-            description=saved_video.description,
-            tags=saved_video.tags,
-            location=saved_video.location,
-            duration=saved_video.duration,
-            privacy=saved_video.privacy,
-            is_featured=saved_video.is_featured,
-            views=saved_video.views,
-            status=saved_video.status,
-            upload_date=saved_video.upload_date,
-        )
+        saved_video, draft = result
+        # Only a fresh publish fans out; idempotent replays above already did
+        if self.timeline_service:
+            self.timeline_service.schedule_fan_out(saved_video)
+        if self.tag_service and saved_video.tags:
+            self.tag_service.record_usage(saved_video.tags)
 
         # Return original file URL for cleanup (if any)
-        return response, draft.original_file_name
+        return video_to_response(saved_video), draft.original_file_name
@@ -0,0 +1,84 @@
+# app/services/video/video_explore_service.py
+
+from app.repositories.video.video_explore_repository import VideoExploreRepository
+from app.schemas.video_schema import VideoFeedPageSchema
+from app.services.video.mappers import video_to_response
+from app.core.pagination import encode_cursor, parse_cursor, clamp_page_size
+from app.core.enums import VideoStatus
+from app.core.visibility import Viewer, can_view, video_visibility_filter
+from app.core.logging import get_logger
+from typing import Dict, List, Optional, Set
+
+logger = get_logger()
+
+class VideoExploreService:
+    def __init__(self, repo: VideoExploreRepository):
+        self.repo = repo
+
+    # --- Feed ---
+    async def get_feed(self, cursor: Optional[str] = None, limit: int = 20, viewer: Optional[Viewer] = None) -> VideoFeedPageSchema:
+        limit = clamp_page_size(limit)
+        after = parse_cursor(cursor)
+        visibility = video_visibility_filter(viewer or Viewer.anonymous())
+
+        videos, has_more = await self.repo.get_feed_page(after=after, limit=limit, visibility=visibility)
+        next_cursor = None
+        if has_more and videos:
+            last = videos[-1]
+            next_cursor = encode_cursor({"d": last.upload_date.isoformat(), "id": str(last.video_id)})
+
+        logger.info(f"[Feed] Returned {len(videos)} videos (has_more={has_more})")
+        return VideoFeedPageSchema(
+            items=[video_to_response(video) for video in videos],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    # --- Media access ---
+    async def viewable_media_keys(self, candidates: Dict[str, List[str]], viewer: Viewer) -> Set[str]:
+        """
+        Which object keys belong to a video `viewer` may watch. `candidates` maps each key to the
+        values it may be stored under (the bare key or its object URL); keys no video owns are not viewable.
+        """
+        by_value = {value: key for key, values in candidates.items() for value in values}
+        allowed: Set[str] = set()
+        for video in await self.repo.get_by_media(list(by_value)):
+            # Unpublished videos are visible to their author only
+            if video.status != VideoStatus.PUBLISHED and video.user_id != viewer.user_id:
+                continue
+            if not can_view(viewer, video.user_id, video.visibility or video.privacy):
+                continue
+            for value in (video.s3_url, video.thumbnail_url):
+                if value in by_value:
+                    allowed.add(by_value[value])
+        return allowed
+
+    # --- Featured & trending ---
+    async def get_featured(self, cursor: Optional[str] = None, limit: int = 20, viewer: Optional[Viewer] = None) -> VideoFeedPageSchema:
+        limit = clamp_page_size(limit)
+        visibility = video_visibility_filter(viewer or Viewer.anonymous())
+        videos, has_more = await self.repo.get_featured_page(after=parse_cursor(cursor), limit=limit, visibility=visibility)
+        next_cursor = None
+        if has_more and videos:
+            last = videos[-1]
+            next_cursor = encode_cursor({"d": last.upload_date.isoformat(), "id": str(last.video_id)})
+        return VideoFeedPageSchema(
+            items=[video_to_response(video) for video in videos],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    async def get_trending(self, cursor: Optional[str] = None, limit: int = 20, viewer: Optional[Viewer] = None) -> VideoFeedPageSchema:
+        limit = clamp_page_size(limit)
+        visibility = video_visibility_filter(viewer or Viewer.anonymous())
+        rows, videos, has_more = await self.repo.get_trending_page(after=parse_cursor(cursor, "s", float), limit=limit, visibility=visibility)
+        # The cursor follows the ranking rows, so a video dropped during hydration does not stall paging
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_cursor({"s": last.score, "id": str(last.video_id)})
+        return VideoFeedPageSchema(
+            items=[video_to_response(videos[row.video_id]) for row in rows if row.video_id in videos],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
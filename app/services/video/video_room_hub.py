@@ -0,0 +1,158 @@
+# app/services/video/video_room_hub.py
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+from fastapi import WebSocket
+import orjson
+from app.core.config import settings
+from app.core.pubsub import PubSub
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEND_TIMEOUT_SECONDS = 2.0
+
+
+def _empty_delta() -> Dict[str, Any]:
+    return {"likes_delta": 0, "like_count": None, "comments_delta": 0, "comments": []}
+
+
+class VideoRoomHub:
+    """
+    Live like/comment updates for clients watching a video. Events are coalesced per video and
+    published once per `flush_interval` through the pub/sub backend; every worker holding sockets
+    in that room serializes the batch once and sends it to each of them. A burst of N likes inside
+    one interval therefore reaches each watcher as a single delta message.
+    """
+
+    def __init__(self, flush_interval: float, max_comments_per_batch: int, max_rooms_per_socket: int):
+        self.flush_interval = flush_interval
+        self.max_comments_per_batch = max_comments_per_batch
+        self.max_rooms_per_socket = max_rooms_per_socket
+        self._rooms: Dict[UUID, Set[WebSocket]] = defaultdict(set)
+        self._socket_rooms: Dict[WebSocket, Set[UUID]] = defaultdict(set)
+        self._pending: Dict[UUID, Dict[str, Any]] = {}
+        self._pubsub: Optional[PubSub] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def channel(video_id: UUID) -> str:
+        return f"video:{video_id}"
+
+    # --- Subscriptions ---
+
+    async def join(self, websocket: WebSocket, video_id: UUID) -> bool:
+        rooms = self._socket_rooms[websocket]
+        if video_id in rooms:
+            return True
+        if len(rooms) >= self.max_rooms_per_socket:
+            return False
+        first = not self._rooms.get(video_id)
+        self._rooms[video_id].add(websocket)
+        rooms.add(video_id)
+        if first and self._pubsub is not None:
+            await self._pubsub.subscribe(self.channel(video_id), self._deliver)
+        return True
+
+    async def leave(self, websocket: WebSocket, video_id: UUID) -> None:
+        self._socket_rooms.get(websocket, set()).discard(video_id)
+        sockets = self._rooms.get(video_id)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del self._rooms[video_id]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(self.channel(video_id), self._deliver)
+
+    async def leave_all(self, websocket: WebSocket) -> None:
+        for video_id in list(self._socket_rooms.pop(websocket, ())):
+            await self.leave(websocket, video_id)
+
+    # --- Events (called by the like/comment services) ---
+
+    def record_like(self, video_id: UUID, delta: int, like_count: int) -> None:
+        pending = self._pending.setdefault(video_id, _empty_delta())
+        pending["likes_delta"] += delta
+        pending["like_count"] = like_count
+
+    def record_comment(self, video_id: UUID, comment: Dict[str, Any], delta: int = 1) -> None:
+        pending = self._pending.setdefault(video_id, _empty_delta())
+        pending["comments_delta"] += delta
+        if comment and len(pending["comments"]) < self.max_comments_per_batch:
+            pending["comments"].append(comment)
+
+    # --- Flush / delivery ---
+
+    async def flush(self) -> None:
+        if not self._pending or self._pubsub is None:
+            return
+        batch, self._pending = self._pending, {}
+        for video_id, delta in batch.items():
+            message = {"type": "video_delta", "video_id": str(video_id), **delta}
+            try:
+                await self._pubsub.publish(self.channel(video_id), message)
+            except Exception as e:
+                logger.error(f"[Video Rooms] Publish failed for video_id={video_id}: {e}")
+
+    async def _deliver(self, channel: str, message: Dict[str, Any]) -> None:
+        sockets = self._rooms.get(UUID(message["video_id"]))
+        if not sockets:
+            return
+        payload = orjson.dumps(message, default=str).decode()
+        targets = list(sockets)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_text(payload), SEND_TIMEOUT_SECONDS) for ws in targets),
+            return_exceptions=True,
+        )
+        # Closed or stalled sockets are dropped rather than holding up the room
+        for ws, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                await self._drop(ws)
+
+    async def _drop(self, websocket: WebSocket) -> None:
+        await self.leave_all(websocket)
+        # Closing ends the endpoint's receive loop too; the socket may already be gone
+        try:
+            await asyncio.wait_for(websocket.close(), SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[Video Rooms] Flush failed: {e}")
+
+    def start(self, pubsub: PubSub) -> None:
+        self._pubsub = pubsub
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "rooms": len(self._rooms),
+            "sockets": len(self._socket_rooms),
+            "pending_videos": len(self._pending),
+        }
+
+
+video_room_hub = VideoRoomHub(
+    flush_interval=settings.REALTIME_FLUSH_INTERVAL_MS / 1000,
+    max_comments_per_batch=settings.REALTIME_MAX_COMMENTS_PER_BATCH,
+    max_rooms_per_socket=settings.REALTIME_MAX_ROOMS_PER_SOCKET,
+)
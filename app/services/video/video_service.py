@@ -4,6 +4,9 @@ from app.services.video.video_create_service import VideoCreateService
 from app.services.video.video_manage_service import VideoManageService
 from app.services.video.video_explore_service import VideoExploreService
 from app.services.video.video_interact_service import VideoInteractService
+from app.services.timeline import TimelineService
+from app.services.tag import TagService
+from app.repositories.user.user_profile import UserProfileRepository
 from uuid import uuid4, UUID
 from datetime import datetime
 from typing import Optional, Tuple, Dict
@@ -15,10 +18,17 @@ import logging
 logger = get_logger() 
 
 class VideoService(BaseService):
-    def __init__(self, video_repo: VideoRepositoryWrapper,  s3_service: S3Service):
+    def __init__(
+        self,
+        video_repo: VideoRepositoryWrapper,
+        s3_service: S3Service,
+        timeline_service: Optional[TimelineService] = None,
+        profile_repository: Optional[UserProfileRepository] = None,
+        tag_service: Optional[TagService] = None,
+    ):
         super().__init__(video_repo)
         self.video_repo = video_repo
-        self.create_service = VideoCreateService(video_repo.create_repo, s3_service)
+        self.create_service = VideoCreateService(video_repo.create_repo, s3_service, timeline_service, profile_repository, tag_service)
         self.manage_service = VideoManageService(video_repo.manage_repo)
         self.explore_service = VideoExploreService(video_repo.explore_repo)
         self.interact_service = VideoInteractService(video_repo.interact_repo)
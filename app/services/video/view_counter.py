@@ -0,0 +1,62 @@
+# app/services/video/view_counter.py
+
+from collections import Counter
+from typing import Optional
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from app.core.collections import CollectionName
+from app.core.config import settings
+from app.core.write_behind import WriteBehindCounter
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter(WriteBehindCounter):
+    """
+    Write-back aggregator for Video.views (see WriteBehindCounter): views are flushed as one
+    unordered bulk_write of $inc updates per interval.
+    """
+
+    name = "View Counter"
+
+    def __init__(self, collection: AsyncIOMotorCollection, flush_interval: float, max_pending: int):
+        super().__init__(flush_interval=flush_interval, max_pending=max_pending)
+        self.collection = collection
+
+    def record(self, video_id: UUID, count: int = 1) -> None:
+        self.add(video_id, count)
+
+    async def _write(self, batch: Counter) -> None:
+        operations = [UpdateOne({"video_id": video_id}, {"$inc": {"views": count}}) for video_id, count in batch.items()]
+        await self.collection.bulk_write(operations, ordered=False)
+
+
+# --- Lifecycle ---
+
+view_counter: Optional[ViewCounter] = None
+
+# Called from the application lifespan once the database is connected
+def start_view_counter(db: AsyncIOMotorDatabase) -> ViewCounter:
+    global view_counter
+    if view_counter is None:
+        view_counter = ViewCounter(
+            db[CollectionName.VIDEOS.value],
+            flush_interval=settings.VIEW_FLUSH_INTERVAL_SECONDS,
+            max_pending=settings.VIEW_FLUSH_MAX_PENDING,
+        )
+        view_counter.start()
+    return view_counter
+
+def get_view_counter() -> ViewCounter:
+    if view_counter is None:
+        raise RuntimeError("View counter not started. Call start_view_counter() first.")
+    return view_counter
+
+# Flushes whatever is still buffered; must run before the Mongo client closes
+async def stop_view_counter():
+    global view_counter
+    if view_counter is not None:
+        await view_counter.stop()
+        view_counter = None
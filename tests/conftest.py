@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The app is imported as the `app` package; its model modules import their base module top-level
+sys.path[:0] = [str(ROOT), str(ROOT / "app" / "models")]
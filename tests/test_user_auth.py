@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.auth.jwt import get_logged_in_user
+from app.models.user_models import UserAuth
+from app.repositories.user.user_auth import UserAuthRepository
+from app.services.user.user_auth import UserAuthService
+
+
+class InMemoryCollection:
+    """Exact-equality matching, like MongoDB with uuidRepresentation="standard": a str never matches a UUID."""
+
+    def __init__(self):
+        self.docs = []
+
+    def _matches(self, doc, query):
+        return all(doc.get(field) == value for field, value in query.items())
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    async def find_one(self, query, projection=None):
+        return next((dict(doc) for doc in self.docs if self._matches(doc, query)), None)
+
+    async def delete_one(self, query):
+        for index, doc in enumerate(self.docs):
+            if self._matches(doc, query):
+                del self.docs[index]
+                return SimpleNamespace(deleted_count=1)
+        return SimpleNamespace(deleted_count=0)
+
+
+@pytest.fixture
+def collection():
+    return InMemoryCollection()
+
+
+@pytest.fixture
+def service(collection):
+    return UserAuthService(UserAuthRepository(collection))
+
+
+async def _register(service):
+    user = UserAuth(email="ada@example.com", username="ada", hashed_password="hash")
+    await service.auth_repo.register_user(user)
+    access_token, _ = await service.generate_token(user.user_id, user.email, user.username)
+    return user, access_token
+
+
+def test_delete_user_removes_the_stored_document(service, collection):
+    async def scenario():
+        user, _ = await _register(service)
+        assert await service.delete_user(user.user_id) is True
+        assert collection.docs == []
+
+    asyncio.run(scenario())
+
+
+def test_deleted_user_token_is_rejected(service):
+    async def scenario():
+        user, access_token = await _register(service)
+        assert (await get_logged_in_user(token=access_token, auth_service=service)).user_id == user.user_id
+
+        await service.delete_user(user.user_id)
+
+        with pytest.raises(HTTPException) as rejected:
+            await get_logged_in_user(token=access_token, auth_service=service)
+        assert rejected.value.status_code == 401
+
+    asyncio.run(scenario())